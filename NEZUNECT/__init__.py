@@ -1,62 +1,195 @@
-from typing import Any, Dict, List, Optional
-
-from requests import Session
-
-from .api.bookmarks import BookmarksAPI
-from .api.messages import MessagesAPI
-from .api.notify import NotifyAPI
-from .api.posts import PostsAPI
-from .api.profile import ProfileAPI
-from .api.sessions import SessionsAPI
-from .api.settings import SettingsAPI
-from .api.verify import VerifyAPI
-from .utils.cookies import load_cookies
+import threading
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
+
+from .config import Config
+from .utils.cookies import CookieStore
+
+if TYPE_CHECKING:
+    from requests import Session
+
+    from .utils.cache import ResponseCache
+    from .utils.codec import JSONCodec
+    from .utils.hooks import Hooks
+    from .utils.identity import ProfileIdentityMap
+    from .utils.metrics import MetricsRegistry
+    from .utils.ratelimit import RateLimiter
+    from .utils.retry import RetryPolicy
+    from .utils.singleflight import SingleFlight
+    from .utils.tracing import Tracer
+    from .utils.transport import TransportConfig
+
+# サブモジュールは初回アクセス時に読み込む（起動時間短縮のため）
+_LAZY_EXPORTS = {
+    "AsyncNEZUNECT": ".aio",
+    "BookmarksAPI": ".api.bookmarks",
+    "MessageSync": ".api.message_sync",
+    "MessagesAPI": ".api.messages",
+    "NEZUNECTPool": ".pool",
+    "NotificationWatcher": ".api.watcher",
+    "NotifyAPI": ".api.notify",
+    "PostsAPI": ".api.posts",
+    "ProfileAPI": ".api.profile",
+    "SessionsAPI": ".api.sessions",
+    "SettingsAPI": ".api.settings",
+    "ShardedRunner": ".sharding",
+    "VerifyAPI": ".api.verify",
+}
+
+
+def _lazy_import(name: str) -> Any:
+    value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        return _lazy_import(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class NEZUNECT:
-    def __init__(self, cookie: str, debug: bool = False):
+    # サブAPIは初回アクセス時に生成し、以降はインスタンス属性としてキャッシュする
+    _APIS = {
+        "notify_api": "NotifyAPI",
+        "bookmarks_api": "BookmarksAPI",
+        "posts_api": "PostsAPI",
+        "profile_api": "ProfileAPI",
+        "sessions_api": "SessionsAPI",
+        "settings_api": "SettingsAPI",
+        "verify_api": "VerifyAPI",
+        "messages_api": "MessagesAPI",
+    }
+
+    def __init__(
+        self,
+        cookie: str,
+        debug: bool = False,
+        retry_policy: Optional["RetryPolicy"] = None,
+        rate_limiter: Optional["RateLimiter"] = None,
+        transport: Optional["TransportConfig"] = None,
+        cache: Optional["ResponseCache"] = None,
+        single_flight: Optional["SingleFlight"] = None,
+        codec: Optional["JSONCodec"] = None,
+        identity_map: Optional["ProfileIdentityMap"] = None,
+        metrics: Optional["MetricsRegistry"] = None,
+        session: Optional["Session"] = None,
+        hooks: Optional["Hooks"] = None,
+        tracer: Optional["Tracer"] = None,
+    ):
+        # 設定クラスは使うときに読み込む（import NEZUNECT を軽くするため）
+        from .utils.hooks import Hooks
+        from .utils.retry import RetryPolicy
+        from .utils.transport import TransportConfig
+
         self.cookie = cookie
         self.debug = debug
-        self.session = Session()
-        self._initialize_apis()
-
-    def _initialize_apis(self):
-        """Initialize all API instances with shared session"""
-        load_cookies(self.cookie)
-        self.notify_api = NotifyAPI(session=self.session)
-        self.bookmarks_api = BookmarksAPI(session=self.session)
-        self.posts_api = PostsAPI(session=self.session)
-        self.profile_api = ProfileAPI(session=self.session)
-        self.sessions_api = SessionsAPI(session=self.session)
-        self.settings_api = SettingsAPI(session=self.session)
-        self.verify_api = VerifyAPI(session=self.session)
-        self.messages_api = MessagesAPI(session=self.session)
+        self.transport = transport or TransportConfig()
+        self.session = session or self.transport.create_session()
+        self.cookie_store = CookieStore.get(cookie)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.single_flight = single_flight
+        self.codec = codec
+        self.identity_map = identity_map
+        # debug を有効にすると、metrics を省略してもエンドポイントごとに計測する
+        if metrics is None and debug:
+            from .utils.metrics import MetricsRegistry
+
+            metrics = MetricsRegistry()
+        self.metrics = metrics
+        self.hooks = hooks if hooks is not None else Hooks()
+        self.tracer = tracer
+        self._api_lock = threading.Lock()
+
+    def _api_options(self) -> Dict[str, Any]:
+        """サブAPIに共有させる設定"""
+        return {
+            "session": self.session,
+            "cookie_store": self.cookie_store,
+            "retry_policy": self.retry_policy,
+            "rate_limiter": self.rate_limiter,
+            "transport": self.transport,
+            "cache": self.cache,
+            "single_flight": self.single_flight,
+            "codec": self.codec,
+            "identity_map": self.identity_map,
+            "metrics": self.metrics,
+            "hooks": self.hooks,
+            "tracer": self.tracer,
+        }
+
+    def __getattr__(self, name: str) -> Any:
+        """サブAPIを初回アクセス時に生成する"""
+        if name not in self._APIS:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        with self._api_lock:
+            if name not in self.__dict__:
+                api_class = _lazy_import(self._APIS[name])
+                self.__dict__[name] = api_class(**self._api_options())
+        return self.__dict__[name]
+
+    def initialize(self) -> int:
+        """
+        transport.warmup_connections 本のキープアライブ接続を事前に開く
+
+        Returns:
+            int: 確立できた接続数
+        """
+        return self.transport.warm_up(self.session, f"{Config.BASE_URL}/")
 
     def get_profile(self, username: str) -> Dict[str, Any]:
         return self.profile_api.get_profile(username)
 
+    def get_profiles(self, usernames: Iterable[str], **kwargs: Any) -> Iterator[Any]:
+        return self.profile_api.get_profiles(usernames, **kwargs)
+
     def create_post(
-        self, text: str, assets: Optional[list] = None, scope: str = "public"
+        self,
+        text: str,
+        assets: Optional[list] = None,
+        scope: str = "public",
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         if assets is None:
             assets = []
-        return self.posts_api.create_post(text, assets, scope)
+        return self.posts_api.create_post(
+            text, assets=assets, scope=scope, idempotency_key=idempotency_key
+        )
 
-    def get_notifications(self, skip: int = 0) -> Dict[str, Any]:
-        return self.notify_api.get_notifications(skip)
+    def get_notifications(self, skip: int = 0, lazy: bool = False) -> Dict[str, Any]:
+        return self.notify_api.get_notifications(skip, lazy)
 
-    def get_bookmarks(self) -> Dict[str, Any]:
-        return self.bookmarks_api.get_bookmarks()
+    def iter_notifications(self, **kwargs: Any) -> Iterator[Any]:
+        return self.notify_api.iter_notifications(**kwargs)
+
+    def watch_notifications(self, **kwargs: Any) -> Any:
+        return _lazy_import("NotificationWatcher")(self.notify_api, **kwargs)
+
+    def get_bookmarks(self, lazy: bool = False) -> Dict[str, Any]:
+        return self.bookmarks_api.get_bookmarks(lazy)
 
     def add_bookmark(self, folder_id: str, post_id: str) -> Dict[str, Any]:
         return self.bookmarks_api.add_bookmark(folder_id, post_id)
 
+    def add_bookmarks(
+        self, folder_id: str, post_ids: Iterable[str], **kwargs: Any
+    ) -> Any:
+        return self.bookmarks_api.add_bookmarks(folder_id, post_ids, **kwargs)
+
     def create_bookmark_folder(self, name: str) -> Dict[str, Any]:
         return self.bookmarks_api.create_bookmark_folder(name)
 
     def like_post(self, post_id: str) -> Dict[str, Any]:
         return self.posts_api.like_post(post_id)
 
+    def like_posts(self, post_ids: Iterable[str], **kwargs: Any) -> Any:
+        return self.posts_api.like_posts(post_ids, **kwargs)
+
     def post_quote(
         self,
         text: str,
@@ -85,31 +218,46 @@ class NEZUNECT:
     def post_repost(self, post_id: str) -> Dict[str, Any]:
         return self.posts_api.post_repost(post_id)
 
+    def repost_many(self, post_ids: Iterable[str], **kwargs: Any) -> Any:
+        return self.posts_api.repost_many(post_ids, **kwargs)
+
     def search_post(
         self, query: str, skip: int = 0, hours: int = 168
     ) -> Dict[str, Any]:
         return self.posts_api.search_post(query, skip, hours)
 
+    def iter_search(self, query: str, **kwargs: Any) -> Iterator[Any]:
+        return self.posts_api.iter_search(query, **kwargs)
+
+    def update_profile(self, **kwargs: Any) -> Dict[str, Any]:
+        return self.profile_api.update_profile(**kwargs)
+
     def change_profile_name(self, nickname: str) -> Dict[str, Any]:
-        return self.profile_api.change_profile_name(nickname)
+        return self.profile_api.update_profile(nickname=nickname)
 
     def change_profile_bio(self, bio: str) -> Dict[str, Any]:
-        return self.profile_api.change_profile_bio(bio)
+        return self.profile_api.update_profile(bio=bio)
 
     def change_profile_email(self, email: str) -> Dict[str, Any]:
-        return self.profile_api.change_profile_email(email)
+        return self.profile_api.update_profile(email=email)
 
     def change_profile_id(self, new_username: str) -> Dict[str, Any]:
-        return self.profile_api.change_profile_id(new_username)
+        return self.profile_api.update_profile(username=new_username)
 
     def change_profile_name_bio(self, nickname: str, bio: str) -> Dict[str, Any]:
-        return self.profile_api.change_profile_name_bio(nickname, bio)
+        return self.profile_api.update_profile(nickname=nickname, bio=bio)
+
+    def pin_post(self, post_id: str) -> Dict[str, Any]:
+        return self.profile_api.pin_post(post_id)
 
     def post_profile_pin(self, post_id: str) -> Dict[str, Any]:
-        return self.profile_api.post_profile_pin(post_id)
+        return self.profile_api.pin_post(post_id)
+
+    def get_sessions(self, skip: int = 0, lazy: bool = False) -> Dict[str, Any]:
+        return self.sessions_api.get_sessions(skip, lazy)
 
-    def get_sessions(self, skip: int = 0) -> Dict[str, Any]:
-        return self.sessions_api.get_sessions(skip)
+    def iter_sessions(self, **kwargs: Any) -> Iterator[Any]:
+        return self.sessions_api.iter_sessions(**kwargs)
 
     def change_dark_mode(self, dark_mode: bool) -> Dict[str, Any]:
         return self.settings_api.change_dark_mode(dark_mode)
@@ -117,18 +265,28 @@ class NEZUNECT:
     def change_language(self, language: str) -> Dict[str, Any]:
         return self.settings_api.change_language(language)
 
-    def change_custom_color(self, theme: str) -> Dict[str, Any]:
-        return self.settings_api.change_custom_color(theme)
+    def change_custom_color(self, color_type: str, color: str) -> Dict[str, Any]:
+        return self.settings_api.change_custom_color(color_type, color)
 
     def change_notification_sound(self, notification_sound: bool) -> Dict[str, Any]:
         return self.settings_api.change_notification_sound(notification_sound)
 
+    def change_notification_settings(
+        self, notification_sound: bool, messages_following_only: bool
+    ) -> Dict[str, Any]:
+        return self.settings_api.change_notification_settings(
+            notification_sound, messages_following_only
+        )
+
     def verify_email(self, email: str, code: str) -> Dict[str, Any]:
         return self.verify_api.verify_email(email, code)
 
     def get_top_posts(self, skip: int = 0) -> Dict[str, Any]:
         return self.posts_api.get_top_posts(skip)
 
+    def iter_top_posts(self, **kwargs: Any) -> Iterator[Any]:
+        return self.posts_api.iter_top_posts(**kwargs)
+
     def change_messages_following_only(self, following_only: bool) -> Dict[str, Any]:
         return self.settings_api.change_messages_following_only(following_only)
 
@@ -137,15 +295,22 @@ class NEZUNECT:
     ) -> Dict[str, Any]:
         return self.messages_api.send_message(receiver_id, text, assets)
 
-    def get_messages(self, receiver_id: str, skip: int = 0) -> Dict[str, Any]:
-        return self.messages_api.get_messages(receiver_id, skip)
+    def get_messages(
+        self, receiver_id: str, skip: int = 0, lazy: bool = False
+    ) -> Dict[str, Any]:
+        return self.messages_api.get_messages(receiver_id, skip, lazy)
+
+    def iter_messages(self, receiver_id: str, **kwargs: Any) -> Iterator[Any]:
+        return self.messages_api.iter_messages(receiver_id, **kwargs)
+
+    def message_sync(self, path: str) -> Any:
+        return _lazy_import("MessageSync")(self.messages_api, path)
 
     def close(self):
         if hasattr(self, "session") and self.session:
             self.session.close()
 
     def __enter__(self):
-        self._initialize_apis()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
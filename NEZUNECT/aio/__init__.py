@@ -0,0 +1,295 @@
+import threading
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from ..config import Config
+from ..utils.cache import ResponseCache
+from ..utils.codec import JSONCodec
+from ..utils.cookies import CookieStore
+from ..utils.hooks import Hooks
+from ..utils.identity import ProfileIdentityMap
+from ..utils.metrics import MetricsRegistry
+from ..utils.ratelimit import RateLimiter
+from ..utils.retry import RetryPolicy
+from ..utils.singleflight import SingleFlight
+from ..utils.tracing import Tracer
+from ..utils.transport import TransportConfig
+from .base import AsyncBaseAPI, _require_httpx
+
+if TYPE_CHECKING:
+    import httpx
+
+_LAZY_EXPORTS = {
+    "AsyncBookmarksAPI": ".bookmarks",
+    "AsyncMessagesAPI": ".messages",
+    "AsyncNotifyAPI": ".notify",
+    "AsyncPostsAPI": ".posts",
+    "AsyncProfileAPI": ".profile",
+    "AsyncSessionsAPI": ".sessions",
+    "AsyncSettingsAPI": ".settings",
+    "AsyncVerifyAPI": ".verify",
+}
+
+
+def _lazy_import(name: str) -> Any:
+    value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        return _lazy_import(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class AsyncNEZUNECT:
+    """httpx.AsyncClient 上で動作する NEZUNECT の非同期版"""
+
+    _APIS = {
+        "notify_api": "AsyncNotifyAPI",
+        "bookmarks_api": "AsyncBookmarksAPI",
+        "posts_api": "AsyncPostsAPI",
+        "profile_api": "AsyncProfileAPI",
+        "sessions_api": "AsyncSessionsAPI",
+        "settings_api": "AsyncSettingsAPI",
+        "verify_api": "AsyncVerifyAPI",
+        "messages_api": "AsyncMessagesAPI",
+    }
+
+    def __init__(
+        self,
+        cookie: str,
+        debug: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[TransportConfig] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        codec: Optional[JSONCodec] = None,
+        identity_map: Optional[ProfileIdentityMap] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        session: Optional["httpx.AsyncClient"] = None,
+        hooks: Optional[Hooks] = None,
+        tracer: Optional[Tracer] = None,
+    ):
+        _require_httpx()
+        self.cookie = cookie
+        self.debug = debug
+        self.transport = transport or TransportConfig()
+        self.session = session or self.transport.create_async_client()
+        self.cookie_store = CookieStore.get(cookie)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.single_flight = single_flight
+        self.codec = codec
+        self.identity_map = identity_map
+        # debug を有効にすると、metrics を省略してもエンドポイントごとに計測する
+        self.metrics = metrics or (MetricsRegistry() if debug else None)
+        self.hooks = hooks if hooks is not None else Hooks()
+        self.tracer = tracer
+        self._api_lock = threading.Lock()
+
+    def _api_options(self) -> Dict[str, Any]:
+        """サブAPIに共有させる設定"""
+        return {
+            "session": self.session,
+            "cookie_store": self.cookie_store,
+            "retry_policy": self.retry_policy,
+            "rate_limiter": self.rate_limiter,
+            "transport": self.transport,
+            "cache": self.cache,
+            "single_flight": self.single_flight,
+            "codec": self.codec,
+            "identity_map": self.identity_map,
+            "metrics": self.metrics,
+            "hooks": self.hooks,
+            "tracer": self.tracer,
+        }
+
+    def __getattr__(self, name: str) -> Any:
+        """サブAPIを初回アクセス時に生成する"""
+        if name not in self._APIS:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        with self._api_lock:
+            if name not in self.__dict__:
+                api_class = _lazy_import(self._APIS[name])
+                self.__dict__[name] = api_class(**self._api_options())
+        return self.__dict__[name]
+
+    async def initialize(self) -> int:
+        """
+        transport.warmup_connections 本のキープアライブ接続を事前に開く
+
+        Returns:
+            int: 確立できた接続数
+        """
+        return await self.transport.warm_up_async(self.session, f"{Config.BASE_URL}/")
+
+    async def get_profile(self, username: str) -> Dict[str, Any]:
+        return await self.profile_api.get_profile(username)
+
+    def get_profiles(
+        self, usernames: Iterable[str], **kwargs: Any
+    ) -> AsyncIterator[Any]:
+        return self.profile_api.get_profiles(usernames, **kwargs)
+
+    async def create_post(
+        self,
+        text: str,
+        assets: Optional[list] = None,
+        scope: str = "public",
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        if assets is None:
+            assets = []
+        return await self.posts_api.create_post(
+            text, assets=assets, scope=scope, idempotency_key=idempotency_key
+        )
+
+    async def like_post(self, post_id: str) -> Dict[str, Any]:
+        return await self.posts_api.like_post(post_id)
+
+    async def like_posts(self, post_ids: Iterable[str], **kwargs: Any) -> Any:
+        return await self.posts_api.like_posts(post_ids, **kwargs)
+
+    async def post_repost(self, post_id: str) -> Dict[str, Any]:
+        return await self.posts_api.post_repost(post_id)
+
+    async def repost_many(self, post_ids: Iterable[str], **kwargs: Any) -> Any:
+        return await self.posts_api.repost_many(post_ids, **kwargs)
+
+    async def search_post(
+        self, query: str, skip: int = 0, hours: int = 168
+    ) -> Dict[str, Any]:
+        return await self.posts_api.search_post(query, skip, hours)
+
+    def iter_search(self, query: str, **kwargs: Any) -> AsyncIterator[Any]:
+        return self.posts_api.iter_search(query, **kwargs)
+
+    async def get_top_posts(self, skip: int = 0) -> Dict[str, Any]:
+        return await self.posts_api.get_top_posts(skip)
+
+    def iter_top_posts(self, **kwargs: Any) -> AsyncIterator[Any]:
+        return self.posts_api.iter_top_posts(**kwargs)
+
+    async def get_notifications(
+        self, skip: int = 0, lazy: bool = False
+    ) -> Dict[str, Any]:
+        return await self.notify_api.get_notifications(skip, lazy)
+
+    def iter_notifications(self, **kwargs: Any) -> AsyncIterator[Any]:
+        return self.notify_api.iter_notifications(**kwargs)
+
+    async def get_bookmarks(self, lazy: bool = False) -> Dict[str, Any]:
+        return await self.bookmarks_api.get_bookmarks(lazy)
+
+    async def add_bookmark(self, folder_id: str, post_id: str) -> Dict[str, Any]:
+        return await self.bookmarks_api.add_bookmark(folder_id, post_id)
+
+    async def add_bookmarks(
+        self, folder_id: str, post_ids: Iterable[str], **kwargs: Any
+    ) -> Any:
+        return await self.bookmarks_api.add_bookmarks(folder_id, post_ids, **kwargs)
+
+    async def create_bookmark_folder(self, name: str) -> Dict[str, Any]:
+        return await self.bookmarks_api.create_bookmark_folder(name)
+
+    async def update_profile(self, **kwargs: Any) -> Dict[str, Any]:
+        return await self.profile_api.update_profile(**kwargs)
+
+    async def change_profile_name(self, nickname: str) -> Dict[str, Any]:
+        return await self.profile_api.update_profile(nickname=nickname)
+
+    async def change_profile_bio(self, bio: str) -> Dict[str, Any]:
+        return await self.profile_api.update_profile(bio=bio)
+
+    async def change_profile_email(self, email: str) -> Dict[str, Any]:
+        return await self.profile_api.update_profile(email=email)
+
+    async def change_profile_id(self, new_username: str) -> Dict[str, Any]:
+        return await self.profile_api.update_profile(username=new_username)
+
+    async def change_profile_name_bio(self, nickname: str, bio: str) -> Dict[str, Any]:
+        return await self.profile_api.update_profile(nickname=nickname, bio=bio)
+
+    async def pin_post(self, post_id: str) -> Dict[str, Any]:
+        return await self.profile_api.pin_post(post_id)
+
+    async def post_profile_pin(self, post_id: str) -> Dict[str, Any]:
+        return await self.profile_api.pin_post(post_id)
+
+    async def get_sessions(self, skip: int = 0, lazy: bool = False) -> Dict[str, Any]:
+        return await self.sessions_api.get_sessions(skip, lazy)
+
+    def iter_sessions(self, **kwargs: Any) -> AsyncIterator[Any]:
+        return self.sessions_api.iter_sessions(**kwargs)
+
+    async def change_dark_mode(self, dark_mode: bool) -> Dict[str, Any]:
+        return await self.settings_api.change_dark_mode(dark_mode)
+
+    async def change_language(self, language: str) -> Dict[str, Any]:
+        return await self.settings_api.change_language(language)
+
+    async def change_custom_color(self, color_type: str, color: str) -> Dict[str, Any]:
+        return await self.settings_api.change_custom_color(color_type, color)
+
+    async def change_notification_sound(
+        self, notification_sound: bool
+    ) -> Dict[str, Any]:
+        return await self.settings_api.change_notification_sound(notification_sound)
+
+    async def change_messages_following_only(
+        self, following_only: bool
+    ) -> Dict[str, Any]:
+        return await self.settings_api.change_messages_following_only(following_only)
+
+    async def change_notification_settings(
+        self, notification_sound: bool, messages_following_only: bool
+    ) -> Dict[str, Any]:
+        return await self.settings_api.change_notification_settings(
+            notification_sound, messages_following_only
+        )
+
+    async def verify_email(self, email: str, code: str) -> Dict[str, Any]:
+        return await self.verify_api.verify_email(email, code)
+
+    async def send_message(
+        self, receiver_id: str, text: str, assets: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        return await self.messages_api.send_message(receiver_id, text, assets)
+
+    async def get_messages(
+        self, receiver_id: str, skip: int = 0, lazy: bool = False
+    ) -> Dict[str, Any]:
+        return await self.messages_api.get_messages(receiver_id, skip, lazy)
+
+    def iter_messages(self, receiver_id: str, **kwargs: Any) -> AsyncIterator[Any]:
+        return self.messages_api.iter_messages(receiver_id, **kwargs)
+
+    async def close(self):
+        if hasattr(self, "session") and self.session:
+            await self.session.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+__all__ = [
+    "AsyncNEZUNECT",
+    "AsyncBaseAPI",
+    "AsyncBookmarksAPI",
+    "AsyncMessagesAPI",
+    "AsyncNotifyAPI",
+    "AsyncPostsAPI",
+    "AsyncProfileAPI",
+    "AsyncSessionsAPI",
+    "AsyncSettingsAPI",
+    "AsyncVerifyAPI",
+]
@@ -0,0 +1,333 @@
+import asyncio
+import inspect
+import time
+from abc import ABC
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from ..api.common import BaseAPIMixin
+from ..utils.cache import ResponseCache
+from ..utils.codec import JSONCodec
+from ..utils.cookies import CookieStore
+from ..utils.exceptions import APIError
+from ..utils.hooks import GLOBAL_HOOKS, Hooks, RequestContext, resolve_hooks
+from ..utils.identity import ProfileIdentityMap
+from ..utils.metrics import MetricsRegistry
+from ..utils.ratelimit import RateLimiter
+from ..utils.retry import RetryPolicy
+from ..utils.singleflight import SingleFlight
+from ..utils.tracing import Tracer
+from ..utils.transport import TransportConfig
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+
+def _require_httpx() -> None:
+    if httpx is None:
+        raise ImportError(
+            "非同期クライアントには httpx が必要です: pip install nezunect[async]"
+        )
+
+
+async def _call_hook(
+    hook: Callable[[RequestContext], Any], context: RequestContext
+) -> Any:
+    """フックを呼び、コルーチン関数なら結果を待つ"""
+    value = hook(context)
+    if inspect.isawaitable(value):
+        value = await value
+    return value
+
+
+class AsyncBaseAPI(BaseAPIMixin, ABC):
+    """非同期APIリクエストの基底クラス"""
+
+    _BODY_KWARG = "content"
+
+    def __init__(
+        self,
+        session: Optional["httpx.AsyncClient"] = None,
+        cookie_store: Optional[CookieStore] = None,
+        *,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[TransportConfig] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        codec: Optional[JSONCodec] = None,
+        identity_map: Optional[ProfileIdentityMap] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        hooks: Optional[Hooks] = None,
+        tracer: Optional[Tracer] = None,
+    ) -> None:
+        """
+        AsyncBaseAPIクラスの初期化
+
+        Args:
+            session (Optional[httpx.AsyncClient]): 非同期HTTPクライアント。デフォルトはNone。
+            cookie_store (Optional[CookieStore]): 共有クッキーストア。
+                デフォルトは ./cookie.json の共有ストア。
+            retry_policy (Optional[RetryPolicy]): 再試行ポリシー。
+                デフォルトは RetryPolicy()。
+            rate_limiter (Optional[RateLimiter]): クライアント側のレート制限。
+                デフォルトはNone（制限なし）。
+            transport (Optional[TransportConfig]): 接続プールとタイムアウトの設定。
+                session を省略した場合のセッション生成にも使う。
+            cache (Optional[ResponseCache]): 読み取り系レスポンスのキャッシュ。
+                デフォルトはNone（キャッシュしない）。
+            single_flight (Optional[SingleFlight]): 同時に実行中の同一GETを
+                1つのリクエストにまとめる。デフォルトはNone（まとめない）。
+            codec (Optional[JSONCodec]): リクエスト/レスポンス本文のJSONコーデック。
+                デフォルトは get_codec()（orjson / ujson があればそれを使う）。
+            identity_map (Optional[ProfileIdentityMap]): 埋め込みプロフィールを
+                クライアント全体で共有する識別マップ。デフォルトはNone（ページ単位で共有）。
+            metrics (Optional[MetricsRegistry]): エンドポイントごとの計測値の記録先。
+                デフォルトはNone（計測しない）。
+            hooks (Optional[Hooks]): このクライアントのリクエストフック。
+                GLOBAL_HOOKS のフックはこれより先に呼ばれる。
+            tracer (Optional[Tracer]): 公開メソッドとHTTPリクエストのスパンの記録先。
+                デフォルトはNone（記録しない）。
+        """
+        _require_httpx()
+        self.session: httpx.AsyncClient
+        transport = transport or TransportConfig()
+        self._setup(
+            session or transport.create_async_client(),
+            transport,
+            cookie_store,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            single_flight=single_flight,
+            codec=codec,
+            identity_map=identity_map,
+            metrics=metrics,
+            hooks=hooks,
+            tracer=tracer,
+        )
+        self._timeout: httpx.Timeout = transport.async_timeout()
+
+    def _default_timeout(self) -> "httpx.Timeout":
+        return self._timeout
+
+    def _was_sent(self, error: Exception) -> bool:
+        return not isinstance(
+            error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+        )
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        headers: Optional[Mapping[str, str]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """
+        APIリクエストを非同期に実行する共通メソッド
+
+        single_flight が設定されていれば実行中の同一GETに合流し、
+        cache が設定されていれば読み取り系のレスポンスをキャッシュから返し、
+        rate_limiter が設定されていれば送信前にトークンを待ち、
+        失敗時は retry_policy に従って再試行する。
+        hooks か GLOBAL_HOOKS にフックが登録されていれば、その前後でフックを呼ぶ。
+
+        Args:
+            method (str): HTTPメソッド
+            endpoint (str): APIエンドポイント
+            headers (Optional[Mapping[str, str]], optional): ページごとの差分ヘッダー
+            data (Optional[Dict[str, Any]], optional): リクエストデータ
+            params (Optional[Dict[str, Any]], optional): クエリパラメータ
+            idempotency_key (Optional[str], optional): 冪等キー。指定すると
+                Idempotency-Key ヘッダーを付け、書き込みでも再試行する
+            **kwargs: 追加のリクエストオプション
+
+        Returns:
+            Dict[str, Any]: APIレスポンス
+
+        Raises:
+            APIError: APIリクエストが失敗した場合
+        """
+        method, template, idempotent, headers = self._prepare(
+            method, endpoint, headers, idempotency_key, kwargs
+        )
+        if self.hooks.empty and GLOBAL_HOOKS.empty:
+            return await self._dispatch(
+                method, endpoint, template, idempotent, headers, data, params, kwargs
+            )
+        return await self._dispatch_with_hooks(
+            method, endpoint, template, idempotent, headers, data, params, kwargs
+        )
+
+    async def _dispatch(
+        self,
+        method: str,
+        endpoint: str,
+        template: str,
+        idempotent: bool,
+        headers: Mapping[str, str],
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """single_flight が設定されていれば実行中の同一GETに合流し、なければ _fetch() を呼ぶ"""
+        if method == "GET" and self.single_flight is not None:
+            return await self.single_flight.do_async(
+                self._flight_key(endpoint, params),
+                lambda: self._fetch(
+                    method,
+                    endpoint,
+                    template,
+                    idempotent,
+                    headers,
+                    data,
+                    params,
+                    kwargs,
+                ),
+            )
+        return await self._fetch(
+            method, endpoint, template, idempotent, headers, data, params, kwargs
+        )
+
+    async def _dispatch_with_hooks(
+        self,
+        method: str,
+        endpoint: str,
+        template: str,
+        idempotent: bool,
+        headers: Mapping[str, str],
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """before_request / after_response / on_error のフックを挟んで _dispatch() を呼ぶ"""
+        chain = resolve_hooks(self.hooks)
+        if chain is None:
+            return await self._dispatch(
+                method, endpoint, template, idempotent, headers, data, params, kwargs
+            )
+        context = self._hook_context(method, endpoint, template, headers, data, params)
+        for hook in chain.before_request:
+            value = await _call_hook(hook, context)
+            if value is not None:
+                context.short_circuited = True
+                context.response = value
+                break
+        else:
+            try:
+                result = await self._dispatch(
+                    method,
+                    endpoint,
+                    template,
+                    idempotent,
+                    context.headers,
+                    context.data,
+                    context.params,
+                    kwargs,
+                )
+            except APIError as error:
+                self._hook_failed(context, error)
+                for hook in chain.on_error:
+                    value = await _call_hook(hook, context)
+                    if value is not None:
+                        return {"success": True, "data": value}
+                raise
+            context.response = result.get("data")
+
+        context.elapsed = time.perf_counter() - context.started
+        for hook in chain.after_response:
+            value = await _call_hook(hook, context)
+            if value is not None:
+                context.response = value
+        return {"success": True, "data": context.response}
+
+    async def _fetch(
+        self,
+        method: str,
+        endpoint: str,
+        template: str,
+        idempotent: bool,
+        headers: Mapping[str, str],
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """キャッシュを確認し、必要ならリクエストを送信して結果をデコードする"""
+        cache_key, cached, headers = self._cache_lookup(
+            method, endpoint, template, headers, params
+        )
+        if cached is not None and cached.fresh:
+            return {"success": True, "data": cached.data}
+        body, headers = self._encode_body(data, headers)
+
+        response = await self._send_with_retry(
+            method,
+            endpoint,
+            template,
+            idempotent,
+            headers=headers,
+            content=body,
+            params=params,
+            **kwargs,
+        )
+        return self._complete(method, endpoint, template, response, cache_key, cached)
+
+    async def _send_with_retry(
+        self, method: str, endpoint: str, template: str, idempotent: bool, **kwargs: Any
+    ) -> "httpx.Response":
+        """
+        rate_limiter と retry_policy に従ってリクエストを送信する
+
+        Returns:
+            httpx.Response: 成功（2xx/3xx）したレスポンス
+
+        Raises:
+            APIError: 再試行しても成功しなかった場合
+        """
+        metrics = self.metrics
+        tracer = self.tracer
+        started = time.monotonic()
+        attempt = 0
+        delay = 0.0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(method, template)
+            sent = time.perf_counter() if metrics is not None else 0.0
+            span = None
+            if tracer is not None:
+                span = self._start_request_span(
+                    tracer, method, endpoint, template, attempt, kwargs
+                )
+            try:
+                response = await self.session.request(
+                    method=method, url=f"{self.base_url}{endpoint}", **kwargs
+                )
+                if metrics is not None:
+                    self._record_attempt(method, template, sent, response, kwargs)
+                if span is not None:
+                    self._record_response(span, response)
+                # httpx は 3xx も例外にするため、再検証の 304 はそのまま返す
+                if response.status_code != 304:
+                    response.raise_for_status()
+                if span is not None:
+                    tracer.end_span(span)  # type: ignore[union-attr]
+                return response
+            except httpx.HTTPError as error:
+                if span is not None:
+                    tracer.end_span(span, error)  # type: ignore[union-attr]
+                if metrics is not None and not isinstance(error, httpx.HTTPStatusError):
+                    self._record_attempt(method, template, sent, None, kwargs)
+                delay = self._next_retry_delay(
+                    error, attempt, delay, time.monotonic() - started, idempotent
+                )
+                if delay is None:
+                    self._handle_request_error(error)
+                if metrics is not None:
+                    metrics.record_retry(method, template)
+                await asyncio.sleep(delay)
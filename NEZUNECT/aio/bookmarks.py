@@ -0,0 +1,145 @@
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Sequence
+
+from ..api.bookmarks import BookmarkFolder
+from ..config import Config
+from ..utils.agent import Headers
+from ..utils.batch import BulkReport, arun_bulk
+from ..utils.cookies import CookieStore
+from ..utils.exceptions import APIError
+from ..utils.lazy import decode_list
+from .base import AsyncBaseAPI
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncBookmarksAPI(AsyncBaseAPI):
+    """ブックマーク関連のAPI操作を非同期に管理するクラス"""
+
+    def __init__(
+        self,
+        session: Optional["httpx.AsyncClient"] = None,
+        cookie_store: Optional[CookieStore] = None,
+        **options: Any,
+    ) -> None:
+        super().__init__(session, cookie_store, **options)
+        self.headers = Headers.page_json("bookmarks")
+
+    async def get_bookmarks(
+        self, lazy: bool = False
+    ) -> Dict[str, Sequence[BookmarkFolder]]:
+        """
+        ブックマークフォルダの一覧を取得
+
+        Args:
+            lazy (bool, optional): True ならアクセスされるまでモデルを生成しない
+                LazyModelList を返す
+
+        Returns:
+            Dict[str, Sequence[BookmarkFolder]]: ブックマークフォルダのリスト
+
+        Raises:
+            APIError: フォルダの取得に失敗した場合
+        """
+        try:
+            response = await self._make_request(
+                "GET",
+                Config.Endpoints.BOOKMARKS,
+            )
+            folders = self._build(
+                Config.Endpoints.BOOKMARKS,
+                decode_list,
+                response["data"].get("folders", []),
+                BookmarkFolder.from_dict,
+                lazy,
+            )
+            return {"success": True, "data": folders}
+        except APIError as error:
+            raise APIError(
+                f"ブックマークの取得に失敗しました: {str(error)}", error.status_code
+            )
+
+    async def add_bookmark(self, folder_id: str, post_id: str) -> Dict[str, Any]:
+        """
+        指定したフォルダに投稿をブックマークとして追加
+
+        Args:
+            folder_id (str): ブックマークフォルダのID
+            post_id (str): ブックマークする投稿のID
+
+        Returns:
+            Dict[str, Any]: 追加結果
+
+        Raises:
+            APIError: ブックマークの追加に失敗した場合
+        """
+        try:
+            response = await self._make_request(
+                "POST",
+                Config.Endpoints.BOOKMARK_ADD.format(folder_id=folder_id),
+                data={"postId": post_id},
+            )
+            return response
+        except APIError as error:
+            raise APIError(
+                f"ブックマークの追加に失敗しました: {str(error)}", error.status_code
+            )
+
+    async def add_bookmarks(
+        self,
+        folder_id: str,
+        post_ids: Iterable[str],
+        *,
+        max_concurrency: int = 4,
+        resume: Optional[BulkReport] = None,
+        max_failures: Optional[int] = None,
+    ) -> BulkReport:
+        """
+        指定したフォルダに複数の投稿を並行してブックマークする
+
+        失敗した投稿は BulkReport.failed に入り、全体は中断しない。
+        送信レートは rate_limiter の bookmarks_write で制限される。
+
+        Args:
+            folder_id (str): ブックマークフォルダのID
+            post_ids (Iterable[str]): ブックマークする投稿のID
+            max_concurrency (int, optional): 同時に実行するリクエスト数
+            resume (Optional[BulkReport], optional): 前回の結果。成功済みの投稿は送信しない
+            max_failures (Optional[int], optional): この件数失敗した時点で中断する
+
+        Returns:
+            BulkReport: 成功・失敗・スキップした投稿ID
+        """
+        return await arun_bulk(
+            lambda post_id: self.add_bookmark(folder_id, post_id),
+            post_ids,
+            max_concurrency=max_concurrency,
+            resume=resume,
+            max_failures=max_failures,
+        )
+
+    async def create_bookmark_folder(self, name: str) -> Dict[str, Any]:
+        """
+        新しいブックマークフォルダを作成
+
+        Args:
+            name (str): フォルダ名
+
+        Returns:
+            Dict[str, Any]: 作成されたフォルダ情報
+
+        Raises:
+            APIError: フォルダの作成に失敗した場合
+        """
+        try:
+            response = await self._make_request(
+                "POST",
+                Config.Endpoints.BOOKMARKS,
+                data={"name": name},
+            )
+            return response
+        except APIError as error:
+            raise APIError(
+                f"ブックマークフォルダの作成に失敗しました: {str(error)}",
+                error.status_code,
+            )
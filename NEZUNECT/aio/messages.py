@@ -0,0 +1,142 @@
+from functools import partial
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional
+
+from ..api.messages import Message
+from ..config import Config
+from ..utils.agent import Headers
+from ..utils.cookies import CookieStore
+from ..utils.exceptions import APIError
+from ..utils.lazy import decode_list
+from ..utils.pagination import apaginate
+from .base import AsyncBaseAPI
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncMessagesAPI(AsyncBaseAPI):
+    """メッセージ関連のAPI操作を非同期に管理するクラス"""
+
+    def __init__(
+        self,
+        session: Optional["httpx.AsyncClient"] = None,
+        cookie_store: Optional[CookieStore] = None,
+        **options: Any,
+    ):
+        super().__init__(session, cookie_store, **options)
+        self.headers = Headers.page_plain_text("messages")
+
+    async def get_messages(
+        self, receiver_id: str, skip: int = 0, lazy: bool = False
+    ) -> Dict[str, Any]:
+        """
+        特定のユーザーとのメッセージ履歴を取得
+
+        Args:
+            receiver_id (str): 相手のプロフィールID
+            skip (int): スキップするメッセージ数（デフォルト: 0）
+            lazy (bool, optional): True ならアクセスされるまでモデルを生成しない
+                LazyModelList を返す
+
+        Returns:
+            Dict[str, Any]: 成功時はメッセージリストを含むレスポンス
+
+        Raises:
+            APIError: APIリクエストが失敗した場合
+        """
+        try:
+            response = await self._make_request(
+                "GET",
+                Config.Endpoints.MESSAGES.format(receiver_id=receiver_id),
+                headers=self.headers,
+                params={"skip": skip},
+            )
+            profiles = self._profile_map()
+            messages = self._build(
+                Config.Endpoints.MESSAGES,
+                decode_list,
+                response["data"].get("messages", []),
+                partial(Message.from_dict, profiles=profiles),
+                lazy,
+            )
+            return {"success": True, "data": messages}
+        except APIError as e:
+            raise APIError(
+                f"メッセージの取得に失敗しました: {str(e)}",
+                status_code=e.status_code,
+                response=e.response,
+            )
+
+    async def send_message(
+        self, receiver_id: str, text: str, assets: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        メッセージを送信
+
+        Args:
+            receiver_id (str): 受信者のプロフィールID
+            text (str): メッセージ本文
+            assets (Optional[List[str]]): 添付アセットのIDリスト
+
+        Returns:
+            Dict[str, Any]: 成功時は送信されたメッセージ情報を含むレスポンス
+
+        Raises:
+            APIError: APIリクエストが失敗した場合
+        """
+        headers = Headers.page_plain_text(f"messages/{receiver_id}")
+
+        data = {
+            "text": text,
+            "assets": assets or [],
+            "receiverId": receiver_id,
+        }
+
+        try:
+            response = await self._make_request(
+                "POST",
+                Config.Endpoints.MESSAGES.format(receiver_id=receiver_id),
+                headers=headers,
+                data=data,
+            )
+            message = Message.from_dict(
+                response["data"]["messageData"], self.identity_map
+            )
+            return {"success": True, "data": message}
+        except APIError as e:
+            raise APIError(
+                f"メッセージの送信に失敗しました: {str(e)}",
+                status_code=e.status_code,
+                response=e.response,
+            )
+
+    def iter_messages(
+        self,
+        receiver_id: str,
+        *,
+        start: int = 0,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Message]:
+        """
+        特定のユーザーとのメッセージ履歴を全ページにわたって1件ずつ返す
+
+        Args:
+            receiver_id (str): 相手のプロフィールID
+            start (int, optional): 最初の skip
+            page_size (Optional[int], optional): 1ページの件数（省略時は推定）
+            prefetch (bool, optional): 次のページを先読みするかどうか
+
+        Yields:
+            Message: メッセージ（新しい順）
+
+        Raises:
+            APIError: APIリクエストが失敗した場合
+        """
+
+        async def fetch_page(skip: int) -> List[Message]:
+            return (await self.get_messages(receiver_id, skip))["data"]
+
+        return apaginate(
+            fetch_page, start=start, page_size=page_size, prefetch=prefetch
+        )
@@ -0,0 +1,91 @@
+from functools import partial
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from ..api.notify import Notification
+from ..config import Config
+from ..utils.agent import Headers
+from ..utils.cookies import CookieStore
+from ..utils.exceptions import APIError
+from ..utils.lazy import decode_list
+from ..utils.pagination import apaginate
+from .base import AsyncBaseAPI
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncNotifyAPI(AsyncBaseAPI):
+    """通知関連のAPI操作を非同期に管理するクラス"""
+
+    def __init__(
+        self,
+        session: Optional["httpx.AsyncClient"] = None,
+        cookie_store: Optional[CookieStore] = None,
+        **options: Any,
+    ) -> None:
+        super().__init__(session, cookie_store, **options)
+        self.headers = Headers.page_json("notifications")
+
+    async def get_notifications(
+        self, skip: int = 0, lazy: bool = False
+    ) -> Dict[str, Sequence[Notification]]:
+        """
+        通知一覧を取得
+
+        Args:
+            skip (int, optional): スキップする通知数。デフォルトは0。
+            lazy (bool, optional): True ならアクセスされるまでモデルを生成しない
+                LazyModelList を返す
+
+        Returns:
+            Dict[str, Sequence[Notification]]: 通知のリスト
+
+        Raises:
+            APIError: 通知の取得に失敗した場合
+        """
+        try:
+            response = await self._make_request(
+                "GET",
+                f"{Config.Endpoints.NOTIFICATIONS}",
+                params={"skip": skip},
+            )
+            profiles = self._profile_map()
+            notifications = self._build(
+                Config.Endpoints.NOTIFICATIONS,
+                decode_list,
+                response["data"].get("notifications", []),
+                partial(Notification.from_dict, profiles=profiles),
+                lazy,
+            )
+            return {"success": True, "data": notifications}
+        except APIError as error:
+            raise APIError(f"通知の取得に失敗しました: {str(error)}", error.status_code)
+
+    def iter_notifications(
+        self,
+        *,
+        start: int = 0,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Notification]:
+        """
+        通知を全ページにわたって1件ずつ返す
+
+        Args:
+            start (int, optional): 最初の skip
+            page_size (Optional[int], optional): 1ページの件数（省略時は推定）
+            prefetch (bool, optional): 次のページを先読みするかどうか
+
+        Yields:
+            Notification: 通知
+
+        Raises:
+            APIError: 通知の取得に失敗した場合
+        """
+
+        async def fetch_page(skip: int) -> List[Notification]:
+            return (await self.get_notifications(skip))["data"]
+
+        return apaginate(
+            fetch_page, start=start, page_size=page_size, prefetch=prefetch
+        )
@@ -0,0 +1,302 @@
+from functools import partial
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from ..api.posts import Post
+from ..config import Config
+from ..utils.agent import Headers
+from ..utils.batch import BulkReport, arun_bulk
+from ..utils.cookies import CookieStore
+from ..utils.exceptions import APIError
+from ..utils.lazy import decode_list
+from ..utils.pagination import apaginate
+from .base import AsyncBaseAPI
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncPostsAPI(AsyncBaseAPI):
+    """投稿関連のAPI操作を非同期に管理するクラス"""
+
+    def __init__(
+        self,
+        session: Optional["httpx.AsyncClient"] = None,
+        cookie_store: Optional[CookieStore] = None,
+        **options: Any,
+    ) -> None:
+        super().__init__(session, cookie_store, **options)
+        self.headers = Headers.page_json("home")
+
+    async def create_post(
+        self,
+        text: str,
+        *,
+        assets: List[str] = [],
+        scope: str = "public",
+        scheduled_at: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        投稿を作成する
+
+        Args:
+            text (str): 投稿本文
+            assets (List[str], optional): アセットIDのリスト
+            scope (str, optional): 公開範囲
+            scheduled_at (Optional[str], optional): 投稿予定日時（ISO 8601形式）
+            idempotency_key (Optional[str], optional): 冪等キー。指定した場合のみ
+                送信失敗時に再試行する
+
+        Returns:
+            Dict[str, Any]: 作成された投稿の情報
+
+        Raises:
+            APIError: 投稿の作成に失敗した場合
+        """
+        data = {
+            "text": text,
+            "assets": assets,
+            "scope": scope,
+        }
+
+        if scheduled_at:
+            data["scheduledAt"] = scheduled_at
+
+        try:
+            response = await self._make_request(
+                "POST",
+                Config.Endpoints.POSTS,
+                data=data,
+                idempotency_key=idempotency_key,
+            )
+            return self._format_response(response, "post")
+        except APIError as error:
+            raise APIError(f"投稿の作成に失敗しました: {str(error)}", error.status_code)
+
+    async def like_post(self, post_id: str) -> Dict[str, Any]:
+        """
+        投稿にいいねを付ける
+
+        Args:
+            post_id (str): いいねを付ける投稿のID
+
+        Returns:
+            Dict[str, Any]: いいねの結果情報
+
+        Raises:
+            APIError: いいねの追加に失敗した場合
+        """
+        try:
+            response = await self._make_request(
+                "POST",
+                Config.Endpoints.LIKE_POST.format(post_id=post_id),
+            )
+            return response
+        except APIError as error:
+            raise APIError(
+                f"いいねの追加に失敗しました: {str(error)}", error.status_code
+            )
+
+    async def post_repost(self, post_id: str) -> Dict[str, Any]:
+        """
+        投稿をリポストする
+
+        Args:
+            post_id (str): リポストする投稿のID
+
+        Returns:
+            Dict[str, Any]: リポストの結果情報
+
+        Raises:
+            APIError: リポストに失敗した場合
+        """
+        try:
+            response = await self._make_request(
+                "POST",
+                Config.Endpoints.REPOST.format(post_id=post_id),
+            )
+            return response
+        except APIError as error:
+            raise APIError(f"リポストに失敗しました: {str(error)}", error.status_code)
+
+    async def like_posts(
+        self,
+        post_ids: Iterable[str],
+        *,
+        max_concurrency: int = 4,
+        resume: Optional[BulkReport] = None,
+        max_failures: Optional[int] = None,
+    ) -> BulkReport:
+        """
+        複数の投稿に並行していいねを付ける
+
+        失敗した投稿は BulkReport.failed に入り、全体は中断しない。
+        送信レートは rate_limiter の posts_write で制限される。
+
+        Args:
+            post_ids (Iterable[str]): いいねを付ける投稿のID
+            max_concurrency (int, optional): 同時に実行するリクエスト数
+            resume (Optional[BulkReport], optional): 前回の結果。成功済みの投稿は送信しない
+            max_failures (Optional[int], optional): この件数失敗した時点で中断する
+
+        Returns:
+            BulkReport: 成功・失敗・スキップした投稿ID
+        """
+        return await arun_bulk(
+            self.like_post,
+            post_ids,
+            max_concurrency=max_concurrency,
+            resume=resume,
+            max_failures=max_failures,
+        )
+
+    async def repost_many(
+        self,
+        post_ids: Iterable[str],
+        *,
+        max_concurrency: int = 4,
+        resume: Optional[BulkReport] = None,
+        max_failures: Optional[int] = None,
+    ) -> BulkReport:
+        """
+        複数の投稿を並行してリポストする
+
+        引数と戻り値は like_posts() と同じ。
+        """
+        return await arun_bulk(
+            self.post_repost,
+            post_ids,
+            max_concurrency=max_concurrency,
+            resume=resume,
+            max_failures=max_failures,
+        )
+
+    async def search_post(
+        self, query: str, skip: int = 0, hours: int = 168
+    ) -> Dict[str, List[Post]]:
+        """
+        投稿を検索する
+
+        Args:
+            query (str): 検索キーワード
+            skip (int, optional): スキップする投稿数。デフォルトは0。
+            hours (int, optional): 検索対象の期間（時間）。デフォルトは168。
+
+        Returns:
+            Dict[str, List[Post]]: 投稿のリスト
+
+        Raises:
+            APIError: 投稿の検索に失敗した場合
+        """
+        try:
+            response = await self._make_request(
+                "GET",
+                Config.Endpoints.SEARCH_POSTS,
+                params={"query": query, "skip": skip, "hours": hours},
+            )
+            profiles = self._profile_map()
+            posts = self._build(
+                Config.Endpoints.SEARCH_POSTS,
+                decode_list,
+                response["data"].get("posts", []),
+                partial(Post.from_dict, profiles=profiles),
+                False,
+            )
+            return {"success": True, "data": posts}
+        except APIError as error:
+            raise APIError(f"投稿の検索に失敗しました: {str(error)}", error.status_code)
+
+    async def get_top_posts(self, skip: int = 0) -> Dict[str, List[Post]]:
+        """
+        トップ投稿を取得する
+
+        Args:
+            skip (int, optional): スキップする投稿数。デフォルトは0。
+
+        Returns:
+            Dict[str, List[Post]]: 投稿のリスト
+
+        Raises:
+            APIError: トップ投稿の取得に失敗した場合
+        """
+        try:
+            response = await self._make_request(
+                "GET",
+                Config.Endpoints.TOP_POSTS,
+                params={"skip": skip},
+            )
+            profiles = self._profile_map()
+            posts = self._build(
+                Config.Endpoints.TOP_POSTS,
+                decode_list,
+                response["data"].get("posts", []),
+                partial(Post.from_dict, profiles=profiles),
+                False,
+            )
+            return {"success": True, "data": posts}
+        except APIError as error:
+            raise APIError(
+                f"トップ投稿の取得に失敗しました: {str(error)}", error.status_code
+            )
+
+    def iter_search(
+        self,
+        query: str,
+        *,
+        hours: int = 168,
+        start: int = 0,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Post]:
+        """
+        検索結果を全ページにわたって1件ずつ返す
+
+        Args:
+            query (str): 検索キーワード
+            hours (int, optional): 検索対象の期間（時間）
+            start (int, optional): 最初の skip
+            page_size (Optional[int], optional): 1ページの件数（省略時は推定）
+            prefetch (bool, optional): 次のページを先読みするかどうか
+
+        Yields:
+            Post: 投稿
+
+        Raises:
+            APIError: 投稿の検索に失敗した場合
+        """
+
+        async def fetch_page(skip: int) -> List[Post]:
+            return (await self.search_post(query, skip, hours))["data"]
+
+        return apaginate(
+            fetch_page, start=start, page_size=page_size, prefetch=prefetch
+        )
+
+    def iter_top_posts(
+        self,
+        *,
+        start: int = 0,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[Post]:
+        """
+        トップ投稿を全ページにわたって1件ずつ返す
+
+        Args:
+            start (int, optional): 最初の skip
+            page_size (Optional[int], optional): 1ページの件数（省略時は推定）
+            prefetch (bool, optional): 次のページを先読みするかどうか
+
+        Yields:
+            Post: 投稿
+
+        Raises:
+            APIError: トップ投稿の取得に失敗した場合
+        """
+
+        async def fetch_page(skip: int) -> List[Post]:
+            return (await self.get_top_posts(skip))["data"]
+
+        return apaginate(
+            fetch_page, start=start, page_size=page_size, prefetch=prefetch
+        )
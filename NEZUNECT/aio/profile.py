@@ -0,0 +1,162 @@
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Iterable, Optional
+
+from ..api.profile import ProfileInfo
+from ..config import Config
+from ..utils.agent import Headers
+from ..utils.batch import BatchResult, arun_batch
+from ..utils.cookies import CookieStore
+from ..utils.exceptions import APIError
+from .base import AsyncBaseAPI
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncProfileAPI(AsyncBaseAPI):
+    """プロフィール関連のAPI操作を非同期に管理するクラス"""
+
+    def __init__(
+        self,
+        session: Optional["httpx.AsyncClient"] = None,
+        cookie_store: Optional[CookieStore] = None,
+        **options: Any,
+    ) -> None:
+        super().__init__(session, cookie_store, **options)
+        self.headers = Headers.page_json("profile")
+
+    async def get_profile(self, username: str) -> Dict[str, ProfileInfo]:
+        """
+        プロフィール情報を取得
+
+        Args:
+            username (str): ユーザー名
+
+        Returns:
+            Dict[str, ProfileInfo]: プロフィール情報
+
+        Raises:
+            APIError: プロフィール情報の取得に失敗した場合
+        """
+        try:
+            response = await self._make_request(
+                "GET",
+                Config.Endpoints.PROFILE_USER.format(username=username),
+            )
+            profile = self._build(
+                Config.Endpoints.PROFILE_USER, ProfileInfo.from_dict, response["data"]
+            )
+            return {"success": True, "data": profile}
+        except APIError as error:
+            raise APIError(
+                f"プロフィール情報の取得に失敗しました: {str(error)}", error.status_code
+            )
+
+    def get_profiles(
+        self,
+        usernames: Iterable[str],
+        *,
+        max_concurrency: int = 8,
+        ordered: bool = False,
+    ) -> AsyncIterator[BatchResult[ProfileInfo]]:
+        """
+        複数ユーザーのプロフィール情報を並行して取得
+
+        共有セッションの接続プール上で最大 max_concurrency 件を同時に取得する。
+        失敗したユーザーは BatchResult.error に APIError が入り、バッチ全体は中断しない。
+        max_concurrency は TransportConfig.pool_maxsize 以下にすると接続が使い回される。
+
+        Args:
+            usernames (Iterable[str]): ユーザー名
+            max_concurrency (int, optional): 同時に実行するリクエスト数
+            ordered (bool, optional): 入力順に返すかどうか。Falseなら完了順
+
+        Yields:
+            BatchResult[ProfileInfo]: ユーザー名ごとの結果
+        """
+
+        async def fetch(username: str) -> ProfileInfo:
+            return (await self.get_profile(username))["data"]
+
+        return arun_batch(
+            fetch, usernames, max_concurrency=max_concurrency, ordered=ordered
+        )
+
+    async def update_profile(
+        self,
+        *,
+        nickname: Optional[str] = None,
+        bio: Optional[str] = None,
+        email: Optional[str] = None,
+        username: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        プロフィール情報を更新
+
+        Args:
+            nickname (Optional[str], optional): 新しいニックネーム
+            bio (Optional[str], optional): 新しい自己紹介
+            email (Optional[str], optional): 新しいメールアドレス
+            username (Optional[str], optional): 新しいユーザー名
+
+        Returns:
+            Dict[str, Any]: 更新結果
+
+        Raises:
+            APIError: プロフィールの更新に失敗した場合
+        """
+        try:
+            if nickname or bio:
+                data = {}
+                if nickname:
+                    data["nickname"] = nickname
+                if bio:
+                    data["bio"] = bio
+                response = await self._make_request(
+                    "PUT",
+                    Config.Endpoints.PROFILE,
+                    data=data,
+                )
+
+            if email:
+                response = await self._make_request(
+                    "POST",
+                    Config.Endpoints.PROFILE_EMAIL,
+                    data={"email": email},
+                )
+
+            if username:
+                response = await self._make_request(
+                    "PUT",
+                    Config.Endpoints.PROFILE_USERNAME,
+                    data={"username": username},
+                )
+
+            return response
+        except APIError as error:
+            raise APIError(
+                f"プロフィールの更新に失敗しました: {str(error)}", error.status_code
+            )
+
+    async def pin_post(self, post_id: str) -> Dict[str, Any]:
+        """
+        投稿をピン留め
+
+        Args:
+            post_id (str): ピン留めする投稿のID
+
+        Returns:
+            Dict[str, Any]: ピン留め結果
+
+        Raises:
+            APIError: ピン留めに失敗した場合
+        """
+        try:
+            response = await self._make_request(
+                "POST",
+                Config.Endpoints.POST_PIN.format(post_id=post_id),
+            )
+            return response
+        except APIError as error:
+            raise APIError(
+                f"投稿のピン留めに失敗しました: {str(error)}", error.status_code
+            )
@@ -0,0 +1,91 @@
+from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, List, Optional, Sequence
+
+from ..api.sessions import SessionInfo
+from ..config import Config
+from ..utils.agent import Headers
+from ..utils.cookies import CookieStore
+from ..utils.exceptions import APIError
+from ..utils.lazy import decode_list
+from ..utils.pagination import apaginate
+from .base import AsyncBaseAPI
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncSessionsAPI(AsyncBaseAPI):
+    """セッション関連のAPI操作を非同期に管理するクラス"""
+
+    def __init__(
+        self,
+        session: Optional["httpx.AsyncClient"] = None,
+        cookie_store: Optional[CookieStore] = None,
+        **options: Any,
+    ) -> None:
+        super().__init__(session, cookie_store, **options)
+        self.headers = Headers.page_json("sessions")
+
+    async def get_sessions(
+        self, skip: int = 0, lazy: bool = False
+    ) -> Dict[str, Sequence[SessionInfo]]:
+        """
+        セッション情報を取得
+
+        Args:
+            skip (int, optional): スキップするセッション数。デフォルトは0。
+            lazy (bool, optional): True ならアクセスされるまでモデルを生成しない
+                LazyModelList を返す
+
+        Returns:
+            Dict[str, Sequence[SessionInfo]]: セッション情報のリスト
+
+        Raises:
+            APIError: セッション情報の取得に失敗した場合
+        """
+        try:
+            response = await self._make_request(
+                "GET",
+                Config.Endpoints.SESSIONS,
+                params={"skip": skip},
+            )
+            sessions = self._build(
+                Config.Endpoints.SESSIONS,
+                decode_list,
+                response["data"].get("sessions", []),
+                SessionInfo.from_dict,
+                lazy,
+            )
+            return {"success": True, "data": sessions}
+        except APIError as error:
+            raise APIError(
+                f"セッション情報の取得に失敗しました: {str(error)}", error.status_code
+            )
+
+    def iter_sessions(
+        self,
+        *,
+        start: int = 0,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> AsyncIterator[SessionInfo]:
+        """
+        セッション情報を全ページにわたって1件ずつ返す
+
+        Args:
+            start (int, optional): 最初の skip
+            page_size (Optional[int], optional): 1ページの件数（省略時は推定）
+            prefetch (bool, optional): 次のページを先読みするかどうか
+
+        Yields:
+            SessionInfo: セッション情報
+
+        Raises:
+            APIError: セッション情報の取得に失敗した場合
+        """
+
+        async def fetch_page(skip: int) -> List[SessionInfo]:
+            return (await self.get_sessions(skip))["data"]
+
+        return apaginate(
+            fetch_page, start=start, page_size=page_size, prefetch=prefetch
+        )
@@ -0,0 +1,52 @@
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from ..config import Config
+from ..utils.agent import Headers
+from ..utils.cookies import CookieStore
+from ..utils.exceptions import APIError
+from .base import AsyncBaseAPI
+
+if TYPE_CHECKING:
+    import httpx
+
+
+class AsyncVerifyAPI(AsyncBaseAPI):
+    def __init__(
+        self,
+        session: Optional["httpx.AsyncClient"] = None,
+        cookie_store: Optional[CookieStore] = None,
+        **options: Any,
+    ):
+        super().__init__(session, cookie_store, **options)
+        self.headers = Headers.page_json("verify")
+
+    async def verify_email(self, email: str, code: str) -> Dict[str, Any]:
+        """
+        メールアドレスの確認を行います。
+
+        Args:
+            email (str): 確認するメールアドレス。
+            code (str): 確認コード。
+
+        Returns:
+            Dict[str, Any]: APIレスポンス。
+
+        Raises:
+            APIError: APIリクエストが失敗した場合。
+        """
+        data = {"email": email, "code": code}
+
+        try:
+            response = await self._make_request(
+                "PUT",
+                Config.Endpoints.EMAIL_VERIFY,
+                headers=self.headers,
+                data=data,
+            )
+            return response
+        except APIError as e:
+            raise APIError(
+                f"メールアドレスの確認に失敗しました: {str(e)}",
+                status_code=e.status_code,
+                response=e.response,
+            )
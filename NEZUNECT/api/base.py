@@ -1,48 +1,128 @@
+import time
 from abc import ABC
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import requests
 from requests import Response, Session
+from urllib3.exceptions import NewConnectionError
 
-from ..config import Config
-from ..utils.cookies import load_cookies
+from ..utils.cache import ResponseCache
+from ..utils.codec import JSONCodec
+from ..utils.cookies import CookieStore
 from ..utils.exceptions import APIError
+from ..utils.hooks import GLOBAL_HOOKS, Hooks, resolve_hooks
+from ..utils.identity import ProfileIdentityMap
+from ..utils.metrics import MetricsRegistry
+from ..utils.ratelimit import RateLimiter
+from ..utils.retry import RetryPolicy
+from ..utils.singleflight import SingleFlight
+from ..utils.tracing import Tracer
+from ..utils.transport import TransportConfig
+from .common import BaseAPIMixin
 
 
-class BaseAPI(ABC):
+class BaseAPI(BaseAPIMixin, ABC):
     """APIリクエストの基底クラス"""
 
-    def __init__(self, session: Optional[Session] = None) -> None:
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        cookie_store: Optional[CookieStore] = None,
+        *,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[TransportConfig] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        codec: Optional[JSONCodec] = None,
+        identity_map: Optional[ProfileIdentityMap] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        hooks: Optional[Hooks] = None,
+        tracer: Optional[Tracer] = None,
+    ) -> None:
         """
         BaseAPIクラスの初期化
 
         Args:
             session (Optional[Session]): リクエストセッション。デフォルトはNone。
+            cookie_store (Optional[CookieStore]): 共有クッキーストア。
+                デフォルトは ./cookie.json の共有ストア。
+            retry_policy (Optional[RetryPolicy]): 再試行ポリシー。
+                デフォルトは RetryPolicy()。
+            rate_limiter (Optional[RateLimiter]): クライアント側のレート制限。
+                デフォルトはNone（制限なし）。
+            transport (Optional[TransportConfig]): 接続プールとタイムアウトの設定。
+                session を省略した場合のセッション生成にも使う。
+            cache (Optional[ResponseCache]): 読み取り系レスポンスのキャッシュ。
+                デフォルトはNone（キャッシュしない）。
+            single_flight (Optional[SingleFlight]): 同時に実行中の同一GETを
+                1つのリクエストにまとめる。デフォルトはNone（まとめない）。
+            codec (Optional[JSONCodec]): リクエスト/レスポンス本文のJSONコーデック。
+                デフォルトは get_codec()（orjson / ujson があればそれを使う）。
+            identity_map (Optional[ProfileIdentityMap]): 埋め込みプロフィールを
+                クライアント全体で共有する識別マップ。デフォルトはNone（ページ単位で共有）。
+            metrics (Optional[MetricsRegistry]): エンドポイントごとの計測値の記録先。
+                デフォルトはNone（計測しない）。
+            hooks (Optional[Hooks]): このクライアントのリクエストフック。
+                GLOBAL_HOOKS のフックはこれより先に呼ばれる。
+            tracer (Optional[Tracer]): 公開メソッドとHTTPリクエストのスパンの記録先。
+                デフォルトはNone（記録しない）。
         """
-        self.base_url: str = Config.BASE_URL
-        self.session: Session = session or Session()
-        self.cookies: Dict[str, str] = load_cookies()
-        self.headers: Dict[str, str] = {}
+        self.session: Session
+        transport = transport or TransportConfig()
+        self._setup(
+            session or transport.create_session(),
+            transport,
+            cookie_store,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            cache=cache,
+            single_flight=single_flight,
+            codec=codec,
+            identity_map=identity_map,
+            metrics=metrics,
+            hooks=hooks,
+            tracer=tracer,
+        )
+
+    def _default_timeout(self) -> Tuple[float, float]:
+        return self.transport.timeout
+
+    def _was_sent(self, error: Exception) -> bool:
+        reason = getattr(error.args[0], "reason", None) if error.args else None
+        return not (
+            isinstance(error, requests.exceptions.ConnectTimeout)
+            or isinstance(reason, NewConnectionError)
+        )
 
     def _make_request(
         self,
         method: str,
         endpoint: str,
         *,
-        headers: Optional[Dict[str, str]] = None,
+        headers: Optional[Mapping[str, str]] = None,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
         **kwargs: Any,
     ) -> Dict[str, Any]:
         """
         APIリクエストを実行する共通メソッド
 
+        single_flight が設定されていれば実行中の同一GETに合流し、
+        cache が設定されていれば読み取り系のレスポンスをキャッシュから返し、
+        rate_limiter が設定されていれば送信前にトークンを待ち、
+        失敗時は retry_policy に従って再試行する。
+        hooks か GLOBAL_HOOKS にフックが登録されていれば、その前後でフックを呼ぶ。
+
         Args:
             method (str): HTTPメソッド
             endpoint (str): APIエンドポイント
-            headers (Optional[Dict[str, str]], optional): リクエストヘッダー
+            headers (Optional[Mapping[str, str]], optional): ページごとの差分ヘッダー
             data (Optional[Dict[str, Any]], optional): リクエストデータ
             params (Optional[Dict[str, Any]], optional): クエリパラメータ
+            idempotency_key (Optional[str], optional): 冪等キー。指定すると
+                Idempotency-Key ヘッダーを付け、書き込みでも再試行する
             **kwargs: 追加のリクエストオプション
 
         Returns:
@@ -51,54 +131,179 @@ class BaseAPI(ABC):
         Raises:
             APIError: APIリクエストが失敗した場合
         """
-        try:
-            response: Response = self.session.request(
-                method=method,
-                url=f"{self.base_url}{endpoint}",
-                headers=headers or self.headers,
-                cookies=self.cookies,
-                json=data,
-                params=params,
-                **kwargs,
+        method, template, idempotent, headers = self._prepare(
+            method, endpoint, headers, idempotency_key, kwargs
+        )
+        if self.hooks.empty and GLOBAL_HOOKS.empty:
+            return self._dispatch(
+                method, endpoint, template, idempotent, headers, data, params, kwargs
             )
-            response.raise_for_status()
-            return {"success": True, "data": response.json()}
-        except requests.exceptions.RequestException as error:
-            self._handle_request_error(error)
+        return self._dispatch_with_hooks(
+            method, endpoint, template, idempotent, headers, data, params, kwargs
+        )
 
-    def _handle_request_error(
-        self, error: requests.exceptions.RequestException
-    ) -> None:
-        """
-        リクエストエラーを処理する
+    def _dispatch(
+        self,
+        method: str,
+        endpoint: str,
+        template: str,
+        idempotent: bool,
+        headers: Mapping[str, str],
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """single_flight が設定されていれば実行中の同一GETに合流し、なければ _fetch() を呼ぶ"""
+        if method == "GET" and self.single_flight is not None:
+            return self.single_flight.do(
+                self._flight_key(endpoint, params),
+                lambda: self._fetch(
+                    method,
+                    endpoint,
+                    template,
+                    idempotent,
+                    headers,
+                    data,
+                    params,
+                    kwargs,
+                ),
+            )
+        return self._fetch(
+            method, endpoint, template, idempotent, headers, data, params, kwargs
+        )
 
-        Args:
-            error (requests.exceptions.RequestException): 発生したエラー
+    def _dispatch_with_hooks(
+        self,
+        method: str,
+        endpoint: str,
+        template: str,
+        idempotent: bool,
+        headers: Mapping[str, str],
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        kwargs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """before_request / after_response / on_error のフックを挟んで _dispatch() を呼ぶ"""
+        chain = resolve_hooks(self.hooks)
+        if chain is None:
+            return self._dispatch(
+                method, endpoint, template, idempotent, headers, data, params, kwargs
+            )
+        context = self._hook_context(method, endpoint, template, headers, data, params)
+        for hook in chain.before_request:
+            value = hook(context)
+            if value is not None:
+                context.short_circuited = True
+                context.response = value
+                break
+        else:
+            try:
+                result = self._dispatch(
+                    method,
+                    endpoint,
+                    template,
+                    idempotent,
+                    context.headers,
+                    context.data,
+                    context.params,
+                    kwargs,
+                )
+            except APIError as error:
+                self._hook_failed(context, error)
+                for hook in chain.on_error:
+                    value = hook(context)
+                    if value is not None:
+                        return {"success": True, "data": value}
+                raise
+            context.response = result.get("data")
 
-        Raises:
-            APIError: 整形されたAPIエラー
-        """
-        status_code = error.response.status_code if hasattr(error, "response") else None
-        response_data = error.response.json() if hasattr(error, "response") else None
-        raise APIError(
-            message=f"APIリクエストに失敗しました: {str(error)}",
-            status_code=status_code,
-            response=response_data,
-        )
+        context.elapsed = time.perf_counter() - context.started
+        for hook in chain.after_response:
+            value = hook(context)
+            if value is not None:
+                context.response = value
+        return {"success": True, "data": context.response}
 
-    def _format_response(
-        self, response: Dict[str, Any], key: Optional[str] = None
+    def _fetch(
+        self,
+        method: str,
+        endpoint: str,
+        template: str,
+        idempotent: bool,
+        headers: Mapping[str, str],
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        kwargs: Dict[str, Any],
     ) -> Dict[str, Any]:
-        """
-        APIレスポンスを整形する
+        """キャッシュを確認し、必要ならリクエストを送信して結果をデコードする"""
+        cache_key, cached, headers = self._cache_lookup(
+            method, endpoint, template, headers, params
+        )
+        if cached is not None and cached.fresh:
+            return {"success": True, "data": cached.data}
+        body, headers = self._encode_body(data, headers)
 
-        Args:
-            response (Dict[str, Any]): 生のAPIレスポンス
-            key (Optional[str], optional): 抽出するデータのキー
+        response = self._send_with_retry(
+            method,
+            endpoint,
+            template,
+            idempotent,
+            headers=headers,
+            data=body,
+            params=params,
+            **kwargs,
+        )
+        return self._complete(method, endpoint, template, response, cache_key, cached)
+
+    def _send_with_retry(
+        self, method: str, endpoint: str, template: str, idempotent: bool, **kwargs: Any
+    ) -> Response:
+        """
+        rate_limiter と retry_policy に従ってリクエストを送信する
 
         Returns:
-            Dict[str, Any]: 整形されたレスポンス
+            Response: 成功（2xx/3xx）したレスポンス
+
+        Raises:
+            APIError: 再試行しても成功しなかった場合
         """
-        if key and key in response.get("data", {}):
-            return {"success": True, "data": response["data"][key]}
-        return response
+        metrics = self.metrics
+        tracer = self.tracer
+        started = time.monotonic()
+        attempt = 0
+        delay = 0.0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(method, template)
+            sent = time.perf_counter() if metrics is not None else 0.0
+            span = None
+            if tracer is not None:
+                span = self._start_request_span(
+                    tracer, method, endpoint, template, attempt, kwargs
+                )
+            try:
+                response = self.session.request(
+                    method=method, url=f"{self.base_url}{endpoint}", **kwargs
+                )
+                if metrics is not None:
+                    self._record_attempt(method, template, sent, response, kwargs)
+                if span is not None:
+                    self._record_response(span, response)
+                response.raise_for_status()
+                if span is not None:
+                    tracer.end_span(span)  # type: ignore[union-attr]
+                return response
+            except requests.exceptions.RequestException as error:
+                if span is not None:
+                    tracer.end_span(span, error)  # type: ignore[union-attr]
+                if metrics is not None and error.response is None:
+                    self._record_attempt(method, template, sent, None, kwargs)
+                delay = self._next_retry_delay(
+                    error, attempt, delay, time.monotonic() - started, idempotent
+                )
+                if delay is None:
+                    self._handle_request_error(error)
+                if metrics is not None:
+                    metrics.record_retry(method, template)
+                time.sleep(delay)
@@ -1,15 +1,21 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Optional, Sequence
 
 from requests import Session
 
 from ..config import Config
 from ..utils.agent import Headers
+from ..utils.batch import BulkReport, run_bulk
+from ..utils.cookies import CookieStore
 from ..utils.exceptions import APIError
+from ..utils.lazy import decode_list
+from ..utils.models import frozen_variant, slotted
+from ..utils.timestamps import lazy_timestamp
 from .base import BaseAPI
 
 
+@slotted
 @dataclass
 class BookmarkFolder:
     """ブックマークフォルダ情報を表すデータクラス"""
@@ -17,7 +23,7 @@ class BookmarkFolder:
     folder_id: str
     name: str
     post_count: int
-    created_at: datetime
+    created_at: Optional[datetime] = lazy_timestamp()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BookmarkFolder":
@@ -26,29 +32,44 @@ class BookmarkFolder:
             folder_id=data.get("folderId", ""),
             name=data.get("name", ""),
             post_count=data.get("postCount", 0),
-            created_at=datetime.fromisoformat(data.get("createdAt", "")),
+            created_at=data.get("createdAt", ""),
         )
 
 
+# 変更できない（frozen）版。freeze() で既存のインスタンスを変換できる
+FrozenBookmarkFolder = frozen_variant(BookmarkFolder)
+
+
 class BookmarksAPI(BaseAPI):
     """ブックマーク関連のAPI操作を管理するクラス"""
 
-    def __init__(self, session: Optional[Session] = None) -> None:
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        cookie_store: Optional[CookieStore] = None,
+        **options: Any,
+    ) -> None:
         """
         BookmarksAPIクラスの初期化
 
         Args:
             session (Optional[Session]): リクエストセッション
+            cookie_store (Optional[CookieStore]): 共有クッキーストア
+            **options: BaseAPIに渡す追加設定
         """
-        super().__init__(session)
-        self.headers = Headers.get_json("bookmarks")
+        super().__init__(session, cookie_store, **options)
+        self.headers = Headers.page_json("bookmarks")
 
-    def get_bookmarks(self) -> Dict[str, List[BookmarkFolder]]:
+    def get_bookmarks(self, lazy: bool = False) -> Dict[str, Sequence[BookmarkFolder]]:
         """
         ブックマークフォルダの一覧を取得
 
+        Args:
+            lazy (bool, optional): True ならアクセスされるまでモデルを生成しない
+                LazyModelList を返す
+
         Returns:
-            Dict[str, List[BookmarkFolder]]: ブックマークフォルダのリスト
+            Dict[str, Sequence[BookmarkFolder]]: ブックマークフォルダのリスト
 
         Raises:
             APIError: フォルダの取得に失敗した場合
@@ -58,10 +79,13 @@ class BookmarksAPI(BaseAPI):
                 "GET",
                 Config.Endpoints.BOOKMARKS,
             )
-            folders = [
-                BookmarkFolder.from_dict(folder)
-                for folder in response["data"].get("folders", [])
-            ]
+            folders = self._build(
+                Config.Endpoints.BOOKMARKS,
+                decode_list,
+                response["data"].get("folders", []),
+                BookmarkFolder.from_dict,
+                lazy,
+            )
             return {"success": True, "data": folders}
         except APIError as error:
             raise APIError(
@@ -94,6 +118,39 @@ class BookmarksAPI(BaseAPI):
                 f"ブックマークの追加に失敗しました: {str(error)}", error.status_code
             )
 
+    def add_bookmarks(
+        self,
+        folder_id: str,
+        post_ids: Iterable[str],
+        *,
+        max_concurrency: int = 4,
+        resume: Optional[BulkReport] = None,
+        max_failures: Optional[int] = None,
+    ) -> BulkReport:
+        """
+        指定したフォルダに複数の投稿を並行してブックマークする
+
+        失敗した投稿は BulkReport.failed に入り、全体は中断しない。
+        送信レートは rate_limiter の bookmarks_write で制限される。
+
+        Args:
+            folder_id (str): ブックマークフォルダのID
+            post_ids (Iterable[str]): ブックマークする投稿のID
+            max_concurrency (int, optional): 同時に実行するリクエスト数
+            resume (Optional[BulkReport], optional): 前回の結果。成功済みの投稿は送信しない
+            max_failures (Optional[int], optional): この件数失敗した時点で中断する
+
+        Returns:
+            BulkReport: 成功・失敗・スキップした投稿ID
+        """
+        return run_bulk(
+            lambda post_id: self.add_bookmark(folder_id, post_id),
+            post_ids,
+            max_concurrency=max_concurrency,
+            resume=resume,
+            max_failures=max_failures,
+        )
+
     def create_bookmark_folder(self, name: str) -> Dict[str, Any]:
         """
         新しいブックマークフォルダを作成
@@ -0,0 +1,363 @@
+import time
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, TypeVar
+
+from ..config import Config
+from ..utils.agent import Headers
+from ..utils.cache import CacheEntry, ResponseCache
+from ..utils.codec import JSONCodec, get_codec
+from ..utils.cookies import CookieStore
+from ..utils.endpoints import endpoint_template
+from ..utils.exceptions import APIError
+from ..utils.hooks import Hooks, RequestContext
+from ..utils.identity import ProfileIdentityMap
+from ..utils.metrics import MetricsRegistry
+from ..utils.ratelimit import RateLimiter
+from ..utils.retry import RetryPolicy, parse_retry_after
+from ..utils.singleflight import SingleFlight
+from ..utils.tracing import Span, Tracer, trace_api_methods
+from ..utils.transport import TransportConfig
+
+T = TypeVar("T")
+
+# _fetch() の前半で決まる値（キャッシュキー、再検証するエントリ、送信ヘッダー）
+CacheLookup = Tuple[Optional[Any], Optional[CacheEntry], Mapping[str, str]]
+
+
+class BaseAPIMixin:
+    """
+    BaseAPI（requests）と AsyncBaseAPI（httpx）に共通する処理
+
+    送信と待機だけが同期・非同期で異なるため、リクエストの組み立て、キャッシュ、
+    フックの文脈、計測、スパン、再試行の判断、エラーの整形はここにまとめる。
+    サブクラスは _BODY_KWARG（本文を渡すキーワード）、_default_timeout()、
+    _was_sent() を定義する。
+    """
+
+    # セッションの request() に本文を渡すキーワード引数の名前
+    _BODY_KWARG = "data"
+
+    session: Any
+    headers: Mapping[str, str]
+
+    def _setup(
+        self,
+        session: Any,
+        transport: TransportConfig,
+        cookie_store: Optional[CookieStore],
+        *,
+        retry_policy: Optional[RetryPolicy],
+        rate_limiter: Optional[RateLimiter],
+        cache: Optional[ResponseCache],
+        single_flight: Optional[SingleFlight],
+        codec: Optional[JSONCodec],
+        identity_map: Optional[ProfileIdentityMap],
+        metrics: Optional[MetricsRegistry],
+        hooks: Optional[Hooks],
+        tracer: Optional[Tracer],
+    ) -> None:
+        """生成済みのセッションと設定を属性に設定する（__init__ から呼ぶ）"""
+        self.base_url: str = Config.BASE_URL
+        self.transport: TransportConfig = transport
+        self.session = session
+        self.cookie_store: CookieStore = cookie_store or CookieStore.get()
+        self._cookie_version: int = self.cookie_store.apply(self.session)
+        self.session.headers.update(Headers.COMMON)
+        self.headers = {}
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self.rate_limiter: Optional[RateLimiter] = rate_limiter
+        self.cache: Optional[ResponseCache] = cache
+        self.single_flight: Optional[SingleFlight] = single_flight
+        self._codec: Optional[JSONCodec] = codec
+        self.identity_map: Optional[ProfileIdentityMap] = identity_map
+        self.metrics: Optional[MetricsRegistry] = metrics
+        self.hooks: Hooks = hooks if hooks is not None else Hooks()
+        self.tracer: Optional[Tracer] = tracer
+        if tracer is not None:
+            trace_api_methods(self, tracer)
+
+    @property
+    def cookies(self) -> Dict[str, str]:
+        """現在のクッキー情報"""
+        return self.cookie_store.cookies
+
+    @property
+    def codec(self) -> JSONCodec:
+        """本文のJSONコーデック（未指定なら初回の送受信時に get_codec() で選ぶ）"""
+        if self._codec is None:
+            self._codec = get_codec()
+        return self._codec
+
+    @codec.setter
+    def codec(self, codec: JSONCodec) -> None:
+        self._codec = codec
+
+    def _default_timeout(self) -> Any:
+        """セッションの request() に渡す既定のタイムアウト"""
+        raise NotImplementedError
+
+    def _was_sent(self, error: Exception) -> bool:
+        """失敗したリクエストがサーバーに届いた可能性があるかどうか"""
+        raise NotImplementedError
+
+    def _prepare(
+        self,
+        method: str,
+        endpoint: str,
+        headers: Optional[Mapping[str, str]],
+        idempotency_key: Optional[str],
+        kwargs: Dict[str, Any],
+    ) -> Tuple[str, str, bool, Mapping[str, str]]:
+        """
+        _make_request() の共通の前処理
+
+        クッキーを同期し、既定のタイムアウトを設定して、
+        (メソッド, テンプレート, 冪等かどうか, 送信ヘッダー) を返す。
+        """
+        self._sync_cookies()
+        kwargs.setdefault("timeout", self._default_timeout())
+        method = method.upper()
+        headers = headers or self.headers
+        idempotent = self.retry_policy.is_idempotent(method)
+        if idempotency_key:
+            headers = {**headers, "Idempotency-Key": idempotency_key}
+            idempotent = True
+        return method, endpoint_template(endpoint), idempotent, headers
+
+    def _flight_key(self, endpoint: str, params: Optional[Dict[str, Any]]) -> Any:
+        """single_flight で同じGETをまとめるキー"""
+        return ResponseCache.make_key(endpoint, params, self.cookie_store.account_key)
+
+    def _hook_context(
+        self,
+        method: str,
+        endpoint: str,
+        template: str,
+        headers: Mapping[str, str],
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+    ) -> RequestContext:
+        """フックに渡す RequestContext を作る"""
+        return RequestContext(
+            method, endpoint, template, params, data, dict(headers), time.perf_counter()
+        )
+
+    def _hook_failed(self, context: RequestContext, error: APIError) -> None:
+        """on_error フックを呼ぶ前に、失敗したリクエストを context に記録する"""
+        context.elapsed = time.perf_counter() - context.started
+        context.error = error
+
+    def _cache_lookup(
+        self,
+        method: str,
+        endpoint: str,
+        template: str,
+        headers: Mapping[str, str],
+        params: Optional[Dict[str, Any]],
+    ) -> CacheLookup:
+        """
+        キャッシュを確認する
+
+        Returns:
+            CacheLookup: (キャッシュキー, エントリ, 送信ヘッダー)。期限切れのエントリが
+                あれば、送信ヘッダーに条件付きリクエストのヘッダーを加える
+        """
+        if method != "GET" or self.cache is None or template not in self.cache.ttls:
+            return None, None, headers
+        cache_key = self.cache.make_key(endpoint, params, self.cookie_store.account_key)
+        cached = self.cache.lookup(cache_key)
+        if cached is not None and not cached.fresh:
+            headers = {**headers, **cached.conditional_headers()}
+        return cache_key, cached, headers
+
+    def _encode_body(
+        self, data: Optional[Dict[str, Any]], headers: Mapping[str, str]
+    ) -> Tuple[Optional[bytes], Mapping[str, str]]:
+        """リクエスト本文をエンコードし、必要なら Content-Type を加える"""
+        if data is None:
+            return None, headers
+        body = self.codec.dumps(data)
+        if "Content-Type" not in headers and "Content-Type" not in self.session.headers:
+            headers = {**headers, "Content-Type": "application/json"}
+        return body, headers
+
+    def _complete(
+        self,
+        method: str,
+        endpoint: str,
+        template: str,
+        response: Any,
+        cache_key: Optional[Any],
+        cached: Optional[CacheEntry],
+    ) -> Dict[str, Any]:
+        """レスポンスをデコードし、キャッシュへの保存か破棄を行って結果を返す"""
+        if cached is not None and response.status_code == 304:
+            return {"success": True, "data": self.cache.revalidated(cache_key, cached)}  # type: ignore[union-attr]
+
+        if self.metrics is None:
+            payload = self._decode(response)
+        else:
+            decode_started = time.perf_counter()
+            payload = self._decode(response)
+            self.metrics.observe(
+                "decode", template, time.perf_counter() - decode_started
+            )
+        if self.cache is not None:
+            if cache_key is not None:
+                self.cache.store(
+                    cache_key,
+                    template,
+                    payload,
+                    response.headers,
+                    len(response.content),
+                )
+            elif method != "GET":
+                self.cache.invalidate_for_write(template, endpoint)
+        return {"success": True, "data": payload}
+
+    def _start_request_span(
+        self,
+        tracer: Tracer,
+        method: str,
+        endpoint: str,
+        template: str,
+        attempt: int,
+        kwargs: Dict[str, Any],
+    ) -> Span:
+        """送信1回分の子スパンを開始する"""
+        return tracer.start_span(
+            f"{method} {template}",
+            {
+                "http.request.method": method,
+                "http.route": template,
+                "url.path": endpoint,
+                "http.request.resend_count": attempt - 1,
+                "http.request.body.size": len(kwargs.get(self._BODY_KWARG) or b""),
+            },
+        )
+
+    def _record_response(self, span: Span, response: Any) -> None:
+        """受け取ったレスポンスをスパンに記録する"""
+        span.set_attribute("http.response.status_code", response.status_code)
+        span.set_attribute("http.response.body.size", len(response.content))
+
+    def _record_attempt(
+        self,
+        method: str,
+        template: str,
+        sent: float,
+        response: Optional[Any],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """1回の送信を metrics に記録する"""
+        self.metrics.record_attempt(  # type: ignore
+            method,
+            template,
+            response.status_code if response is not None else None,
+            time.perf_counter() - sent,
+            len(kwargs.get(self._BODY_KWARG) or b""),
+            len(response.content) if response is not None else 0,
+        )
+
+    def _decode(self, response: Any) -> Any:
+        """レスポンス本文をJSONとして解釈する"""
+        try:
+            return self.codec.loads(response.content)
+        except ValueError as error:
+            raise APIError(
+                message=f"レスポンスの解析に失敗しました: {str(error)}",
+                status_code=response.status_code,
+            )
+
+    def _build(self, template: str, func: Callable[..., T], *args: Any) -> T:
+        """
+        func(*args) でモデルを生成し、metrics があれば所要時間を build として記録する
+        """
+        if self.metrics is None:
+            return func(*args)
+        started = time.perf_counter()
+        result = func(*args)
+        self.metrics.observe("build", template, time.perf_counter() - started)
+        return result
+
+    def _profile_map(self) -> ProfileIdentityMap:
+        """1ページ分のモデル生成で使う識別マップ（未設定ならページ単位で作る）"""
+        if self.identity_map is not None:
+            return self.identity_map
+        return ProfileIdentityMap()
+
+    def _sync_cookies(self) -> None:
+        """クッキーストアが更新されていればセッションに反映する"""
+        if self.cookie_store.refresh() or (
+            self._cookie_version != self.cookie_store.version
+        ):
+            self._cookie_version = self.cookie_store.apply(self.session)
+
+    def _next_retry_delay(
+        self,
+        error: Exception,
+        attempt: int,
+        previous_delay: float,
+        elapsed: float,
+        idempotent: bool,
+    ) -> Optional[float]:
+        """
+        失敗したリクエストを再試行するまでの待機時間を求める
+
+        Returns:
+            Optional[float]: 待機秒数。再試行しない場合はNone
+        """
+        response = getattr(error, "response", None)
+        return self.retry_policy.next_delay(
+            attempt=attempt,
+            previous_delay=previous_delay,
+            elapsed=elapsed,
+            idempotent=idempotent,
+            status_code=response.status_code if response is not None else None,
+            retry_after=(
+                parse_retry_after(response.headers.get("Retry-After"))
+                if response is not None
+                else None
+            ),
+            sent=self._was_sent(error),
+        )
+
+    def _handle_request_error(self, error: Exception) -> None:
+        """
+        リクエストエラーを処理する
+
+        Args:
+            error (Exception): requests / httpx で発生したエラー
+
+        Raises:
+            APIError: 整形されたAPIエラー
+        """
+        response = getattr(error, "response", None)
+        status_code = response.status_code if response is not None else None
+        try:
+            response_data = (
+                self.codec.loads(response.content) if response is not None else None
+            )
+        except ValueError:
+            response_data = None
+        raise APIError(
+            message=f"APIリクエストに失敗しました: {str(error)}",
+            status_code=status_code,
+            response=response_data,
+        )
+
+    def _format_response(
+        self, response: Dict[str, Any], key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        APIレスポンスを整形する
+
+        Args:
+            response (Dict[str, Any]): 生のAPIレスポンス
+            key (Optional[str], optional): 抽出するデータのキー
+
+        Returns:
+            Dict[str, Any]: 整形されたレスポンス
+        """
+        if key and key in response.get("data", {}):
+            return {"success": True, "data": response["data"][key]}
+        return response
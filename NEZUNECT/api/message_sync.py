@@ -0,0 +1,298 @@
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from ..utils.codec import JSONCodec
+from ..utils.timestamps import parse_timestamp
+from .messages import Message, MessageProfile, MessagesAPI
+
+
+@dataclass
+class SyncState:
+    """相手ごとの同期状態"""
+
+    receiver_id: str
+    newest_id: Optional[str]
+    newest_at: Optional[str]
+    stored: int
+    backfill_done: bool
+
+
+def _load(
+    codec: JSONCodec, data: Union[bytes, str], shared: Dict[Any, MessageProfile]
+) -> Message:
+    fields: Dict[str, Any] = codec.loads(data)
+    for key in ("profile", "receiver"):
+        # 同じ内容のプロフィールは読み込み1回分の中で1つのインスタンスを共有する
+        profile = fields[key]
+        identity = tuple(profile.items())
+        if identity not in shared:
+            shared[identity] = MessageProfile(**profile)
+        fields[key] = shared[identity]
+    return Message(**fields)
+
+
+class MessageSync:
+    """
+    メッセージ履歴をSQLiteのローカルストアに相手（receiver_id）ごとに同期する
+
+    ストアには最新側から途切れなく保存する。sync() は最新側から既知の
+    メッセージに達するまでのページだけを取得し、過去分は backfill() が
+    保存済みの件数を skip にして遡る。どちらも途中で止めても、次の実行は
+    ストアの内容から再開する。
+    """
+
+    def __init__(self, messages_api: MessagesAPI, path: str) -> None:
+        """
+        MessageSyncクラスの初期化
+
+        Args:
+            messages_api (MessagesAPI): メッセージの取得に使うAPI
+            path (str): SQLiteファイルのパス
+        """
+        self.messages_api = messages_api
+        self.path = path
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS messages ("
+            "receiver_id TEXT NOT NULL, message_id TEXT NOT NULL, "
+            "created_at TEXT NOT NULL, data TEXT NOT NULL, "
+            "PRIMARY KEY (receiver_id, message_id))"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS messages_created "
+            "ON messages (receiver_id, created_at)"
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS sync_state ("
+            "receiver_id TEXT PRIMARY KEY, newest_id TEXT, newest_at TEXT, "
+            "backfill_done INTEGER NOT NULL DEFAULT 0)"
+        )
+
+    def state(self, receiver_id: str) -> SyncState:
+        """相手ごとの同期状態を返す"""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT newest_id, newest_at, backfill_done FROM sync_state "
+                "WHERE receiver_id = ?",
+                (receiver_id,),
+            ).fetchone()
+            stored = self._count(receiver_id)
+        newest_id, newest_at, done = row or (None, None, 0)
+        return SyncState(receiver_id, newest_id, newest_at, stored, bool(done))
+
+    def sync(self, receiver_id: str) -> int:
+        """
+        新着メッセージを取得してストアに保存する
+
+        前回の最新メッセージを含むページに達した時点で取得をやめる。
+        初回は最新の1ページだけを保存し、それより古い分は backfill() に任せる。
+
+        Args:
+            receiver_id (str): 相手のプロフィールID
+
+        Returns:
+            int: 新たに保存したメッセージ数
+
+        Raises:
+            APIError: メッセージの取得に失敗した場合
+        """
+        state = self.state(receiver_id)
+        newest_at = _instant(state.newest_at)
+        added = 0
+        skip = 0
+        newest: Optional[Message] = None
+        while True:
+            page = self.messages_api.get_messages(receiver_id, skip)["data"]
+            if not page:
+                break
+            newest = newest or page[0]
+            added += self._store(receiver_id, page)
+            if state.newest_id is None or any(
+                message.message_id == state.newest_id
+                or _older(message.created_at, newest_at)
+                for message in page
+            ):
+                break
+            skip += len(page)
+        # 途中で失敗した場合は次回も既知の位置まで遡れるよう、最後に更新する
+        if newest is not None:
+            self._set_newest(receiver_id, newest)
+        return added
+
+    def backfill(self, receiver_id: str, max_pages: Optional[int] = None) -> int:
+        """
+        保存済みより古いメッセージを遡って保存する
+
+        Args:
+            receiver_id (str): 相手のプロフィールID
+            max_pages (Optional[int]): 今回取得する最大ページ数。省略時は最後まで
+
+        Returns:
+            int: 新たに保存したメッセージ数
+
+        Raises:
+            APIError: メッセージの取得に失敗した場合
+        """
+        if self.state(receiver_id).backfill_done:
+            return 0
+        # 最新側を埋めてから、保存済みの件数を skip にして遡る
+        self.sync(receiver_id)
+        skip = self.state(receiver_id).stored
+
+        added = 0
+        pages = 0
+        while not self._stop.is_set() and (max_pages is None or pages < max_pages):
+            page = self.messages_api.get_messages(receiver_id, skip)["data"]
+            pages += 1
+            if not page:
+                # 空の会話では sync() が行を作らないため、ここでも作る
+                self._update_state(receiver_id, "backfill_done = 1", ())
+                break
+            added += self._store(receiver_id, page)
+            skip += len(page)
+        return added
+
+    def start_backfill(
+        self, receiver_ids: Iterable[str], pages_per_turn: int = 5
+    ) -> threading.Thread:
+        """
+        バックグラウンドスレッドで backfill() を実行する
+
+        相手ごとに pages_per_turn ページずつ順番に遡り、全員分が終わるか
+        stop_backfill() が呼ばれるまで続ける。
+
+        Returns:
+            threading.Thread: 実行中のスレッド
+        """
+        pending = list(receiver_ids)
+        self._stop.clear()
+
+        def run() -> None:
+            while pending and not self._stop.is_set():
+                receiver_id = pending.pop(0)
+                self.backfill(receiver_id, max_pages=pages_per_turn)
+                if not self.state(receiver_id).backfill_done:
+                    pending.append(receiver_id)
+
+        thread = threading.Thread(target=run, name="MessageBackfill", daemon=True)
+        thread.start()
+        return thread
+
+    def stop_backfill(self) -> None:
+        """実行中の backfill() を現在のページの保存後に止める"""
+        self._stop.set()
+
+    def messages(self, receiver_id: str, limit: Optional[int] = None) -> List[Message]:
+        """
+        ストアからメッセージを読み込む
+
+        Args:
+            receiver_id (str): 相手のプロフィールID
+            limit (Optional[int]): 最大件数
+
+        Returns:
+            List[Message]: メッセージ（新しい順）
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT data FROM messages WHERE receiver_id = ? "
+                "ORDER BY created_at DESC LIMIT ?",
+                (receiver_id, -1 if limit is None else limit),
+            ).fetchall()
+        shared: Dict[Any, MessageProfile] = {}
+        return [_load(self.messages_api.codec, data, shared) for (data,) in rows]
+
+    def close(self) -> None:
+        self.stop_backfill()
+        self._connection.close()
+
+    def _count(self, receiver_id: str) -> int:
+        (count,) = self._connection.execute(
+            "SELECT COUNT(*) FROM messages WHERE receiver_id = ?", (receiver_id,)
+        ).fetchone()
+        return count
+
+    def _store(self, receiver_id: str, page: List[Message]) -> int:
+        dumps = self.messages_api.codec.dumps
+        rows = [
+            (
+                receiver_id,
+                message.message_id,
+                message.created_at,
+                dumps(asdict(message)),
+            )
+            for message in page
+        ]
+        with self._lock:
+            connection = self._connection
+            before = connection.total_changes
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.executemany(
+                    "INSERT OR IGNORE INTO messages VALUES (?, ?, ?, ?)", rows
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            return connection.total_changes - before
+
+    def _set_newest(self, receiver_id: str, message: Message) -> None:
+        self._update_state(
+            receiver_id,
+            "newest_id = ?, newest_at = ?",
+            (message.message_id, message.created_at),
+        )
+
+    def _update_state(
+        self, receiver_id: str, assignments: str, values: Tuple[Any, ...]
+    ) -> None:
+        # ON CONFLICT ... DO UPDATE は SQLite 3.24 以降のため、
+        # INSERT OR IGNORE と UPDATE を1つのトランザクションで実行する
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT OR IGNORE INTO sync_state (receiver_id) VALUES (?)",
+                    (receiver_id,),
+                )
+                connection.execute(
+                    f"UPDATE sync_state SET {assignments} WHERE receiver_id = ?",
+                    (*values, receiver_id),
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+
+def _instant(value: Optional[str]) -> Optional[datetime]:
+    """
+    createdAt を比較できる日時にする（Z / +00:00 や小数秒の桁数の違いを吸収する）
+
+    タイムゾーンのない日時はUTCとして扱い、解析できない場合はNoneを返す。
+    """
+    try:
+        parsed = parse_timestamp(value)
+    except ValueError:
+        return None
+    if parsed is not None and parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _older(created_at: str, newest_at: Optional[datetime]) -> bool:
+    """created_at が前回の最新メッセージより古いかどうか"""
+    if newest_at is None:
+        return False
+    instant = _instant(created_at)
+    return instant is not None and instant < newest_at
@@ -1,14 +1,21 @@
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional
 
 from requests import Session
 
 from ..config import Config
 from ..utils.agent import Headers
+from ..utils.cookies import CookieStore
 from ..utils.exceptions import APIError
+from ..utils.identity import ProfileIdentityMap, intern_profile
+from ..utils.lazy import decode_list
+from ..utils.models import frozen_variant, slotted
+from ..utils.pagination import paginate
 from .base import BaseAPI
 
 
+@slotted
 @dataclass
 class MessageProfile:
     """メッセージの送信者/受信者のプロフィール情報を表すデータクラス"""
@@ -45,6 +52,7 @@ class MessageProfile:
         )
 
 
+@slotted
 @dataclass
 class Message:
     """メッセージ情報を表すデータクラス"""
@@ -59,8 +67,14 @@ class Message:
     receiver: MessageProfile
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Message":
-        """APIレスポンスからMessageインスタンスを生成"""
+    def from_dict(
+        cls, data: Dict[str, Any], profiles: Optional[ProfileIdentityMap] = None
+    ) -> "Message":
+        """
+        APIレスポンスからMessageインスタンスを生成
+
+        profiles を渡すと送信者/受信者のプロフィールを profileId ごとに共有する
+        """
         return cls(
             message_id=data.get("messageId", ""),
             text=data.get("text", ""),
@@ -68,8 +82,8 @@ class Message:
             read_at=data.get("readAt"),
             assets=data.get("assets", []),
             reactions=data.get("reactions", []),
-            profile=MessageProfile.from_dict(data.get("profile", {})),
-            receiver=MessageProfile.from_dict(data.get("receiver", {})),
+            profile=intern_profile(profiles, MessageProfile, data.get("profile", {})),
+            receiver=intern_profile(profiles, MessageProfile, data.get("receiver", {})),
         )
 
     def format_message(self) -> str:
@@ -95,26 +109,42 @@ class Message:
         )
 
 
+# 変更できない（frozen）版。freeze() で既存のインスタンスを変換できる
+FrozenMessageProfile = frozen_variant(MessageProfile)
+FrozenMessage = frozen_variant(Message)
+
+
 class MessagesAPI(BaseAPI):
     """メッセージ関連のAPI操作を管理するクラス"""
 
-    def __init__(self, session: Optional[Session] = None):
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        cookie_store: Optional[CookieStore] = None,
+        **options: Any,
+    ):
         """
         MessagesAPIクラスの初期化
 
         Args:
             session (Optional[Session]): 共有セッション。指定がない場合は新規作成。
+            cookie_store (Optional[CookieStore]): 共有クッキーストア
+            **options: BaseAPIに渡す追加設定
         """
-        super().__init__(session)
-        self.headers = Headers.get_plain_text("messages")
+        super().__init__(session, cookie_store, **options)
+        self.headers = Headers.page_plain_text("messages")
 
-    def get_messages(self, receiver_id: str, skip: int = 0) -> Dict[str, Any]:
+    def get_messages(
+        self, receiver_id: str, skip: int = 0, lazy: bool = False
+    ) -> Dict[str, Any]:
         """
         特定のユーザーとのメッセージ履歴を取得
 
         Args:
             receiver_id (str): 相手のプロフィールID
             skip (int): スキップするメッセージ数（デフォルト: 0）
+            lazy (bool, optional): True ならアクセスされるまでモデルを生成しない
+                LazyModelList を返す
 
         Returns:
             Dict[str, Any]: 成功時はメッセージリストを含むレスポンス
@@ -123,14 +153,20 @@ class MessagesAPI(BaseAPI):
             APIError: APIリクエストが失敗した場合
         """
         try:
-            response = self._request(
+            response = self._make_request(
                 "GET",
-                f"{Config.Endpoints.MESSAGES.format(receiver_id=receiver_id)}?skip={skip}",
+                Config.Endpoints.MESSAGES.format(receiver_id=receiver_id),
                 headers=self.headers,
+                params={"skip": skip},
+            )
+            profiles = self._profile_map()
+            messages = self._build(
+                Config.Endpoints.MESSAGES,
+                decode_list,
+                response["data"].get("messages", []),
+                partial(Message.from_dict, profiles=profiles),
+                lazy,
             )
-            messages = [
-                Message.from_dict(msg) for msg in response["data"].get("messages", [])
-            ]
             return {"success": True, "data": messages}
         except APIError as e:
             raise APIError(
@@ -156,14 +192,7 @@ class MessagesAPI(BaseAPI):
         Raises:
             APIError: APIリクエストが失敗した場合
         """
-        headers = Headers.get_plain_text(f"messages/{receiver_id}")
-        headers.update(
-            {
-                "Content-Type": "text/plain;charset=UTF-8",
-                "Origin": "https://subnect.com",
-                "Referer": "https://subnect.com/messages/user_s0ma",
-            }
-        )
+        headers = Headers.page_plain_text(f"messages/{receiver_id}")
 
         data = {
             "text": text,
@@ -172,13 +201,15 @@ class MessagesAPI(BaseAPI):
         }
 
         try:
-            response = self._request(
+            response = self._make_request(
                 "POST",
-                f"{Config.Endpoints.MESSAGES.format(receiver_id=receiver_id)}",
+                Config.Endpoints.MESSAGES.format(receiver_id=receiver_id),
                 headers=headers,
                 data=data,
             )
-            message = Message.from_dict(response["data"]["messageData"])
+            message = Message.from_dict(
+                response["data"]["messageData"], self.identity_map
+            )
             return {"success": True, "data": message}
         except APIError as e:
             raise APIError(
@@ -186,3 +217,33 @@ class MessagesAPI(BaseAPI):
                 status_code=e.status_code,
                 response=e.response,
             )
+
+    def iter_messages(
+        self,
+        receiver_id: str,
+        *,
+        start: int = 0,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Message]:
+        """
+        特定のユーザーとのメッセージ履歴を全ページにわたって1件ずつ返す
+
+        Args:
+            receiver_id (str): 相手のプロフィールID
+            start (int, optional): 最初の skip
+            page_size (Optional[int], optional): 1ページの件数（省略時は推定）
+            prefetch (bool, optional): 次のページを先読みするかどうか
+
+        Yields:
+            Message: メッセージ（新しい順）
+
+        Raises:
+            APIError: APIリクエストが失敗した場合
+        """
+        return paginate(
+            lambda skip: self.get_messages(receiver_id, skip)["data"],
+            start=start,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
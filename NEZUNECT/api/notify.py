@@ -1,15 +1,23 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Dict, Iterator, Optional, Sequence
 
 from requests import Session
 
 from ..config import Config
 from ..utils.agent import Headers
+from ..utils.cookies import CookieStore
 from ..utils.exceptions import APIError
+from ..utils.identity import ProfileIdentityMap, intern_profile
+from ..utils.lazy import decode_list
+from ..utils.models import frozen_variant, slotted
+from ..utils.pagination import paginate
+from ..utils.timestamps import lazy_timestamp
 from .base import BaseAPI
 
 
+@slotted
 @dataclass
 class Notification:
     """通知情報を表すデータクラス"""
@@ -17,47 +25,68 @@ class Notification:
     notification_id: str
     type: str
     text: str
-    created_at: datetime
+    created_at: Optional[datetime] = lazy_timestamp()
     read: bool
     profile: Dict[str, Any]
     post: Optional[Dict[str, Any]] = None
 
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> "Notification":
-        """辞書からNotificationインスタンスを生成"""
+    def from_dict(
+        cls, data: Dict[str, Any], profiles: Optional[ProfileIdentityMap] = None
+    ) -> "Notification":
+        """
+        辞書からNotificationインスタンスを生成
+
+        profiles を渡すとプロフィールの辞書を profileId ごとに共有する
+        """
         return cls(
             notification_id=data.get("notificationId", ""),
             type=data.get("type", ""),
             text=data.get("text", ""),
-            created_at=datetime.fromisoformat(data.get("createdAt", "")),
+            created_at=data.get("createdAt", ""),
             read=data.get("read", False),
-            profile=data.get("profile", {}),
+            profile=intern_profile(profiles, dict, data.get("profile", {})),
             post=data.get("post"),
         )
 
 
+# 変更できない（frozen）版。freeze() で既存のインスタンスを変換できる
+FrozenNotification = frozen_variant(Notification)
+
+
 class NotifyAPI(BaseAPI):
     """通知関連のAPI操作を管理するクラス"""
 
-    def __init__(self, session: Optional[Session] = None) -> None:
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        cookie_store: Optional[CookieStore] = None,
+        **options: Any,
+    ) -> None:
         """
         NotifyAPIクラスの初期化
 
         Args:
             session (Optional[Session]): リクエストセッション
+            cookie_store (Optional[CookieStore]): 共有クッキーストア
+            **options: BaseAPIに渡す追加設定
         """
-        super().__init__(session)
-        self.headers = Headers.get_json("notifications")
+        super().__init__(session, cookie_store, **options)
+        self.headers = Headers.page_json("notifications")
 
-    def get_notifications(self, skip: int = 0) -> Dict[str, List[Notification]]:
+    def get_notifications(
+        self, skip: int = 0, lazy: bool = False
+    ) -> Dict[str, Sequence[Notification]]:
         """
         通知一覧を取得
 
         Args:
             skip (int, optional): スキップする通知数。デフォルトは0。
+            lazy (bool, optional): True ならアクセスされるまでモデルを生成しない
+                LazyModelList を返す
 
         Returns:
-            Dict[str, List[Notification]]: 通知のリスト
+            Dict[str, Sequence[Notification]]: 通知のリスト
 
         Raises:
             APIError: 通知の取得に失敗した場合
@@ -68,10 +97,42 @@ class NotifyAPI(BaseAPI):
                 f"{Config.Endpoints.NOTIFICATIONS}",
                 params={"skip": skip},
             )
-            notifications = [
-                Notification.from_dict(notif)
-                for notif in response["data"].get("notifications", [])
-            ]
+            profiles = self._profile_map()
+            notifications = self._build(
+                Config.Endpoints.NOTIFICATIONS,
+                decode_list,
+                response["data"].get("notifications", []),
+                partial(Notification.from_dict, profiles=profiles),
+                lazy,
+            )
             return {"success": True, "data": notifications}
         except APIError as error:
             raise APIError(f"通知の取得に失敗しました: {str(error)}", error.status_code)
+
+    def iter_notifications(
+        self,
+        *,
+        start: int = 0,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Notification]:
+        """
+        通知を全ページにわたって1件ずつ返す
+
+        Args:
+            start (int, optional): 最初の skip
+            page_size (Optional[int], optional): 1ページの件数（省略時は推定）
+            prefetch (bool, optional): 次のページを先読みするかどうか
+
+        Yields:
+            Notification: 通知
+
+        Raises:
+            APIError: 通知の取得に失敗した場合
+        """
+        return paginate(
+            lambda skip: self.get_notifications(skip)["data"],
+            start=start,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
@@ -1,15 +1,24 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from requests import Session
 
 from ..config import Config
 from ..utils.agent import Headers
+from ..utils.batch import BulkReport, run_bulk
+from ..utils.cookies import CookieStore
 from ..utils.exceptions import APIError
+from ..utils.identity import ProfileIdentityMap, intern_profile
+from ..utils.lazy import decode_list
+from ..utils.models import frozen_variant, slotted
+from ..utils.pagination import paginate
+from ..utils.timestamps import lazy_timestamp
 from .base import BaseAPI
 
 
+@slotted
 @dataclass
 class PostAsset:
     """投稿のアセット情報を表すデータクラス"""
@@ -20,7 +29,19 @@ class PostAsset:
     spoiler: bool
     alt_text: Optional[str] = None
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PostAsset":
+        """辞書からPostAssetインスタンスを生成"""
+        return cls(
+            asset_id=data.get("assetId", ""),
+            asset_url=data.get("assetUrl", ""),
+            asset_type=data.get("assetType", ""),
+            spoiler=data.get("spoiler", False),
+            alt_text=data.get("altText"),
+        )
+
 
+@slotted
 @dataclass
 class PostProfile:
     """投稿者のプロフィール情報を表すデータクラス"""
@@ -32,7 +53,7 @@ class PostProfile:
     icon_url: Optional[str]
     is_official: bool
     plan_name: str
-    created_at: datetime
+    created_at: Optional[datetime] = lazy_timestamp()
     is_following: bool
     is_follower: bool
     is_blocking: bool
@@ -48,25 +69,87 @@ class PostProfile:
             icon_url=data.get("icon", {}).get("assetUrl"),
             is_official=data.get("official", False),
             plan_name=data.get("planName", ""),
-            created_at=datetime.fromisoformat(data.get("createdAt", "")),
+            created_at=data.get("createdAt", ""),
             is_following=data.get("isFollowing", False),
             is_follower=data.get("isFollower", False),
             is_blocking=data.get("isBlocking", False),
         )
 
 
+@slotted
+@dataclass
+class Post:
+    """投稿情報を表すデータクラス"""
+
+    post_id: str
+    text: str
+    created_at: Optional[datetime] = lazy_timestamp()
+    scope: str
+    is_repost: bool
+    is_edited: bool
+    replies_count: int
+    quote_count: int
+    repost_count: int
+    reaction_count: int
+    like_count: int
+    reactions: List[Dict[str, Any]]
+    user_reaction: Optional[str]
+    is_liked: bool
+    is_reposted: bool
+    profile: PostProfile
+    assets: List[PostAsset]
+
+    @classmethod
+    def from_dict(
+        cls, data: Dict[str, Any], profiles: Optional[ProfileIdentityMap] = None
+    ) -> "Post":
+        """辞書からPostインスタンスを生成"""
+        return cls(
+            post_id=data.get("postId", ""),
+            text=data.get("text", ""),
+            created_at=data.get("createdAt", ""),
+            scope=data.get("scope", ""),
+            is_repost=data.get("repost", False),
+            is_edited=data.get("edited", False),
+            replies_count=data.get("repliesCount", 0),
+            quote_count=data.get("quoteCount", 0),
+            repost_count=data.get("repostCount", 0),
+            reaction_count=data.get("reactionCount", 0),
+            like_count=data.get("likeCount", 0),
+            reactions=data.get("reactions", []),
+            user_reaction=data.get("userReaction"),
+            is_liked=data.get("isLiked", False),
+            is_reposted=data.get("isReposted", False),
+            profile=intern_profile(profiles, PostProfile, data.get("profile", {})),
+            assets=[PostAsset.from_dict(asset) for asset in data.get("assets", [])],
+        )
+
+
+# 変更できない（frozen）版。freeze() で既存のインスタンスを変換できる
+FrozenPostAsset = frozen_variant(PostAsset)
+FrozenPostProfile = frozen_variant(PostProfile)
+FrozenPost = frozen_variant(Post)
+
+
 class PostsAPI(BaseAPI):
     """投稿関連のAPI操作を管理するクラス"""
 
-    def __init__(self, session: Optional[Session] = None) -> None:
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        cookie_store: Optional[CookieStore] = None,
+        **options: Any,
+    ) -> None:
         """
         PostsAPIクラスの初期化
 
         Args:
             session (Optional[Session]): リクエストセッション
+            cookie_store (Optional[CookieStore]): 共有クッキーストア
+            **options: BaseAPIに渡す追加設定
         """
-        super().__init__(session)
-        self.headers = Headers.get_json("home")
+        super().__init__(session, cookie_store, **options)
+        self.headers = Headers.page_json("home")
 
     def create_post(
         self,
@@ -75,6 +158,7 @@ class PostsAPI(BaseAPI):
         assets: List[str] = [],
         scope: str = "public",
         scheduled_at: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
     ) -> Dict[str, Any]:
         """
         投稿を作成する
@@ -84,6 +168,8 @@ class PostsAPI(BaseAPI):
             assets (List[str], optional): アセットIDのリスト
             scope (str, optional): 公開範囲
             scheduled_at (Optional[str], optional): 投稿予定日時（ISO 8601形式）
+            idempotency_key (Optional[str], optional): 冪等キー。指定した場合のみ
+                送信失敗時に再試行する
 
         Returns:
             Dict[str, Any]: 作成された投稿の情報
@@ -105,6 +191,7 @@ class PostsAPI(BaseAPI):
                 "POST",
                 Config.Endpoints.POSTS,
                 data=data,
+                idempotency_key=idempotency_key,
             )
             return self._format_response(response, "post")
         except APIError as error:
@@ -133,3 +220,205 @@ class PostsAPI(BaseAPI):
             raise APIError(
                 f"いいねの追加に失敗しました: {str(error)}", error.status_code
             )
+
+    def post_repost(self, post_id: str) -> Dict[str, Any]:
+        """
+        投稿をリポストする
+
+        Args:
+            post_id (str): リポストする投稿のID
+
+        Returns:
+            Dict[str, Any]: リポストの結果情報
+
+        Raises:
+            APIError: リポストに失敗した場合
+        """
+        try:
+            response = self._make_request(
+                "POST",
+                Config.Endpoints.REPOST.format(post_id=post_id),
+            )
+            return response
+        except APIError as error:
+            raise APIError(f"リポストに失敗しました: {str(error)}", error.status_code)
+
+    def like_posts(
+        self,
+        post_ids: Iterable[str],
+        *,
+        max_concurrency: int = 4,
+        resume: Optional[BulkReport] = None,
+        max_failures: Optional[int] = None,
+    ) -> BulkReport:
+        """
+        複数の投稿に並行していいねを付ける
+
+        失敗した投稿は BulkReport.failed に入り、全体は中断しない。
+        送信レートは rate_limiter の posts_write で制限される。
+
+        Args:
+            post_ids (Iterable[str]): いいねを付ける投稿のID
+            max_concurrency (int, optional): 同時に実行するリクエスト数
+            resume (Optional[BulkReport], optional): 前回の結果。成功済みの投稿は送信しない
+            max_failures (Optional[int], optional): この件数失敗した時点で中断する
+
+        Returns:
+            BulkReport: 成功・失敗・スキップした投稿ID
+        """
+        return run_bulk(
+            self.like_post,
+            post_ids,
+            max_concurrency=max_concurrency,
+            resume=resume,
+            max_failures=max_failures,
+        )
+
+    def repost_many(
+        self,
+        post_ids: Iterable[str],
+        *,
+        max_concurrency: int = 4,
+        resume: Optional[BulkReport] = None,
+        max_failures: Optional[int] = None,
+    ) -> BulkReport:
+        """
+        複数の投稿を並行してリポストする
+
+        引数と戻り値は like_posts() と同じ。
+        """
+        return run_bulk(
+            self.post_repost,
+            post_ids,
+            max_concurrency=max_concurrency,
+            resume=resume,
+            max_failures=max_failures,
+        )
+
+    def search_post(
+        self, query: str, skip: int = 0, hours: int = 168
+    ) -> Dict[str, List[Post]]:
+        """
+        投稿を検索する
+
+        Args:
+            query (str): 検索キーワード
+            skip (int, optional): スキップする投稿数。デフォルトは0。
+            hours (int, optional): 検索対象の期間（時間）。デフォルトは168。
+
+        Returns:
+            Dict[str, List[Post]]: 投稿のリスト
+
+        Raises:
+            APIError: 投稿の検索に失敗した場合
+        """
+        try:
+            response = self._make_request(
+                "GET",
+                Config.Endpoints.SEARCH_POSTS,
+                params={"query": query, "skip": skip, "hours": hours},
+            )
+            profiles = self._profile_map()
+            posts = self._build(
+                Config.Endpoints.SEARCH_POSTS,
+                decode_list,
+                response["data"].get("posts", []),
+                partial(Post.from_dict, profiles=profiles),
+                False,
+            )
+            return {"success": True, "data": posts}
+        except APIError as error:
+            raise APIError(f"投稿の検索に失敗しました: {str(error)}", error.status_code)
+
+    def get_top_posts(self, skip: int = 0) -> Dict[str, List[Post]]:
+        """
+        トップ投稿を取得する
+
+        Args:
+            skip (int, optional): スキップする投稿数。デフォルトは0。
+
+        Returns:
+            Dict[str, List[Post]]: 投稿のリスト
+
+        Raises:
+            APIError: トップ投稿の取得に失敗した場合
+        """
+        try:
+            response = self._make_request(
+                "GET",
+                Config.Endpoints.TOP_POSTS,
+                params={"skip": skip},
+            )
+            profiles = self._profile_map()
+            posts = self._build(
+                Config.Endpoints.TOP_POSTS,
+                decode_list,
+                response["data"].get("posts", []),
+                partial(Post.from_dict, profiles=profiles),
+                False,
+            )
+            return {"success": True, "data": posts}
+        except APIError as error:
+            raise APIError(
+                f"トップ投稿の取得に失敗しました: {str(error)}", error.status_code
+            )
+
+    def iter_search(
+        self,
+        query: str,
+        *,
+        hours: int = 168,
+        start: int = 0,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Post]:
+        """
+        検索結果を全ページにわたって1件ずつ返す
+
+        Args:
+            query (str): 検索キーワード
+            hours (int, optional): 検索対象の期間（時間）
+            start (int, optional): 最初の skip
+            page_size (Optional[int], optional): 1ページの件数（省略時は推定）
+            prefetch (bool, optional): 次のページを先読みするかどうか
+
+        Yields:
+            Post: 投稿
+
+        Raises:
+            APIError: 投稿の検索に失敗した場合
+        """
+        return paginate(
+            lambda skip: self.search_post(query, skip, hours)["data"],
+            start=start,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_top_posts(
+        self,
+        *,
+        start: int = 0,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[Post]:
+        """
+        トップ投稿を全ページにわたって1件ずつ返す
+
+        Args:
+            start (int, optional): 最初の skip
+            page_size (Optional[int], optional): 1ページの件数（省略時は推定）
+            prefetch (bool, optional): 次のページを先読みするかどうか
+
+        Yields:
+            Post: 投稿
+
+        Raises:
+            APIError: トップ投稿の取得に失敗した場合
+        """
+        return paginate(
+            lambda skip: self.get_top_posts(skip)["data"],
+            start=start,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
@@ -1,15 +1,20 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, Optional
 
 from requests import Session
 
 from ..config import Config
 from ..utils.agent import Headers
+from ..utils.batch import BatchResult, run_batch
+from ..utils.cookies import CookieStore
 from ..utils.exceptions import APIError
+from ..utils.models import frozen_variant, slotted
+from ..utils.timestamps import lazy_timestamp
 from .base import BaseAPI
 
 
+@slotted
 @dataclass
 class ProfileInfo:
     """プロフィール情報を表すデータクラス"""
@@ -23,7 +28,7 @@ class ProfileInfo:
     is_follower: bool
     following_count: int
     followers_count: int
-    created_at: datetime
+    created_at: Optional[datetime] = lazy_timestamp()
     is_official: bool
 
     @classmethod
@@ -39,17 +44,26 @@ class ProfileInfo:
             is_follower=data.get("isFollower", False),
             following_count=data.get("followingCount", 0),
             followers_count=data.get("followersCount", 0),
-            created_at=datetime.fromisoformat(data.get("createdAt", "")),
+            created_at=data.get("createdAt", ""),
             is_official=data.get("official", False),
         )
 
 
+# 変更できない（frozen）版。freeze() で既存のインスタンスを変換できる
+FrozenProfileInfo = frozen_variant(ProfileInfo)
+
+
 class ProfileAPI(BaseAPI):
     """プロフィール関連のAPI操作を管理するクラス"""
 
-    def __init__(self, session: Optional[Session] = None) -> None:
-        super().__init__(session)
-        self.headers = Headers.get_json("profile")
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        cookie_store: Optional[CookieStore] = None,
+        **options: Any,
+    ) -> None:
+        super().__init__(session, cookie_store, **options)
+        self.headers = Headers.page_json("profile")
 
     def get_profile(self, username: str) -> Dict[str, ProfileInfo]:
         """
@@ -67,15 +81,46 @@ class ProfileAPI(BaseAPI):
         try:
             response = self._make_request(
                 "GET",
-                f"{Config.Endpoints.PROFILE}/{username}",
+                Config.Endpoints.PROFILE_USER.format(username=username),
+            )
+            profile = self._build(
+                Config.Endpoints.PROFILE_USER, ProfileInfo.from_dict, response["data"]
             )
-            profile = ProfileInfo.from_dict(response["data"])
             return {"success": True, "data": profile}
         except APIError as error:
             raise APIError(
                 f"プロフィール情報の取得に失敗しました: {str(error)}", error.status_code
             )
 
+    def get_profiles(
+        self,
+        usernames: Iterable[str],
+        *,
+        max_concurrency: int = 8,
+        ordered: bool = False,
+    ) -> Iterator[BatchResult[ProfileInfo]]:
+        """
+        複数ユーザーのプロフィール情報を並行して取得
+
+        共有セッションの接続プール上で最大 max_concurrency 件を同時に取得する。
+        失敗したユーザーは BatchResult.error に APIError が入り、バッチ全体は中断しない。
+        max_concurrency は TransportConfig.pool_maxsize 以下にすると接続が使い回される。
+
+        Args:
+            usernames (Iterable[str]): ユーザー名
+            max_concurrency (int, optional): 同時に実行するリクエスト数
+            ordered (bool, optional): 入力順に返すかどうか。Falseなら完了順
+
+        Yields:
+            BatchResult[ProfileInfo]: ユーザー名ごとの結果
+        """
+        return run_batch(
+            lambda username: self.get_profile(username)["data"],
+            usernames,
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        )
+
     def update_profile(
         self,
         *,
@@ -1,15 +1,21 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, Optional, Sequence
 
 from requests import Session
 
 from ..config import Config
 from ..utils.agent import Headers
+from ..utils.cookies import CookieStore
 from ..utils.exceptions import APIError
+from ..utils.lazy import decode_list
+from ..utils.models import frozen_variant, slotted
+from ..utils.pagination import paginate
+from ..utils.timestamps import lazy_timestamp
 from .base import BaseAPI
 
 
+@slotted
 @dataclass
 class SessionInfo:
     """セッション情報を表すデータクラス"""
@@ -24,7 +30,7 @@ class SessionInfo:
     city: str
     latitude: str
     longitude: str
-    created_at: datetime
+    created_at: Optional[datetime] = lazy_timestamp()
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SessionInfo":
@@ -40,26 +46,39 @@ class SessionInfo:
             city=data.get("city", ""),
             latitude=data.get("latitude", ""),
             longitude=data.get("longitude", ""),
-            created_at=datetime.fromisoformat(data.get("createdAt", "")),
+            created_at=data.get("createdAt", ""),
         )
 
 
+# 変更できない（frozen）版。freeze() で既存のインスタンスを変換できる
+FrozenSessionInfo = frozen_variant(SessionInfo)
+
+
 class SessionsAPI(BaseAPI):
     """セッション関連のAPI操作を管理するクラス"""
 
-    def __init__(self, session: Optional[Session] = None) -> None:
-        super().__init__(session)
-        self.headers = Headers.get_json("sessions")
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        cookie_store: Optional[CookieStore] = None,
+        **options: Any,
+    ) -> None:
+        super().__init__(session, cookie_store, **options)
+        self.headers = Headers.page_json("sessions")
 
-    def get_sessions(self, skip: int = 0) -> Dict[str, List[SessionInfo]]:
+    def get_sessions(
+        self, skip: int = 0, lazy: bool = False
+    ) -> Dict[str, Sequence[SessionInfo]]:
         """
         セッション情報を取得
 
         Args:
             skip (int, optional): スキップするセッション数。デフォルトは0。
+            lazy (bool, optional): True ならアクセスされるまでモデルを生成しない
+                LazyModelList を返す
 
         Returns:
-            Dict[str, List[SessionInfo]]: セッション情報のリスト
+            Dict[str, Sequence[SessionInfo]]: セッション情報のリスト
 
         Raises:
             APIError: セッション情報の取得に失敗した場合
@@ -70,12 +89,43 @@ class SessionsAPI(BaseAPI):
                 Config.Endpoints.SESSIONS,
                 params={"skip": skip},
             )
-            sessions = [
-                SessionInfo.from_dict(session)
-                for session in response["data"].get("sessions", [])
-            ]
+            sessions = self._build(
+                Config.Endpoints.SESSIONS,
+                decode_list,
+                response["data"].get("sessions", []),
+                SessionInfo.from_dict,
+                lazy,
+            )
             return {"success": True, "data": sessions}
         except APIError as error:
             raise APIError(
                 f"セッション情報の取得に失敗しました: {str(error)}", error.status_code
             )
+
+    def iter_sessions(
+        self,
+        *,
+        start: int = 0,
+        page_size: Optional[int] = None,
+        prefetch: bool = False,
+    ) -> Iterator[SessionInfo]:
+        """
+        セッション情報を全ページにわたって1件ずつ返す
+
+        Args:
+            start (int, optional): 最初の skip
+            page_size (Optional[int], optional): 1ページの件数（省略時は推定）
+            prefetch (bool, optional): 次のページを先読みするかどうか
+
+        Yields:
+            SessionInfo: セッション情報
+
+        Raises:
+            APIError: セッション情報の取得に失敗した場合
+        """
+        return paginate(
+            lambda skip: self.get_sessions(skip)["data"],
+            start=start,
+            page_size=page_size,
+            prefetch=prefetch,
+        )
@@ -5,10 +5,13 @@ from requests import Session
 
 from ..config import Config
 from ..utils.agent import Headers
+from ..utils.cookies import CookieStore
 from ..utils.exceptions import APIError
+from ..utils.models import frozen_variant, slotted
 from .base import BaseAPI
 
 
+@slotted
 @dataclass
 class ThemeSettings:
     """テーマ設定を表すデータクラス"""
@@ -20,12 +23,21 @@ class ThemeSettings:
     font_color: Optional[str] = None
 
 
+# 変更できない（frozen）版。freeze() で既存のインスタンスを変換できる
+FrozenThemeSettings = frozen_variant(ThemeSettings)
+
+
 class SettingsAPI(BaseAPI):
     """設定関連のAPI操作を管理するクラス"""
 
-    def __init__(self, session: Optional[Session] = None) -> None:
-        super().__init__(session)
-        self.headers = Headers.get_json("settings")
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        cookie_store: Optional[CookieStore] = None,
+        **options: Any,
+    ) -> None:
+        super().__init__(session, cookie_store, **options)
+        self.headers = Headers.page_json("settings")
 
     def change_dark_mode(self, dark_mode: bool) -> Dict[str, Any]:
         """
@@ -69,7 +81,7 @@ class SettingsAPI(BaseAPI):
             response = self._make_request(
                 "PUT",
                 Config.Endpoints.LANGUAGE,
-                headers=Headers.get_plain_text("settings/account"),
+                headers=Headers.page_plain_text("settings/account"),
                 data={"language": None if language == "auto" else language},
             )
             return response
@@ -96,7 +108,7 @@ class SettingsAPI(BaseAPI):
             response = self._make_request(
                 "PUT",
                 Config.Endpoints.THEME,
-                headers=Headers.get_plain_text("settings/theme"),
+                headers=Headers.page_plain_text("settings/theme"),
                 data={color_type: color},
             )
             return response
@@ -105,15 +117,12 @@ class SettingsAPI(BaseAPI):
                 f"カスタムカラーの変更に失敗しました: {str(error)}", error.status_code
             )
 
-    def change_notification_settings(
-        self, notification_sound: bool, messages_following_only: bool
-    ) -> Dict[str, Any]:
+    def change_notification_sound(self, notification_sound: bool) -> Dict[str, Any]:
         """
-        通知設定を変更
+        通知音の設定を変更
 
         Args:
             notification_sound (bool): 通知音を有効にするかどうか
-            messages_following_only (bool): フォロー中のユーザーからのみメッセージを受信するかどうか
 
         Returns:
             Dict[str, Any]: 変更結果
@@ -122,18 +131,64 @@ class SettingsAPI(BaseAPI):
             APIError: 設定の変更に失敗した場合
         """
         try:
-            sound_response = self._make_request(
+            response = self._make_request(
                 "PUT",
                 Config.Endpoints.NOTIFICATION_SOUND,
-                headers=Headers.get_plain_text("settings/notification"),
+                headers=Headers.page_plain_text("settings/notification"),
                 data={"notification_sound": notification_sound},
             )
+            return response
+        except APIError as error:
+            raise APIError(
+                f"通知音の設定の変更に失敗しました: {str(error)}", error.status_code
+            )
 
-            following_response = self._make_request(
+    def change_messages_following_only(self, following_only: bool) -> Dict[str, Any]:
+        """
+        メッセージの受信制限を変更
+
+        Args:
+            following_only (bool): フォロー中のユーザーからのみメッセージを受信するかどうか
+
+        Returns:
+            Dict[str, Any]: 変更結果
+
+        Raises:
+            APIError: 設定の変更に失敗した場合
+        """
+        try:
+            response = self._make_request(
                 "PUT",
                 Config.Endpoints.MESSAGES_FOLLOWING_ONLY,
-                headers=Headers.get_plain_text("settings/security"),
-                data={"messagesFollowingOnly": messages_following_only},
+                headers=Headers.page_plain_text("settings/security"),
+                data={"messagesFollowingOnly": following_only},
+            )
+            return response
+        except APIError as error:
+            raise APIError(
+                f"メッセージ設定の変更に失敗しました: {str(error)}", error.status_code
+            )
+
+    def change_notification_settings(
+        self, notification_sound: bool, messages_following_only: bool
+    ) -> Dict[str, Any]:
+        """
+        通知設定を変更
+
+        Args:
+            notification_sound (bool): 通知音を有効にするかどうか
+            messages_following_only (bool): フォロー中のユーザーからのみメッセージを受信するかどうか
+
+        Returns:
+            Dict[str, Any]: 変更結果
+
+        Raises:
+            APIError: 設定の変更に失敗した場合
+        """
+        try:
+            sound_response = self.change_notification_sound(notification_sound)
+            following_response = self.change_messages_following_only(
+                messages_following_only
             )
 
             return {
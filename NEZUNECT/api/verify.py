@@ -4,14 +4,20 @@ from requests import Session
 
 from ..config import Config
 from ..utils.agent import Headers
+from ..utils.cookies import CookieStore
 from ..utils.exceptions import APIError
 from .base import BaseAPI
 
 
 class VerifyAPI(BaseAPI):
-    def __init__(self, session: Optional[Session] = None):
-        super().__init__(session)
-        self.headers = Headers.get_json("verify")
+    def __init__(
+        self,
+        session: Optional[Session] = None,
+        cookie_store: Optional[CookieStore] = None,
+        **options: Any,
+    ):
+        super().__init__(session, cookie_store, **options)
+        self.headers = Headers.page_json("verify")
 
     def verify_email(self, email: str, code: str) -> Dict[str, Any]:
         """
@@ -30,7 +36,7 @@ class VerifyAPI(BaseAPI):
         data = {"email": email, "code": code}
 
         try:
-            response = self._request(
+            response = self._make_request(
                 "PUT",
                 Config.Endpoints.EMAIL_VERIFY,
                 headers=self.headers,
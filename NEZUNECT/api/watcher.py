@@ -0,0 +1,246 @@
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Deque, List, Optional, Set, Tuple
+
+from ..utils.exceptions import APIError
+from .notify import Notification, NotifyAPI
+
+logger = logging.getLogger(__name__)
+
+# (created_at, notification_id) の組で表す既読位置
+Watermark = Tuple[datetime, str]
+
+
+@dataclass
+class WatcherStats:
+    """NotificationWatcher の統計情報"""
+
+    polls: int = 0
+    requests: int = 0
+    delivered: int = 0
+    poll_errors: int = 0
+    callback_errors: int = 0
+    truncated: int = 0
+
+
+class NotificationWatcher:
+    """
+    通知をポーリングし、新着の Notification を登録されたコールバックに渡す
+
+    既読位置（watermark）より新しい通知だけをページ単位で遡って取得し、
+    既読の通知に達した時点で取得をやめる。新着があればポーリング間隔を
+    min_interval に戻し、新着がなければ backoff 倍ずつ max_interval まで延ばす。
+    コールバックはワーカースレッドで実行するため、通知間の実行順は保証しない。
+    """
+
+    def __init__(
+        self,
+        notify_api: NotifyAPI,
+        *,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 2.0,
+        max_pages: int = 5,
+        max_workers: int = 4,
+        watermark: Optional[Watermark] = None,
+        deliver_existing: bool = False,
+        remember: int = 1000,
+    ) -> None:
+        """
+        NotificationWatcherクラスの初期化
+
+        Args:
+            notify_api (NotifyAPI): 通知の取得に使うAPI
+            min_interval (float): 最短のポーリング間隔（秒）
+            max_interval (float): 最長のポーリング間隔（秒）
+            backoff (float): 新着がなかったときに間隔に掛ける倍率
+            max_pages (int): 1回のポーリングで遡る最大ページ数
+            max_workers (int): コールバックを実行するスレッド数
+            watermark (Optional[Watermark]): 前回の既読位置。再起動時の再開に使う
+                （タイムゾーンのない日時はUTCとして扱う）
+            deliver_existing (bool): watermark がない最初のポーリングで、
+                取得済みの通知もコールバックに渡すかどうか
+            remember (int): 重複排除のために覚えておく通知IDの数
+        """
+        self.notify_api = notify_api
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_pages = max_pages
+        self.max_workers = max_workers
+        if watermark is not None:
+            watermark = (_aware(watermark[0]), watermark[1])
+        self.watermark = watermark
+        self.deliver_existing = deliver_existing
+        self.interval = min_interval
+        self.stats = WatcherStats()
+        self._callbacks: List[Callable[[Notification], Any]] = []
+        self._recent: Deque[str] = deque(maxlen=remember)
+        self._recent_ids: Set[str] = set()
+        self._seeded = watermark is not None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def on_notification(
+        self, callback: Callable[[Notification], Any]
+    ) -> Callable[[Notification], Any]:
+        """
+        新着通知を受け取るコールバックを登録する（デコレータとしても使える）
+        """
+        self._callbacks.append(callback)
+        return callback
+
+    def poll(self) -> List[Notification]:
+        """
+        1回ポーリングして新着通知を取得し、コールバックに渡す
+
+        Returns:
+            List[Notification]: 新着通知（古い順）
+
+        Raises:
+            APIError: 通知の取得に失敗した場合
+        """
+        first = not self._seeded
+        max_pages = 1 if first and not self.deliver_existing else self.max_pages
+        self.stats.polls += 1
+
+        new: List[Notification] = []
+        skip = 0
+        for _ in range(max_pages):
+            page = self.notify_api.get_notifications(skip)["data"]
+            self.stats.requests += 1
+            fresh = [item for item in page if not self._seen(item)]
+            new.extend(fresh)
+            if not page or len(fresh) < len(page):
+                break
+            skip += len(page)
+        else:
+            if not first or self.deliver_existing:
+                # 既読位置まで遡れなかった分の古い新着は、既読位置が進むと取得されない
+                self.stats.truncated += 1
+                logger.warning(
+                    "新着通知が %d ページを超えたため、それより古い新着を取得していません",
+                    max_pages,
+                )
+
+        new.reverse()
+        for notification in new:
+            self._remember(notification)
+        self._seeded = True
+        if first and not self.deliver_existing:
+            return []
+        self._dispatch(new)
+        return new
+
+    def start(self) -> "NotificationWatcher":
+        """バックグラウンドスレッドでポーリングを開始する"""
+        if self._thread is not None:
+            return self
+        self._stop.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self._thread = threading.Thread(
+            target=self._run, name="NotificationWatcher", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self, wait: bool = True) -> None:
+        """
+        ポーリングを停止する
+
+        Args:
+            wait (bool): 実行中のコールバックの完了を待つかどうか
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def __enter__(self) -> "NotificationWatcher":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            # 最初のポーリングは新着がなくても間隔を延ばさない
+            seeding = not self._seeded
+            try:
+                active = bool(self.poll()) or seeding
+            except APIError as error:
+                self.stats.poll_errors += 1
+                logger.warning("通知の取得に失敗しました: %s", error)
+                active = False
+            except Exception:
+                # 想定外の例外でもポーリングのスレッドを止めない
+                self.stats.poll_errors += 1
+                logger.exception("通知のポーリング中にエラーが発生しました")
+                active = False
+            if active:
+                self.interval = self.min_interval
+            else:
+                self.interval = min(self.max_interval, self.interval * self.backoff)
+            self._stop.wait(self.interval)
+
+    def _seen(self, notification: Notification) -> bool:
+        if notification.notification_id in self._recent_ids:
+            return True
+        if self.watermark is None:
+            return False
+        created_at, notification_id = self.watermark
+        if notification.notification_id == notification_id:
+            return True
+        return (
+            notification.created_at is not None
+            and _aware(notification.created_at) < created_at
+        )
+
+    def _remember(self, notification: Notification) -> None:
+        if len(self._recent) == self._recent.maxlen:
+            self._recent_ids.discard(self._recent[0])
+        self._recent.append(notification.notification_id)
+        self._recent_ids.add(notification.notification_id)
+        if notification.created_at is None:
+            return
+        created_at = _aware(notification.created_at)
+        if self.watermark is None or created_at >= self.watermark[0]:
+            self.watermark = (created_at, notification.notification_id)
+
+    def _dispatch(self, notifications: List[Notification]) -> None:
+        for notification in notifications:
+            for callback in self._callbacks:
+                if self._executor is None:
+                    self._deliver(callback, notification)
+                else:
+                    self._executor.submit(self._deliver, callback, notification)
+
+    def _deliver(
+        self, callback: Callable[[Notification], Any], notification: Notification
+    ) -> None:
+        try:
+            callback(notification)
+            with self._lock:
+                self.stats.delivered += 1
+        except Exception:
+            with self._lock:
+                self.stats.callback_errors += 1
+            logger.exception(
+                "通知コールバックの実行に失敗しました: %s", notification.notification_id
+            )
+
+
+def _aware(value: datetime) -> datetime:
+    """タイムゾーンのない日時をUTCとして扱い、既読位置と比較できるようにする"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
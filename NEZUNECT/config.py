@@ -15,6 +15,7 @@ class Config:
         NOTIFICATIONS = "/notifications"
         NOTIFICATION_SOUND = "/users/profiles/notifications/sound"
         PROFILE = "/users/profiles"
+        PROFILE_USER = "/users/profiles/{username}"
         PROFILE_EMAIL = "/users/email"
         PROFILE_USERNAME = "/users/profiles/username"
         SESSIONS = "/users/sessions"
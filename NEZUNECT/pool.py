@@ -0,0 +1,429 @@
+import logging
+import sys
+import threading
+import time
+import zlib
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Deque, Iterable, Iterator, List, Mapping, Optional
+
+from . import NEZUNECT
+from .config import Config
+from .utils.exceptions import APIError
+from .utils.hooks import EVENTS, Hooks, RequestContext
+from .utils.ratelimit import RateLimit, RateLimiter
+from .utils.transport import TransportConfig
+
+logger = logging.getLogger(__name__)
+
+ROUTING_POLICIES = ("round_robin", "least_loaded", "sticky")
+
+# アカウントごとにプールが用意する NEZUNECT の引数（**options では渡せない）
+_POOL_OPTIONS = ("cookie", "session", "rate_limiter")
+
+# 呼び出しが終わった後も動き続けるオブジェクトを返すため、プール経由では呼べないメソッド
+_UNROUTED = ("watch_notifications", "message_sync")
+
+# on_error はpriorityの大きい順に呼ばれるため、利用者のフックが回復させる前にエラーを記録できる
+_OBSERVER_PRIORITY = sys.maxsize
+
+
+@dataclass(frozen=True)
+class ErrorBudget:
+    """
+    アカウントごとのエラー予算
+
+    window 秒以内に max_errors 回失敗（接続エラー、429、5xx）したアカウントは
+    cooldown 秒間ルーティング対象から外す。
+
+    Args:
+        max_errors (int): window 内に許容する失敗回数
+        window (float): 失敗を数える期間（秒）
+        cooldown (float): 予算を使い切ったアカウントを外しておく秒数
+    """
+
+    max_errors: int = 5
+    window: float = 60.0
+    cooldown: float = 30.0
+
+
+@dataclass
+class AccountStats:
+    """PoolAccount の統計情報"""
+
+    calls: int = 0
+    errors: int = 0
+    unauthorized: int = 0
+    benched: int = 0
+
+
+class PoolAccount:
+    """NEZUNECTPool が管理する1アカウント分のクライアントと状態"""
+
+    def __init__(self, name: str, client: NEZUNECT) -> None:
+        self.name = name
+        self.client = client
+        self.in_flight = 0
+        self.stats = AccountStats()
+        self.benched_until = 0.0
+        self.bench_reason: Optional[str] = None
+        self._errors: Deque[float] = deque()
+        self._cookie_version = 0
+
+    @property
+    def benched(self) -> bool:
+        """ルーティング対象から外されているかどうか"""
+        return self.bench_reason is not None
+
+    def __repr__(self) -> str:
+        state = f"benched={self.bench_reason!r}" if self.benched else "available"
+        return f"PoolAccount({self.name!r}, in_flight={self.in_flight}, {state})"
+
+
+class NEZUNECTPool:
+    """
+    複数アカウントの NEZUNECT を1つのコネクションプール上で使い分けるプール
+
+    アカウントごとにクッキーとレート制限（RateLimiter）とエラー予算を持ち、
+    HTTPの接続だけを共有する。プールに対して NEZUNECT と同じメソッドを呼ぶと、
+    policy に従って選んだアカウントで実行する。
+
+    - round_robin: 利用可能なアカウントを順番に使う
+    - least_loaded: 実行中の呼び出しが最も少ないアカウントを使う
+    - sticky: for_key() / lease() に渡したキーごとに同じアカウントを使う
+      （キーがなければ least_loaded と同じ）
+
+    401 を受けたアカウントはクッキーファイルが更新されるまで自動的に外す。
+    エラーは各アカウントの on_error フックで記録するため、get_profiles() や
+    like_posts() の個々の失敗、iter_* の途中のページの失敗もエラー予算に数える。
+    iter_* などイテレータを返すメソッドは、最後まで取得するか閉じるまで
+    アカウントを借りたままにする。
+    """
+
+    def __init__(
+        self,
+        cookies: Iterable[str],
+        *,
+        policy: str = "round_robin",
+        transport: Optional[TransportConfig] = None,
+        rate_limits: Optional[Mapping[str, Optional[RateLimit]]] = None,
+        error_budget: Optional[ErrorBudget] = None,
+        **options: Any,
+    ) -> None:
+        """
+        NEZUNECTPoolクラスの初期化
+
+        Args:
+            cookies (Iterable[str]): アカウントごとのクッキーJSONファイルのパス
+            policy (str): ルーティング方式（ROUTING_POLICIES のいずれか）
+            transport (Optional[TransportConfig]): 共有するコネクションプールの設定。
+                pool_maxsize は全アカウント合計の同時実行数に合わせる
+            rate_limits (Optional[Mapping[str, Optional[RateLimit]]]): アカウントごとの
+                レート制限。指定しないファミリーは DEFAULT_LIMITS を使う
+            error_budget (Optional[ErrorBudget]): アカウントごとのエラー予算
+            **options: 各アカウントの NEZUNECT に渡す追加設定（retry_policy, codec など）。
+                cache を渡すと全アカウントで共有されるため、公開データに限ること。
+                cookie, session, rate_limiter はプールが用意するため指定できない。
+                hooks は作成時の登録内容をアカウントごとにコピーして使う
+
+        Raises:
+            ValueError: policy が未知の場合、アカウントがない・重複している場合、
+                または options にプールが用意する引数が含まれている場合
+        """
+        if policy not in ROUTING_POLICIES:
+            raise ValueError(f"未知のルーティング方式です: {policy}")
+        names = list(cookies)
+        if not names:
+            raise ValueError("アカウントが指定されていません")
+        if len(set(names)) != len(names):
+            raise ValueError("同じクッキーファイルが複数指定されています")
+        reserved = sorted(set(options) & set(_POOL_OPTIONS))
+        if reserved:
+            raise ValueError(
+                f"{', '.join(reserved)} はプールが設定するため指定できません"
+                "（レート制限は rate_limits で指定してください）"
+            )
+
+        self.policy = policy
+        self.transport = transport or TransportConfig()
+        self.error_budget = error_budget or ErrorBudget()
+        self.adapter = self.transport.create_adapter()
+        self.accounts: List[PoolAccount] = []
+        self._next = 0
+        self._lock = threading.Lock()
+        hooks: Optional[Hooks] = options.pop("hooks", None)
+        for name in names:
+            account_hooks = _copy_hooks(hooks)
+            client = NEZUNECT(
+                cookie=name,
+                transport=self.transport,
+                rate_limiter=RateLimiter(rate_limits),
+                session=self.transport.create_session(self.adapter),
+                hooks=account_hooks,
+                **options,
+            )
+            account = PoolAccount(name, client)
+            account_hooks.on_error(
+                partial(self._observe_error, account), priority=_OBSERVER_PRIORITY
+            )
+            self.accounts.append(account)
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
+    @property
+    def available(self) -> List[PoolAccount]:
+        """現在ルーティング対象になっているアカウント"""
+        self._refresh_cookies()
+        now = time.monotonic()
+        with self._lock:
+            return [account for account in self.accounts if self._usable(account, now)]
+
+    def account(self, name: str) -> PoolAccount:
+        """
+        名前（クッキーファイルのパス）からアカウントを取得する
+
+        Raises:
+            KeyError: 該当するアカウントがない場合
+        """
+        for account in self.accounts:
+            if account.name == name:
+                return account
+        raise KeyError(name)
+
+    def acquire(self, key: Optional[str] = None) -> PoolAccount:
+        """
+        policy に従ってアカウントを選び、実行中の呼び出し数を1増やす
+
+        使い終わったら release() を呼ぶこと（通常は lease() を使う）。
+
+        Args:
+            key (Optional[str]): sticky で使うルーティングキー
+
+        Returns:
+            PoolAccount: 選ばれたアカウント
+
+        Raises:
+            APIError: 利用可能なアカウントがない場合
+        """
+        self._refresh_cookies()
+        now = time.monotonic()
+        with self._lock:
+            count = len(self.accounts)
+            start = self._next % count
+            candidates = [
+                account
+                for account in self.accounts[start:] + self.accounts[:start]
+                if self._usable(account, now)
+            ]
+            if not candidates:
+                raise APIError("利用可能なアカウントがありません")
+            if self.policy == "sticky" and key is not None:
+                chosen = max(candidates, key=partial(_rendezvous, key))
+            elif self.policy == "round_robin":
+                chosen = candidates[0]
+            else:
+                chosen = min(candidates, key=lambda account: account.in_flight)
+            self._next = self.accounts.index(chosen) + 1
+            chosen.in_flight += 1
+            chosen.stats.calls += 1
+            return chosen
+
+    def release(self, account: PoolAccount) -> None:
+        """
+        acquire() したアカウントを返す
+
+        呼び出しのエラーはアカウントの on_error フックで記録済みのため、ここでは扱わない。
+
+        Args:
+            account (PoolAccount): acquire() で得たアカウント
+        """
+        with self._lock:
+            account.in_flight -= 1
+
+    def record_error(self, account: PoolAccount, error: APIError) -> None:
+        """
+        アカウントで発生したエラーをエラー予算に反映する
+
+        401 ならクッキーファイルが更新されるまで、接続エラー・429・5xx が
+        エラー予算を超えたら error_budget.cooldown 秒間、アカウントを外す。
+
+        Args:
+            account (PoolAccount): エラーが発生したアカウント
+            error (APIError): 発生したエラー
+        """
+        status = error.status_code
+        now = time.monotonic()
+        with self._lock:
+            if status == 401:
+                account.stats.unauthorized += 1
+                account._cookie_version = account.client.cookie_store.version
+                self._bench(account, float("inf"), "unauthorized")
+            elif status is None or status == 429 or status >= 500:
+                account.stats.errors += 1
+                budget = self.error_budget
+                account._errors.append(now)
+                while account._errors and account._errors[0] <= now - budget.window:
+                    account._errors.popleft()
+                if len(account._errors) >= budget.max_errors:
+                    account._errors.clear()
+                    self._bench(account, now + budget.cooldown, "error_budget")
+
+    @contextmanager
+    def lease(self, key: Optional[str] = None) -> Iterator[NEZUNECT]:
+        """
+        アカウントを1つ借りて、そのクライアントを返すコンテキストマネージャ
+
+        Args:
+            key (Optional[str]): sticky で使うルーティングキー
+
+        Yields:
+            NEZUNECT: 選ばれたアカウントのクライアント
+        """
+        account = self.acquire(key)
+        try:
+            yield account.client
+        finally:
+            self.release(account)
+
+    def for_key(self, key: str) -> "_KeyedRouter":
+        """
+        ルーティングキーを固定した呼び出し口を返す（例: ``pool.for_key(uid).get_messages(uid)``）
+        """
+        return _KeyedRouter(self, key)
+
+    def bench(self, name: str, seconds: Optional[float] = None) -> None:
+        """
+        アカウントを手動でルーティング対象から外す
+
+        Args:
+            name (str): アカウント名
+            seconds (Optional[float]): 外しておく秒数。None なら restore() まで
+        """
+        account = self.account(name)
+        until = float("inf") if seconds is None else time.monotonic() + seconds
+        with self._lock:
+            self._bench(account, until, "manual")
+
+    def restore(self, name: str) -> None:
+        """外したアカウントをルーティング対象に戻す"""
+        account = self.account(name)
+        with self._lock:
+            self._restore(account)
+
+    def initialize(self) -> int:
+        """共有コネクションプールに transport.warmup_connections 本の接続を開く"""
+        return self.transport.warm_up(
+            self.accounts[0].client.session, f"{Config.BASE_URL}/"
+        )
+
+    def close(self) -> None:
+        for account in self.accounts:
+            account.client.close()
+
+    def __enter__(self) -> "NEZUNECTPool":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        """NEZUNECT の公開メソッドを、選んだアカウントで実行する関数として返す"""
+        return _routed(self, None, name)
+
+    def _call(self, key: Optional[str], name: str, *args: Any, **kwargs: Any) -> Any:
+        account = self.acquire(key)
+        try:
+            result = getattr(account.client, name)(*args, **kwargs)
+        except BaseException:
+            self.release(account)
+            raise
+        if isinstance(result, Iterator):
+            # iter_* などは取得し終わるまでリクエストが続くため、アカウントを借りたままにする
+            return self._hold(account, result)
+        self.release(account)
+        return result
+
+    def _hold(self, account: PoolAccount, iterator: Iterator[Any]) -> Iterator[Any]:
+        try:
+            yield from iterator
+        finally:
+            self.release(account)
+
+    def _observe_error(self, account: PoolAccount, context: RequestContext) -> None:
+        """アカウントのクライアントの on_error フック（値を返さず、エラーはそのまま送出される）"""
+        self.record_error(account, context.error)  # type: ignore[arg-type]
+
+    def _refresh_cookies(self) -> None:
+        """401 で外したアカウントのクッキーファイルを確認する（ファイルI/Oのためロックの外で呼ぶ）"""
+        for account in self.accounts:
+            if account.bench_reason == "unauthorized":
+                account.client.cookie_store.refresh()
+
+    def _usable(self, account: PoolAccount, now: float) -> bool:
+        if account.bench_reason is None:
+            return True
+        if account.bench_reason == "unauthorized":
+            if account.client.cookie_store.version != account._cookie_version:
+                self._restore(account)
+                return True
+            return False
+        if now >= account.benched_until:
+            self._restore(account)
+            return True
+        return False
+
+    def _bench(self, account: PoolAccount, until: float, reason: str) -> None:
+        if account.bench_reason is None:
+            account.stats.benched += 1
+            logger.warning(
+                "アカウントを一時的に除外します: %s (%s)", account.name, reason
+            )
+        account.benched_until = max(until, account.benched_until)
+        account.bench_reason = reason
+
+    def _restore(self, account: PoolAccount) -> None:
+        account.benched_until = 0.0
+        account.bench_reason = None
+        account._errors.clear()
+
+
+class _KeyedRouter:
+    """NEZUNECTPool.for_key() が返す、ルーティングキーを固定した呼び出し口"""
+
+    def __init__(self, pool: NEZUNECTPool, key: str) -> None:
+        self._pool = pool
+        self._key = key
+
+    def __getattr__(self, name: str) -> Any:
+        return _routed(self._pool, self._key, name)
+
+
+def _routed(pool: NEZUNECTPool, key: Optional[str], name: str) -> Any:
+    if name in _UNROUTED:
+        raise AttributeError(
+            f"{name} はプール経由では呼べません。"
+            "lease() で借りたクライアントから呼んでください"
+        )
+    if name.startswith("_") or not callable(getattr(NEZUNECT, name, None)):
+        raise AttributeError(
+            f"{type(pool).__name__!r} object has no attribute {name!r}"
+        )
+    return partial(pool._call, key, name)
+
+
+def _copy_hooks(hooks: Optional[Hooks]) -> Hooks:
+    """hooks の登録内容を引き継いだ、アカウント専用の Hooks を作る"""
+    copied = Hooks()
+    if hooks is not None:
+        for event in EVENTS:
+            for priority, _, hook in hooks.entries(event):
+                copied.register(event, hook, priority=priority)
+    return copied
+
+
+def _rendezvous(key: str, account: PoolAccount) -> int:
+    """キーとアカウントの組の重み（最大のアカウントを選ぶと、増減の影響が小さい）"""
+    return zlib.crc32(f"{key}\0{account.name}".encode("utf-8"))
@@ -0,0 +1,157 @@
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+from . import NEZUNECT
+from .config import Config
+from .utils.batch import BatchResult
+from .utils.exceptions import APIError
+
+T = TypeVar("T")
+
+# ワーカープロセスごとのクライアント（_init_worker で生成する）
+_client: Optional[NEZUNECT] = None
+
+
+def _init_worker(cookie: str, base_url: str, client_options: Dict[str, Any]) -> None:
+    global _client
+    Config.BASE_URL = base_url
+    _client = NEZUNECT(cookie=cookie, **client_options)
+
+
+def _run_chunk(
+    func: Callable[[NEZUNECT, Any], T], chunk: List[Any]
+) -> List[BatchResult[T]]:
+    results = []
+    for item in chunk:
+        try:
+            result = BatchResult(item, value=func(_client, item))  # type: ignore
+        except APIError as error:
+            # レスポンス本文は大きくなりうるため、メッセージとステータスだけを返す
+            result = BatchResult(item, error=APIError(error.message, error.status_code))
+        results.append(result)
+    return results
+
+
+class ShardedRunner(Generic[T]):
+    """
+    入力をプロセスプールのワーカーに分けて処理するランナー
+
+    各ワーカープロセスは起動時に自分の NEZUNECT を1つ生成し、func(client, item) を
+    実行する。デコード・モデル生成・後処理が GIL に縛られず、コア数に応じて並列化される。
+    要素は chunk_size 件ずつまとめて送受信し、結果はまとめて pickle されるため、
+    フィールド名などの共通の文字列は1チャンクにつき1回しか転送されない。
+
+    func と結果は pickle できる必要がある（モジュールのトップレベルで定義した関数を渡す）。
+    """
+
+    def __init__(
+        self,
+        func: Callable[[NEZUNECT, Any], T],
+        *,
+        cookie: str = "./cookie.json",
+        processes: Optional[int] = None,
+        chunk_size: int = 4,
+        client_options: Optional[Dict[str, Any]] = None,
+        mp_context: Optional[Any] = None,
+    ) -> None:
+        """
+        ShardedRunnerクラスの初期化
+
+        Args:
+            func (Callable[[NEZUNECT, Any], T]): ワーカーで要素ごとに呼び出す関数
+            cookie (str): ワーカーのクライアントが使うクッキーJSONファイルのパス
+            processes (Optional[int]): ワーカープロセス数。デフォルトはCPUコア数
+            chunk_size (int): 1回の受け渡しでまとめる要素数
+            client_options (Optional[Dict[str, Any]]): ワーカーの NEZUNECT に渡す追加設定
+                （retry_policy, rate_limiter など。pickle できるもの）
+            mp_context (Optional[Any]): multiprocessing のコンテキスト
+                （例: multiprocessing.get_context("spawn")）
+        """
+        self.func = func
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = max(1, chunk_size)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(cookie, Config.BASE_URL, dict(client_options or {})),
+        )
+
+    def map(
+        self, items: Iterable[Any], *, ordered: bool = False
+    ) -> Iterator[BatchResult[T]]:
+        """
+        items を各ワーカーで処理し、結果を1件ずつ返す
+
+        items は必要な分だけ読み進め、同時にワーカーへ渡すのはプロセス数の2倍の
+        チャンクまでにする。APIError は要素ごとの BatchResult.error として返す。
+
+        Args:
+            items (Iterable[Any]): 入力（受信者ID、ユーザー名、検索クエリなど）
+            ordered (bool, optional): 入力順に返すかどうか。Falseなら完了順
+
+        Yields:
+            BatchResult[T]: 要素ごとの結果
+        """
+        source = iter(items)
+        running: Set["Future[List[BatchResult[T]]]"] = set()
+        queue: Deque["Future[List[BatchResult[T]]]"] = deque()
+        max_pending = self.processes * 2
+
+        def fill() -> None:
+            while len(running) < max_pending:
+                chunk = list(islice(source, self.chunk_size))
+                if not chunk:
+                    return
+                future = self._executor.submit(_run_chunk, self.func, chunk)
+                running.add(future)
+                if ordered:
+                    queue.append(future)
+
+        try:
+            fill()
+            while running:
+                if ordered:
+                    future = queue.popleft()
+                    chunk_results = future.result()
+                    running.discard(future)
+                    fill()
+                    yield from chunk_results
+                else:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    running.difference_update(done)
+                    fill()
+                    for future in done:
+                        yield from future.result()
+        finally:
+            for future in running:
+                future.cancel()
+
+    def run(self, items: Iterable[Any]) -> List[BatchResult[T]]:
+        """map() の結果を入力順のリストで返す"""
+        return list(self.map(items, ordered=True))
+
+    def close(self, wait: bool = True) -> None:
+        """ワーカープロセスを終了する"""
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "ShardedRunner[T]":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -1,6 +1,77 @@
 # This file is intentionally left empty to mark the directory as a Python package.
 
+from importlib import import_module
+from typing import Any
+
 from .cookies import load_cookies
 from .exceptions import APIError
 
-__all__ = ["load_cookies", "APIError"]
+# サブモジュールは初回アクセス時に読み込む（asyncio や sqlite3 を必要になるまで読まないため）
+_LAZY_EXPORTS = {
+    "CookieStore": ".cookies",
+    "RetryPolicy": ".retry",
+    "RateLimit": ".ratelimit",
+    "RateLimiter": ".ratelimit",
+    "TransportConfig": ".transport",
+    "BatchResult": ".batch",
+    "BulkReport": ".batch",
+    "ResponseCache": ".cache",
+    "SQLiteCacheBackend": ".cache",
+    "SingleFlight": ".singleflight",
+    "JSONCodec": ".codec",
+    "get_codec": ".codec",
+    "slotted": ".models",
+    "frozen_variant": ".models",
+    "freeze": ".models",
+    "ProfileIdentityMap": ".identity",
+    "LazyModelList": ".lazy",
+    "MetricsRegistry": ".metrics",
+    "Hooks": ".hooks",
+    "RequestContext": ".hooks",
+    "GLOBAL_HOOKS": ".hooks",
+    "register_hook": ".hooks",
+    "Tracer": ".tracing",
+    "Span": ".tracing",
+    "SpanExporter": ".tracing",
+    "InMemorySpanExporter": ".tracing",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "CookieStore",
+    "load_cookies",
+    "APIError",
+    "RetryPolicy",
+    "RateLimit",
+    "RateLimiter",
+    "TransportConfig",
+    "BatchResult",
+    "BulkReport",
+    "ResponseCache",
+    "SQLiteCacheBackend",
+    "SingleFlight",
+    "JSONCodec",
+    "get_codec",
+    "slotted",
+    "frozen_variant",
+    "freeze",
+    "ProfileIdentityMap",
+    "LazyModelList",
+    "MetricsRegistry",
+    "Hooks",
+    "RequestContext",
+    "GLOBAL_HOOKS",
+    "register_hook",
+    "Tracer",
+    "Span",
+    "SpanExporter",
+    "InMemorySpanExporter",
+]
@@ -1,3 +1,11 @@
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
+JSON = "application/json"
+PLAIN_TEXT = "text/plain;charset=UTF-8"
+
+
 class UserAgent:
     @staticmethod
     def get():
@@ -11,23 +19,48 @@ class Referer:
 
 
 class Headers:
-    @staticmethod
-    def get(page: str, content_type: str = "application/json") -> dict:
-        headers = {
+    # 全リクエスト共通のヘッダー。セッションに一度だけ設定する
+    COMMON: Mapping[str, str] = MappingProxyType(
+        {
             "User-Agent": UserAgent.get(),
-            "Referer": Referer.get(page),
-            "Content-Type": content_type,
             "Origin": "https://subnect.com",
             "Sec-Ch-Ua": '"Chromium";v="122", "Not(A:Brand";v="24", "Google Chrome";v="122"',
             "Sec-Ch-Ua-Mobile": "?0",
             "Sec-Ch-Ua-Platform": '"Windows"',
         }
+    )
+
+    @staticmethod
+    def get(page: str, content_type: str = JSON) -> dict:
+        headers = dict(Headers.COMMON)
+        headers.update(Headers.page(page, content_type))
         return headers
 
     @staticmethod
     def get_json(page: str) -> dict:
-        return Headers.get(page, "application/json")
+        return Headers.get(page, JSON)
 
     @staticmethod
     def get_plain_text(page: str) -> dict:
-        return Headers.get(page, "text/plain;charset=UTF-8")
+        return Headers.get(page, PLAIN_TEXT)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def page(page: str, content_type: str = JSON) -> Mapping[str, str]:
+        """
+        ページごとの差分ヘッダー（Referer / Content-Type）を取得
+
+        (page, content_type) ごとに一度だけ生成した読み取り専用のマッピングを返す。
+        共通ヘッダーは ``Headers.COMMON`` としてセッション側に設定しておく。
+        """
+        return MappingProxyType(
+            {"Referer": Referer.get(page), "Content-Type": content_type}
+        )
+
+    @staticmethod
+    def page_json(page: str) -> Mapping[str, str]:
+        return Headers.page(page, JSON)
+
+    @staticmethod
+    def page_plain_text(page: str) -> Mapping[str, str]:
+        return Headers.page(page, PLAIN_TEXT)
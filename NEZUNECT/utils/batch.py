@@ -0,0 +1,318 @@
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from dataclasses import dataclass, field
+from itertools import chain
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+from .exceptions import APIError
+
+T = TypeVar("T")
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """バッチ処理の1件分の結果（成功時は value、失敗時は error を持つ）"""
+
+    item: Any
+    value: Optional[T] = None
+    error: Optional[APIError] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _call(func: Callable[[Any], T], item: Any) -> BatchResult[T]:
+    try:
+        return BatchResult(item, value=func(item))
+    except APIError as error:
+        return BatchResult(item, error=error)
+
+
+def run_batch(
+    func: Callable[[Any], T],
+    items: Iterable[Any],
+    *,
+    max_concurrency: int = 8,
+    ordered: bool = False,
+) -> Iterator[BatchResult[T]]:
+    """
+    func を items の各要素に並行して適用し、結果を1件ずつ返す
+
+    同時に実行するのは max_concurrency 件までで、items は必要な分だけ読み進める。
+    APIError は要素ごとの BatchResult.error として返し、バッチ全体は中断しない。
+
+    Args:
+        func (Callable[[Any], T]): 要素ごとに呼び出す関数
+        items (Iterable[Any]): 入力
+        max_concurrency (int, optional): 同時実行数
+        ordered (bool, optional): 入力順に返すかどうか。Falseなら完了順
+
+    Yields:
+        BatchResult[T]: 要素ごとの結果
+    """
+    source = iter(items)
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+    queue: Deque["Future[BatchResult[T]]"] = deque()
+    running: Set["Future[BatchResult[T]]"] = set()
+
+    def fill() -> None:
+        while len(running) < max_concurrency:
+            try:
+                item = next(source)
+            except StopIteration:
+                return
+            # 実行中のスパンなどのコンテキスト変数をワーカースレッドに引き継ぐ
+            future = executor.submit(copy_context().run, _call, func, item)
+            running.add(future)
+            queue.append(future)
+
+    try:
+        fill()
+        while running:
+            if ordered:
+                future = queue.popleft()
+                result = future.result()
+                running.discard(future)
+                fill()
+                yield result
+            else:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                running.difference_update(done)
+                fill()
+                for future in done:
+                    yield future.result()
+    finally:
+        for future in running:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def arun_batch(
+    func: Callable[[Any], Awaitable[T]],
+    items: Iterable[Any],
+    *,
+    max_concurrency: int = 8,
+    ordered: bool = False,
+) -> AsyncIterator[BatchResult[T]]:
+    """
+    run_batch() の非同期版。max_concurrency 個のワーカータスクで items を処理する
+    """
+    # 同期クライアントの import で asyncio を読み込まないよう、ここで読み込む
+    import asyncio
+
+    source = enumerate(items)
+    results: "asyncio.Queue[Any]" = asyncio.Queue()
+
+    async def worker() -> None:
+        try:
+            for index, item in source:
+                try:
+                    result = BatchResult(item, value=await func(item))
+                except APIError as error:
+                    result = BatchResult(item, error=error)
+                await results.put((index, result))
+        except Exception as error:
+            # APIError 以外の例外は呼び出し側で送出する
+            await results.put(error)
+        finally:
+            await results.put(None)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(max_concurrency)]
+    try:
+        finished = 0
+        next_index = 0
+        buffered: Dict[int, BatchResult[T]] = {}
+        while finished < len(workers):
+            entry = await results.get()
+            if entry is None:
+                finished += 1
+                continue
+            if isinstance(entry, Exception):
+                raise entry
+            index, result = entry
+            if not ordered:
+                yield result
+                continue
+            buffered[index] = result
+            while next_index in buffered:
+                yield buffered.pop(next_index)
+                next_index += 1
+    finally:
+        for task in workers:
+            task.cancel()
+
+
+@dataclass
+class BulkReport:
+    """
+    一括書き込みの結果
+
+    succeeded: 成功した要素（resume で引き継いだ分を含む）
+    failed: 今回失敗した要素と APIError
+    skipped: 送信しなかった要素（入力内の重複、max_failures による中断後の残り）
+    """
+
+    succeeded: List[Any] = field(default_factory=list)
+    failed: List[BatchResult[Any]] = field(default_factory=list)
+    skipped: List[Any] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed and not self.skipped
+
+    def pending(self) -> List[Any]:
+        """
+        まだ成功していない要素（失敗した要素と中断で残った要素）
+
+        同じ要素が failed と skipped の両方にある場合（入力内の重複など）も1回だけ返す。
+        """
+        seen = set(self.succeeded)
+        items = []
+        for item in chain((result.item for result in self.failed), self.skipped):
+            if item not in seen:
+                seen.add(item)
+                items.append(item)
+        return items
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSONに保存できる形式に変換"""
+        return {
+            "succeeded": list(self.succeeded),
+            "failed": [
+                {
+                    "item": result.item,
+                    "message": result.error.message if result.error else "",
+                    "statusCode": result.error.status_code if result.error else None,
+                }
+                for result in self.failed
+            ],
+            "skipped": list(self.skipped),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BulkReport":
+        """to_dict() の出力からBulkReportインスタンスを生成"""
+        return cls(
+            succeeded=list(data.get("succeeded", [])),
+            failed=[
+                BatchResult(
+                    entry["item"],
+                    error=APIError(entry.get("message", ""), entry.get("statusCode")),
+                )
+                for entry in data.get("failed", [])
+            ],
+            skipped=list(data.get("skipped", [])),
+        )
+
+
+class _BulkSource:
+    """重複と再開済みの要素を除き、中断後の残りを skipped に回す入力"""
+
+    def __init__(
+        self, items: Iterable[Any], report: BulkReport, max_failures: Optional[int]
+    ) -> None:
+        self._items = iter(items)
+        self._report = report
+        self._max_failures = max_failures
+        self._done = set(report.succeeded)
+        self._seen: Set[Any] = set()
+
+    def __iter__(self) -> "_BulkSource":
+        return self
+
+    def __next__(self) -> Any:
+        for item in self._items:
+            if self.aborted:
+                self._report.skipped.append(item)
+                continue
+            if item in self._done:
+                continue
+            if item in self._seen:
+                self._report.skipped.append(item)
+                continue
+            self._seen.add(item)
+            return item
+        raise StopIteration
+
+    @property
+    def aborted(self) -> bool:
+        return (
+            self._max_failures is not None
+            and len(self._report.failed) >= self._max_failures
+        )
+
+    def record(self, result: BatchResult[Any]) -> None:
+        if result.ok:
+            self._report.succeeded.append(result.item)
+        else:
+            self._report.failed.append(result)
+
+
+def _bulk_setup(
+    items: Iterable[Any], resume: Optional[BulkReport], max_failures: Optional[int]
+) -> "tuple[BulkReport, _BulkSource]":
+    report = BulkReport(succeeded=list(resume.succeeded) if resume else [])
+    return report, _BulkSource(items, report, max_failures)
+
+
+def run_bulk(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    *,
+    max_concurrency: int = 4,
+    resume: Optional[BulkReport] = None,
+    max_failures: Optional[int] = None,
+) -> BulkReport:
+    """
+    書き込み func を items の各要素に並行して適用し、結果をまとめて返す
+
+    rate_limiter が設定されたクライアントのメソッドを渡せば、同時実行数と
+    送信レートの両方が制限される。
+
+    Args:
+        func (Callable[[Any], Any]): 要素ごとに呼び出す書き込み関数
+        items (Iterable[Any]): 入力（重複は1回だけ送信する）
+        max_concurrency (int, optional): 同時実行数
+        resume (Optional[BulkReport], optional): 前回の結果。成功済みの要素は送信しない
+        max_failures (Optional[int], optional): この件数失敗した時点で新たな送信をやめる
+
+    Returns:
+        BulkReport: 成功・失敗・スキップした要素
+    """
+    report, source = _bulk_setup(items, resume, max_failures)
+    for result in run_batch(func, source, max_concurrency=max_concurrency):
+        source.record(result)
+    return report
+
+
+async def arun_bulk(
+    func: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any],
+    *,
+    max_concurrency: int = 4,
+    resume: Optional[BulkReport] = None,
+    max_failures: Optional[int] = None,
+) -> BulkReport:
+    """
+    run_bulk() の非同期版
+    """
+    report, source = _bulk_setup(items, resume, max_failures)
+    async for result in arun_batch(func, source, max_concurrency=max_concurrency):
+        source.record(result)
+    return report
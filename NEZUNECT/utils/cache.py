@@ -0,0 +1,407 @@
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Mapping, Optional, Tuple
+
+from ..config import Config
+from .codec import JSONCodec, get_codec
+
+if TYPE_CHECKING:
+    import sqlite3
+
+# テンプレートごとの既定のTTL（秒）
+DEFAULT_TTLS: Mapping[str, float] = {
+    Config.Endpoints.PROFILE_USER: 60.0,
+    Config.Endpoints.BOOKMARKS: 60.0,
+    Config.Endpoints.TOP_POSTS: 30.0,
+}
+
+# 書き込み先テンプレートと、成功時に破棄するキャッシュのテンプレート
+DEFAULT_INVALIDATIONS: Mapping[str, Tuple[str, ...]] = {
+    Config.Endpoints.PROFILE: (Config.Endpoints.PROFILE_USER,),
+    Config.Endpoints.PROFILE_EMAIL: (Config.Endpoints.PROFILE_USER,),
+    Config.Endpoints.PROFILE_USERNAME: (Config.Endpoints.PROFILE_USER,),
+    Config.Endpoints.POST_PIN: (Config.Endpoints.PROFILE_USER,),
+    Config.Endpoints.BOOKMARKS: (Config.Endpoints.BOOKMARKS,),
+    Config.Endpoints.BOOKMARK_ADD: (Config.Endpoints.BOOKMARKS,),
+    Config.Endpoints.POSTS: (Config.Endpoints.TOP_POSTS,),
+    Config.Endpoints.LIKE_POST: (Config.Endpoints.TOP_POSTS,),
+    Config.Endpoints.REPOST: (Config.Endpoints.TOP_POSTS,),
+    Config.Endpoints.REACTIONS: (Config.Endpoints.TOP_POSTS,),
+}
+
+
+@dataclass
+class CacheEntry:
+    """キャッシュされたレスポンス"""
+
+    template: str
+    data: Any
+    expires_at: float
+    size: int = 0
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        return time.monotonic() < self.expires_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """再検証用の If-None-Match / If-Modified-Since ヘッダー"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class CacheStats:
+    """キャッシュの統計情報"""
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    persistent_hits: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+
+class SQLiteCacheBackend:
+    """
+    ResponseCache の2段目として、デコード済みのレスポンスをSQLiteファイルに保存する
+
+    WALモードで開くため、同一ホストの複数プロセスから同時に読み取れる。
+    期限は壁時計の時刻で保存し、プロセスを再起動しても引き継がれる。
+    合計サイズが max_bytes を超えると、期限の近いものから削除する。
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        codec: Optional[JSONCodec] = None,
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.codec = codec or get_codec()
+        self._lock = threading.Lock()
+        # 永続層を使わないクライアントの import で sqlite3 を読み込まないよう、ここで読み込む
+        import sqlite3
+
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, endpoint TEXT NOT NULL, template TEXT NOT NULL, "
+            "data TEXT NOT NULL, size INTEGER NOT NULL, expires_at REAL NOT NULL, "
+            "etag TEXT, last_modified TEXT)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires_at)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_template ON responses (template)"
+        )
+
+    @staticmethod
+    def _encode_key(key: Hashable) -> str:
+        return json.dumps(key, ensure_ascii=False, separators=(",", ":"))
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        エントリを読み込む
+
+        Returns:
+            Optional[CacheEntry]: 期限を単調時計に換算したエントリ。存在しない場合はNone
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT template, data, size, expires_at, etag, last_modified "
+                "FROM responses WHERE key = ?",
+                (self._encode_key(key),),
+            ).fetchone()
+        if row is None:
+            return None
+        template, data, size, expires_at, etag, last_modified = row
+        return CacheEntry(
+            template=template,
+            data=self.codec.loads(data),
+            expires_at=time.monotonic() + (expires_at - time.time()),
+            size=size,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def put(self, key: Hashable, entry: CacheEntry) -> int:
+        """
+        エントリを保存し、上限を超えた分を削除する
+
+        Returns:
+            int: 削除したエントリ数
+        """
+        data = self.codec.dumps(entry.data)
+        expires_at = time.time() + (entry.expires_at - time.monotonic())
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        self._encode_key(key),
+                        key[1],
+                        entry.template,
+                        data,
+                        len(data),
+                        expires_at,
+                        entry.etag,
+                        entry.last_modified,
+                    ),
+                )
+                evicted = self._evict(connection)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        return evicted
+
+    def touch(self, key: Hashable, entry: CacheEntry) -> None:
+        """再検証されたエントリの期限を更新する"""
+        expires_at = time.time() + (entry.expires_at - time.monotonic())
+        with self._lock:
+            self._connection.execute(
+                "UPDATE responses SET expires_at = ? WHERE key = ?",
+                (expires_at, self._encode_key(key)),
+            )
+
+    def delete(
+        self, template: Optional[str] = None, endpoint: Optional[str] = None
+    ) -> int:
+        """条件に一致するエントリを削除し、削除した件数を返す"""
+        clauses = []
+        params = []
+        if template is not None:
+            clauses.append("template = ?")
+            params.append(template)
+        if endpoint is not None:
+            clauses.append("endpoint = ?")
+            params.append(endpoint)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            cursor = self._connection.execute(f"DELETE FROM responses{where}", params)
+        return cursor.rowcount
+
+    def _evict(self, connection: "sqlite3.Connection") -> int:
+        (total,) = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return 0
+        keys = []
+        for key, size in connection.execute(
+            "SELECT key, size FROM responses ORDER BY expires_at"
+        ):
+            if total <= self.max_bytes:
+                break
+            keys.append((key,))
+            total -= size
+        connection.executemany("DELETE FROM responses WHERE key = ?", keys)
+        return len(keys)
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class ResponseCache:
+    """
+    読み取り系エンドポイントのレスポンスを保持するTTL付きLRUキャッシュ
+
+    期限切れのエントリは削除せず、ETag / Last-Modified があれば条件付き
+    リクエストで再検証する（304なら本文を受け取らずに期限を延長する）。
+    persistent を指定すると、メモリにないエントリをSQLiteから読み込み、
+    保存・破棄もSQLiteに書き通す。
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        *,
+        max_entries: int = 1024,
+        max_bytes: Optional[int] = None,
+        invalidations: Optional[Mapping[str, Tuple[str, ...]]] = None,
+        persistent: Optional[SQLiteCacheBackend] = None,
+    ) -> None:
+        """
+        ResponseCacheクラスの初期化
+
+        Args:
+            ttls (Optional[Mapping[str, float]]): テンプレートごとのTTL（秒）。
+                含まれないエンドポイントはキャッシュしない。デフォルトは DEFAULT_TTLS。
+            max_entries (int): 保持するエントリ数の上限
+            max_bytes (Optional[int]): レスポンス本文の合計バイト数の上限
+            invalidations (Optional[Mapping[str, Tuple[str, ...]]]): 書き込み時に
+                破棄するテンプレートの対応表。デフォルトは DEFAULT_INVALIDATIONS。
+            persistent (Optional[SQLiteCacheBackend]): プロセスをまたいで共有する
+                2段目のキャッシュ。デフォルトはNone（メモリのみ）。
+        """
+        self.ttls: Dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.invalidations = dict(
+            DEFAULT_INVALIDATIONS if invalidations is None else invalidations
+        )
+        self.persistent = persistent
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        endpoint: str, params: Optional[Mapping[str, Any]], account: str
+    ) -> Hashable:
+        """
+        エントリのキーを作る
+
+        プロフィールの isFollowing など、同じエンドポイントでも閲覧するアカウントに
+        よって内容が変わるため、キーにはアカウント（CookieStore.account_key）を含める。
+
+        Args:
+            endpoint (str): 整形済みのエンドポイント
+            params (Optional[Mapping[str, Any]]): クエリパラメータ
+            account (str): アカウントを区別するキー
+
+        Returns:
+            Hashable: (account, endpoint, 整列済みのパラメータ) のタプル
+        """
+        return (account, endpoint, tuple(sorted(params.items())) if params else ())
+
+    def lookup(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        エントリを取得する。新鮮なエントリはヒットとして数える
+
+        メモリにない場合は persistent から読み込み、メモリに載せる。
+
+        Returns:
+            Optional[CacheEntry]: エントリ（期限切れを含む）。存在しない場合はNone
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None and self.persistent is not None:
+            entry = self.persistent.get(key)
+            if entry is not None:
+                with self._lock:
+                    self.stats.persistent_hits += 1
+                    self._insert(key, entry)
+        with self._lock:
+            if entry is not None and entry.fresh:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+        return entry
+
+    def store(
+        self,
+        key: Hashable,
+        template: str,
+        data: Any,
+        headers: Mapping[str, str],
+        size: int,
+    ) -> None:
+        """200レスポンスを保存する"""
+        entry = CacheEntry(
+            template=template,
+            data=data,
+            expires_at=time.monotonic() + self.ttls[template],
+            size=size,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        with self._lock:
+            self._insert(key, entry)
+        if self.persistent is not None:
+            evicted = self.persistent.put(key, entry)
+            with self._lock:
+                self.stats.evictions += evicted
+
+    def revalidated(self, key: Hashable, entry: CacheEntry) -> Any:
+        """304レスポンスを受けてエントリの期限を延長し、保持しているデータを返す"""
+        with self._lock:
+            entry.expires_at = time.monotonic() + self.ttls[entry.template]
+            self.stats.revalidations += 1
+        if self.persistent is not None:
+            self.persistent.touch(key, entry)
+        return entry.data
+
+    def invalidate(
+        self, template: Optional[str] = None, endpoint: Optional[str] = None
+    ) -> int:
+        """
+        エントリを破棄する。引数を省略した場合はすべて破棄する
+
+        Args:
+            template (Optional[str]): このテンプレートのエントリを破棄する
+            endpoint (Optional[str]): この整形済みエンドポイントのエントリを破棄する
+
+        Returns:
+            int: 破棄したエントリ数
+        """
+        with self._lock:
+            keys = [
+                key
+                for key, entry in self._entries.items()
+                if (template is None or entry.template == template)
+                and (endpoint is None or key[1] == endpoint)
+            ]
+            for key in keys:
+                self._bytes -= self._entries.pop(key).size
+            count = len(keys)
+        if self.persistent is not None:
+            count = max(count, self.persistent.delete(template, endpoint))
+        with self._lock:
+            self.stats.invalidations += count
+        return count
+
+    def invalidate_for_write(
+        self, template: str, endpoint: Optional[str] = None
+    ) -> None:
+        """
+        書き込みが成功したときに関連するエントリを破棄する
+
+        Args:
+            template (str): 書き込み先のテンプレート
+            endpoint (Optional[str]): 書き込み先のエンドポイント。同じパスの
+                読み取り結果（例: メッセージ送信後の履歴）も破棄する
+        """
+        for target in self.invalidations.get(template, ()):
+            self.invalidate(template=target)
+        if endpoint is not None:
+            self.invalidate(endpoint=endpoint)
+
+    def _insert(self, key: Hashable, entry: CacheEntry) -> None:
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.size
+        self._entries[key] = entry
+        self._bytes += entry.size
+        self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries or (
+            self.max_bytes is not None and self._bytes > self.max_bytes
+        ):
+            _, entry = self._entries.popitem(last=False)
+            self._bytes -= entry.size
+            self.stats.evictions += 1
@@ -0,0 +1,86 @@
+import json
+from functools import lru_cache
+from typing import Any, Callable, Optional, Union
+
+# get_codec() が自動選択するときの優先順
+PREFERRED_CODECS = ("orjson", "ujson", "json")
+
+
+class JSONCodec:
+    """
+    JSONのエンコード/デコードを行うコーデック
+
+    dumps は bytes を返し、loads は bytes / str のどちらも受け付ける。
+    レスポンス本文は bytes のまま loads に渡し、文字列へのデコードを挟まない。
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        loads: Callable[[Union[bytes, str]], Any],
+    ) -> None:
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+
+    def __repr__(self) -> str:
+        return f"JSONCodec({self.name!r})"
+
+
+def _stdlib_codec() -> JSONCodec:
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    return JSONCodec(
+        "json", lambda obj: encoder.encode(obj).encode("utf-8"), json.loads
+    )
+
+
+def _orjson_codec() -> JSONCodec:
+    import orjson
+
+    return JSONCodec("orjson", orjson.dumps, orjson.loads)
+
+
+def _ujson_codec() -> JSONCodec:
+    import ujson
+
+    return JSONCodec(
+        "ujson",
+        lambda obj: ujson.dumps(obj, ensure_ascii=False).encode("utf-8"),
+        ujson.loads,
+    )
+
+
+_FACTORIES = {
+    "json": _stdlib_codec,
+    "orjson": _orjson_codec,
+    "ujson": _ujson_codec,
+}
+
+
+@lru_cache(maxsize=None)
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """
+    JSONコーデックを取得する
+
+    Args:
+        name (Optional[str]): "orjson" / "ujson" / "json"。省略時は
+            インストールされているものを PREFERRED_CODECS の順に選ぶ
+
+    Returns:
+        JSONCodec: コーデック
+
+    Raises:
+        ValueError: 未知の名前を指定した場合
+        ImportError: 指定したライブラリがインストールされていない場合
+    """
+    if name is not None:
+        if name not in _FACTORIES:
+            raise ValueError(f"未知のJSONコーデックです: {name}")
+        return _FACTORIES[name]()
+    for candidate in PREFERRED_CODECS:
+        try:
+            return _FACTORIES[candidate]()
+        except ImportError:
+            continue
+    return _stdlib_codec()
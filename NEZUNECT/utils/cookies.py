@@ -1,6 +1,12 @@
 import json
+import logging
+import os
+import threading
+import time
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
 
 
 def load_cookies(cookie_file: str = "./cookie.json") -> Dict[str, str]:
@@ -25,3 +31,116 @@ def load_cookies(cookie_file: str = "./cookie.json") -> Dict[str, str]:
         raise
     except json.JSONDecodeError:
         raise
+
+
+class CookieStore:
+    """
+    クッキーファイルを一度だけ読み込み、プロセス全体で共有するストア
+
+    ファイルの更新日時を監視し、クッキーがローテーションされた場合は
+    クライアントを作り直さずに再読み込みします。
+    """
+
+    _stores: Dict[str, "CookieStore"] = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(self, cookie_file: str = "./cookie.json", check_interval: float = 1.0):
+        """
+        CookieStoreクラスの初期化
+
+        Args:
+            cookie_file (str): クッキー情報が格納されたJSONファイルのパス。
+            check_interval (float): 更新日時を確認する最短間隔（秒）。
+        """
+        self.path = Path(cookie_file)
+        # レスポンスキャッシュでアカウントを区別するキー（プロセスをまたいで同じ値になる）
+        self.account_key = str(self.path.resolve())
+        self.check_interval = check_interval
+        self.version = 0
+        self._cookies: Dict[str, str] = {}
+        self._mtime: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.refresh(force=True)
+
+    @classmethod
+    def get(cls, cookie_file: str = "./cookie.json") -> "CookieStore":
+        """
+        ファイルパスごとに共有されるCookieStoreを取得
+
+        Args:
+            cookie_file (str): クッキー情報が格納されたJSONファイルのパス。
+
+        Returns:
+            CookieStore: 共有ストア
+        """
+        key = os.path.abspath(cookie_file)
+        store = cls._stores.get(key)
+        if store is None:
+            with cls._stores_lock:
+                store = cls._stores.get(key)
+                if store is None:
+                    store = cls._stores[key] = cls(cookie_file)
+        return store
+
+    @property
+    def cookies(self) -> Dict[str, str]:
+        """最新のクッキー情報"""
+        self.refresh()
+        return self._cookies
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        ファイルが更新されていればクッキーを再読み込みする
+
+        Args:
+            force (bool): 確認間隔を無視して更新日時を確認するかどうか
+
+        Returns:
+            bool: 再読み込みが行われた場合はTrue
+
+        Raises:
+            OSError: 最初の読み込みでファイルを読めない場合
+            ValueError: 最初の読み込みでJSONの解析に失敗した場合
+        """
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.check_interval:
+            return False
+        with self._lock:
+            self._checked_at = now
+            try:
+                mtime = self.path.stat().st_mtime_ns
+                if mtime == self._mtime:
+                    return False
+                cookies = load_cookies(str(self.path))
+            except (OSError, ValueError) as error:
+                if self._mtime is None:
+                    raise
+                # 書き込み途中やローテーション中のファイルは読み飛ばし、
+                # 更新日時を据え置いて次の確認で読み直す
+                logger.warning(
+                    "クッキーファイルを再読み込みできませんでした: %s (%s)",
+                    self.path,
+                    error,
+                )
+                return False
+            self._cookies = cookies
+            self._mtime = mtime
+            self.version += 1
+            return True
+
+    def apply(self, session: Any) -> int:
+        """
+        セッションのクッキージャーを現在のクッキーで置き換える
+
+        Args:
+            session (Any): ``cookies`` 属性を持つセッション（requests / httpx）
+
+        Returns:
+            int: 設定したクッキーのバージョン
+        """
+        cookies = self.cookies
+        # ローテーションで消えたクッキーを送り続けないよう、ジャーごと置き換える
+        session.cookies.clear()
+        session.cookies.update(cookies)
+        return self.version
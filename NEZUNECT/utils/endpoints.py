@@ -0,0 +1,40 @@
+import re
+from functools import lru_cache
+from typing import List, Pattern, Tuple
+
+from ..config import Config
+
+
+def _compile_templates() -> List[Tuple[Pattern[str], str]]:
+    templates = {
+        value
+        for name, value in vars(Config.Endpoints).items()
+        if not name.startswith("_") and isinstance(value, str)
+    }
+    # 固定パスを優先し、プレースホルダーの少ないテンプレートから照合する
+    ordered = sorted(templates, key=lambda t: (t.count("{"), -len(t)))
+    return [
+        (re.compile("^" + re.sub(r"\\\{\w+\\\}", "[^/]+", re.escape(t)) + "$"), t)
+        for t in ordered
+    ]
+
+
+_TEMPLATES = _compile_templates()
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(endpoint: str) -> str:
+    """
+    整形済みのエンドポイントを Config.Endpoints のテンプレートに戻す
+
+    Args:
+        endpoint (str): "/posts/123/like" のような整形済みパス
+
+    Returns:
+        str: 対応するテンプレート。該当しない場合はパスそのもの
+    """
+    path = endpoint.split("?", 1)[0]
+    for pattern, template in _TEMPLATES:
+        if pattern.match(path):
+            return template
+    return path
@@ -0,0 +1,174 @@
+import itertools
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from .exceptions import APIError
+
+EVENTS = ("before_request", "after_response", "on_error")
+
+# グローバルとクライアントのフックを通して登録順を決める連番
+_sequence = itertools.count()
+
+
+@dataclass
+class RequestContext:
+    """
+    フックに渡される1回のAPI呼び出しの情報
+
+    before_request のフックは headers / params / data を書き換えられる。
+    response は after_response、error は on_error の時点で設定される。
+    state はフック間で値を受け渡すための辞書。
+    """
+
+    method: str
+    endpoint: str
+    template: str
+    params: Optional[Dict[str, Any]]
+    data: Optional[Dict[str, Any]]
+    headers: Dict[str, str]
+    started: float
+    elapsed: Optional[float] = None
+    response: Any = None
+    error: Optional[APIError] = None
+    short_circuited: bool = False
+    state: Dict[str, Any] = field(default_factory=dict)
+
+
+Hook = Callable[[RequestContext], Any]
+
+
+class HookChain(NamedTuple):
+    """1回の呼び出しで実行するフック（実行順に並べたもの）"""
+
+    before_request: Tuple[Hook, ...]
+    after_response: Tuple[Hook, ...]
+    on_error: Tuple[Hook, ...]
+
+
+class Hooks:
+    """
+    リクエストのライフサイクルに差し込むフックの登録先
+
+    - before_request(context): 送信前に呼ばれる。None 以外を返すと送信せず、
+      その値をレスポンスのデータとして扱う（以降の before_request は呼ばない）
+    - after_response(context): 成功後に呼ばれる。None 以外を返すとデータを置き換える
+    - on_error(context): APIError の発生時に呼ばれる。None 以外を返すと
+      例外の代わりにその値をデータとして返す
+
+    before_request は priority の小さい順（同じなら登録順）に、
+    after_response と on_error はその逆順に呼ばれる。グローバルのフック
+    （GLOBAL_HOOKS）はクライアントのフックより先に before_request が呼ばれる。
+    非同期クライアントではコルーチン関数も登録できる。
+    """
+
+    def __init__(self) -> None:
+        self.empty = True
+        # 登録内容が変わるたびに増やし、resolve_hooks() の結果の再利用に使う
+        self.version = 0
+        self._resolved: Optional[Tuple[Tuple[int, int], HookChain]] = None
+        self._entries: Dict[str, List[Tuple[int, int, Hook]]] = {
+            event: [] for event in EVENTS
+        }
+        self._lock = threading.Lock()
+
+    def register(
+        self, event: str, hook: Optional[Hook] = None, *, priority: int = 0
+    ) -> Any:
+        """
+        フックを登録する（hook を省略するとデコレータとして使える）
+
+        Args:
+            event (str): "before_request" / "after_response" / "on_error"
+            hook (Optional[Hook]): RequestContext を受け取る関数
+            priority (int): 実行順。小さいほど送信に近い外側で実行される
+
+        Returns:
+            Any: 登録した関数（デコレータとして使った場合も同じ）
+
+        Raises:
+            ValueError: 未知のイベント名の場合
+        """
+        if event not in EVENTS:
+            raise ValueError(f"未知のフックイベントです: {event}")
+        if hook is None:
+            return lambda func: self.register(event, func, priority=priority)
+        with self._lock:
+            entries = self._entries[event]
+            entries.append((priority, next(_sequence), hook))
+            entries.sort(key=lambda entry: entry[:2])
+            self.empty = False
+            self.version += 1
+        return hook
+
+    def before_request(self, hook: Optional[Hook] = None, *, priority: int = 0) -> Any:
+        return self.register("before_request", hook, priority=priority)
+
+    def after_response(self, hook: Optional[Hook] = None, *, priority: int = 0) -> Any:
+        return self.register("after_response", hook, priority=priority)
+
+    def on_error(self, hook: Optional[Hook] = None, *, priority: int = 0) -> Any:
+        return self.register("on_error", hook, priority=priority)
+
+    def remove(self, event: str, hook: Hook) -> None:
+        """登録したフックを外す（登録されていなければ何もしない）"""
+        with self._lock:
+            self._entries[event] = [
+                entry for entry in self._entries[event] if entry[2] is not hook
+            ]
+            self.empty = not any(self._entries.values())
+            self.version += 1
+
+    def clear(self) -> None:
+        """すべてのフックを外す"""
+        with self._lock:
+            for entries in self._entries.values():
+                entries.clear()
+            self.empty = True
+            self.version += 1
+
+    def entries(self, event: str) -> List[Tuple[int, int, Hook]]:
+        """(priority, 登録順, フック) のリスト（priority と登録順で整列済み）"""
+        return list(self._entries[event])
+
+
+# すべてのクライアントに適用されるフック
+GLOBAL_HOOKS = Hooks()
+
+
+def register_hook(event: str, hook: Optional[Hook] = None, *, priority: int = 0) -> Any:
+    """GLOBAL_HOOKS にフックを登録する（Hooks.register() と同じ）"""
+    return GLOBAL_HOOKS.register(event, hook, priority=priority)
+
+
+def resolve_hooks(hooks: Hooks) -> Optional[HookChain]:
+    """
+    グローバルとクライアントのフックを実行順に並べる
+
+    結果はどちらかの登録内容が変わるまで hooks に保持して再利用する。
+
+    Args:
+        hooks (Hooks): クライアントのフック
+
+    Returns:
+        Optional[HookChain]: 実行するフック。1つも登録されていなければNone
+    """
+    if GLOBAL_HOOKS.empty and hooks.empty:
+        return None
+    key = (GLOBAL_HOOKS.version, hooks.version)
+    resolved = hooks._resolved
+    if resolved is not None and resolved[0] == key:
+        return resolved[1]
+    sources = ((0, GLOBAL_HOOKS), (1, hooks))
+    ordered: Dict[str, Tuple[Hook, ...]] = {}
+    for event in EVENTS:
+        merged = sorted(
+            (priority, scope, sequence, hook)
+            for scope, source in sources
+            for priority, sequence, hook in source.entries(event)
+        )
+        chain = tuple(entry[3] for entry in merged)
+        ordered[event] = chain if event == "before_request" else chain[::-1]
+    result = HookChain(**ordered)
+    hooks._resolved = (key, result)
+    return result
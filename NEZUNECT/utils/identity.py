@@ -0,0 +1,117 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class IdentityMapStats:
+    """識別マップの統計情報"""
+
+    hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    evictions: int = 0
+
+
+class ProfileIdentityMap:
+    """
+    profileId ごとに埋め込みプロフィールを1つのインスタンスに共有する識別マップ
+
+    同じ profileId で同じ内容の辞書は、生成済みのインスタンスをそのまま返す。
+    内容が変わっていれば、後から取得したデータを新しいものとみなして
+    共有インスタンスをその場で更新する（保持している側にも反映される）。
+    max_size を超えると最も長く使われていないものから忘れる。
+    """
+
+    def __init__(self, max_size: int = 10000) -> None:
+        """
+        ProfileIdentityMapクラスの初期化
+
+        Args:
+            max_size (int): 保持するプロフィールの上限
+        """
+        self.max_size = max_size
+        self.stats = IdentityMapStats()
+        self._entries: "OrderedDict[Hashable, Tuple[Dict[str, Any], Any]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def intern(self, cls: Type[T], data: Dict[str, Any]) -> T:
+        """
+        data から cls のインスタンスを取得する（共有できるものは共有する）
+
+        Args:
+            cls (Type[T]): from_dict を持つモデルクラス。dict を渡すと辞書のまま共有する
+            data (Dict[str, Any]): APIレスポンスのプロフィール
+
+        Returns:
+            T: 共有インスタンス
+        """
+        profile_id = data.get("profileId")
+        if not profile_id:
+            return _build(cls, data)
+        key = (cls, profile_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                if entry[0] == data:
+                    self.stats.hits += 1
+                    return entry[1]
+
+        fresh = _build(cls, data)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._entries[key] = (data, fresh)
+                self.stats.misses += 1
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self.stats.evictions += 1
+                return fresh
+            shared = entry[1]
+            if cls is dict:
+                shared.clear()
+                shared.update(fresh)
+            else:
+                # lazy_timestamp() のフィールドを解析前の値のまま写すため、
+                # フィールドではなく保存先の属性（スロット）をコピーする
+                for name in _storage_names(fresh):
+                    object.__setattr__(shared, name, getattr(fresh, name))
+            self._entries[key] = (data, shared)
+            self.stats.refreshes += 1
+            return shared
+
+    def get(self, cls: Type[T], profile_id: str) -> Optional[T]:
+        """共有中のインスタンスを返す。存在しない場合はNone"""
+        entry = self._entries.get((cls, profile_id))
+        return entry[1] if entry is not None else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _build(cls: Type[T], data: Dict[str, Any]) -> T:
+    return dict(data) if cls is dict else cls.from_dict(data)  # type: ignore
+
+
+def _storage_names(instance: Any) -> Iterable[str]:
+    slots = getattr(type(instance), "__slots__", None)
+    return slots if slots is not None else list(vars(instance))
+
+
+def intern_profile(
+    profiles: Optional[ProfileIdentityMap], cls: Type[T], data: Dict[str, Any]
+) -> T:
+    """profiles があれば共有インスタンスを、なければ新しいインスタンスを返す"""
+    if profiles is None:
+        return data if cls is dict else cls.from_dict(data)  # type: ignore
+    return profiles.intern(cls, data)
@@ -0,0 +1,101 @@
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Sequence,
+    TypeVar,
+    Union,
+    overload,
+)
+
+T = TypeVar("T")
+
+# まだモデルを生成していない位置の目印
+_UNBUILT: Any = object()
+
+
+class LazyModelList(Sequence[T]):
+    """
+    APIレスポンスのリストを包み、要素にアクセスしたときに初めてモデルを生成するシーケンス
+
+    生成したモデルは位置ごとに保持し、2回目以降は同じインスタンスを返す。
+    len・スライス・イテレーションはリストと同じように使える。スライスは生成済みの
+    モデルを引き継いだ新しい LazyModelList を返す。
+    元のリストは raw から参照できる（キャッシュと共有している場合があるため変更しないこと）。
+    """
+
+    __slots__ = ("raw", "_factory", "_built")
+
+    def __init__(
+        self, raw: List[Dict[str, Any]], factory: Callable[[Dict[str, Any]], T]
+    ) -> None:
+        """
+        LazyModelListクラスの初期化
+
+        Args:
+            raw (List[Dict[str, Any]]): APIレスポンスの要素のリスト
+            factory (Callable[[Dict[str, Any]], T]): 要素からモデルを生成する関数
+        """
+        self.raw = raw
+        self._factory = factory
+        self._built: List[Any] = [_UNBUILT] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self.raw)
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LazyModelList[T]": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, "LazyModelList[T]"]:
+        if isinstance(index, slice):
+            view = LazyModelList(self.raw[index], self._factory)
+            view._built = self._built[index]
+            return view
+        item = self._built[index]
+        if item is _UNBUILT:
+            item = self._built[index] = self._factory(self.raw[index])
+        return item
+
+    def __iter__(self) -> Iterator[T]:
+        raw, built, factory = self.raw, self._built, self._factory
+        for index, item in enumerate(built):
+            if item is _UNBUILT:
+                item = built[index] = factory(raw[index])
+            yield item
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (LazyModelList, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazyModelList(len={len(self.raw)}, built={self.built})"
+
+    @property
+    def built(self) -> int:
+        """生成済みのモデルの数"""
+        return len(self._built) - self._built.count(_UNBUILT)
+
+
+def decode_list(
+    raw: List[Dict[str, Any]], factory: Callable[[Dict[str, Any]], T], lazy: bool
+) -> Sequence[T]:
+    """
+    レスポンスの要素のリストをモデルのリストに変換する
+
+    Args:
+        raw (List[Dict[str, Any]]): APIレスポンスの要素のリスト
+        factory (Callable[[Dict[str, Any]], T]): 要素からモデルを生成する関数
+        lazy (bool): True なら LazyModelList を返し、アクセスされるまで生成しない
+
+    Returns:
+        Sequence[T]: lazy が False なら list、True なら LazyModelList
+    """
+    if lazy:
+        return LazyModelList(raw, factory)
+    return [factory(item) for item in raw]
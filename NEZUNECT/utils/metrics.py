@@ -0,0 +1,280 @@
+import os
+import threading
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+# レイテンシーのヒストグラムの境界（秒）
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """累積前のバケットごとの件数と合計を保持するヒストグラム"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """
+    Config.Endpoints のテンプレートごとにリクエストの計測値を集計するレジストリ
+
+    - nezunect_requests_total: 送信回数（再試行を含む）。status は接続エラーなら "error"
+    - nezunect_retries_total: 再試行回数
+    - nezunect_request_bytes_total / nezunect_response_bytes_total: 本文のバイト数
+    - nezunect_latency_seconds: phase ごとの所要時間のヒストグラム。
+      network は送受信、decode はJSONの解析、build はモデルの生成
+
+    render() でPrometheusのテキスト形式に変換し、serve() でHTTPポートから、
+    write() でファイル（node_exporter の textfile コレクターなど）から公開する。
+    """
+
+    def __init__(
+        self, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = "nezunect"
+    ) -> None:
+        """
+        MetricsRegistryクラスの初期化
+
+        Args:
+            buckets (Sequence[float]): レイテンシーのヒストグラムの境界（秒、昇順）
+            prefix (str): メトリクス名の接頭辞
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.prefix = prefix
+        self._requests: Dict[Tuple[str, str, str], int] = {}
+        self._retries: Dict[Tuple[str, str], int] = {}
+        self._sent: Dict[Tuple[str, str], int] = {}
+        self._received: Dict[Tuple[str, str], int] = {}
+        self._latency: Dict[Tuple[str, str], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def record_attempt(
+        self,
+        method: str,
+        template: str,
+        status: Optional[int],
+        seconds: float,
+        sent: int,
+        received: int,
+    ) -> None:
+        """
+        1回の送信を記録する
+
+        Args:
+            method (str): HTTPメソッド
+            template (str): エンドポイントのテンプレート
+            status (Optional[int]): ステータスコード。接続エラーならNone
+            seconds (float): 送信からレスポンス本文の受信までの秒数
+            sent (int): リクエスト本文のバイト数
+            received (int): レスポンス本文のバイト数
+        """
+        key = (method, template)
+        request_key = (method, template, str(status) if status else "error")
+        with self._lock:
+            self._requests[request_key] = self._requests.get(request_key, 0) + 1
+            self._sent[key] = self._sent.get(key, 0) + sent
+            self._received[key] = self._received.get(key, 0) + received
+            self._observe(template, "network", seconds)
+
+    def record_retry(self, method: str, template: str) -> None:
+        """再試行を1回記録する"""
+        key = (method, template)
+        with self._lock:
+            self._retries[key] = self._retries.get(key, 0) + 1
+
+    def observe(self, phase: str, template: str, seconds: float) -> None:
+        """
+        decode / build などの所要時間を記録する
+
+        Args:
+            phase (str): 計測した処理の名前
+            template (str): エンドポイントのテンプレート
+            seconds (float): 所要時間（秒）
+        """
+        with self._lock:
+            self._observe(template, phase, seconds)
+
+    def _observe(self, template: str, phase: str, seconds: float) -> None:
+        histogram = self._latency.get((template, phase))
+        if histogram is None:
+            histogram = self._latency[(template, phase)] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def reset(self) -> None:
+        """すべての計測値を消去する"""
+        with self._lock:
+            for values in (
+                self._requests,
+                self._retries,
+                self._sent,
+                self._received,
+                self._latency,
+            ):
+                values.clear()
+
+    def render(self) -> str:
+        """
+        Prometheusのテキスト形式（exposition format 0.0.4）に変換する
+
+        Returns:
+            str: メトリクスのテキスト
+        """
+        name = self.prefix
+        lines: List[str] = []
+        with self._lock:
+            _counter(
+                lines,
+                f"{name}_requests_total",
+                "HTTP requests sent, including retries.",
+                ("method", "endpoint", "status"),
+                self._requests,
+            )
+            _counter(
+                lines,
+                f"{name}_retries_total",
+                "HTTP requests retried.",
+                ("method", "endpoint"),
+                self._retries,
+            )
+            _counter(
+                lines,
+                f"{name}_request_bytes_total",
+                "Request body bytes sent.",
+                ("method", "endpoint"),
+                self._sent,
+            )
+            _counter(
+                lines,
+                f"{name}_response_bytes_total",
+                "Response body bytes received.",
+                ("method", "endpoint"),
+                self._received,
+            )
+            metric = f"{name}_latency_seconds"
+            lines.append(
+                f"# HELP {metric} Time spent per phase (network, decode, build)."
+            )
+            lines.append(f"# TYPE {metric} histogram")
+            for (template, phase), histogram in sorted(self._latency.items()):
+                labels = f'endpoint="{_escape(template)}",phase="{_escape(phase)}"'
+                cumulative = 0
+                bounds = [*map(_format_float, histogram.buckets), "+Inf"]
+                for bound, count in zip(bounds, histogram.counts):
+                    cumulative += count
+                    lines.append(
+                        f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}'
+                    )
+                lines.append(f"{metric}_sum{{{labels}}} {_format_float(histogram.sum)}")
+                lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str) -> None:
+        """
+        render() の結果をファイルに書き出す
+
+        読み手が書きかけのファイルを読まないよう、一時ファイルに書いてから置き換える。
+
+        Args:
+            path (str): 出力先のパス
+        """
+        import tempfile
+
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+                file.write(self.render())
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1") -> "ThreadingHTTPServer":
+        """
+        バックグラウンドスレッドで /metrics を返すHTTPサーバーを起動する
+
+        Args:
+            port (int): 待ち受けるポート。0なら空いているポート
+            host (str): 待ち受けるアドレス
+
+        Returns:
+            ThreadingHTTPServer: 起動したサーバー（shutdown() で停止する）
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        threading.Thread(
+            target=server.serve_forever, name="MetricsServer", daemon=True
+        ).start()
+        return server
+
+
+def _counter(
+    lines: List[str],
+    metric: str,
+    help_text: str,
+    label_names: Tuple[str, ...],
+    values: Dict[Any, int],
+) -> None:
+    lines.append(f"# HELP {metric} {help_text}")
+    lines.append(f"# TYPE {metric} counter")
+    for key, value in sorted(values.items()):
+        labels = ",".join(
+            f'{label}="{_escape(part)}"' for label, part in zip(label_names, key)
+        )
+        lines.append(f"{metric}{{{labels}}} {value}")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_float(value: float) -> str:
+    return repr(float(value))
@@ -0,0 +1,108 @@
+from dataclasses import field, fields, is_dataclass, make_dataclass
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+from .timestamps import LazyTimestamp
+
+T = TypeVar("T")
+
+_FROZEN: Dict[type, type] = {}
+
+
+def _slot_state(self: Any) -> Dict[str, Any]:
+    return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _set_slot_state(self: Any, state: Dict[str, Any]) -> None:
+    for name, value in state.items():
+        object.__setattr__(self, name, value)
+
+
+def _storage_slots(value: Any) -> Optional[Tuple[str, ...]]:
+    # 値を別名のスロットに保存するフィールド（lazy_timestamp()）ならそのスロット名
+    return value.slot_names if isinstance(value, LazyTimestamp) else None
+
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """
+    データクラスを __slots__ 付きで作り直すデコレータ（@dataclass の上に付ける）
+
+    インスタンスごとの __dict__ がなくなり、属性名はそのまま使える。
+    Python 3.7 でも使えるよう dataclass(slots=True) と同じ処理を行う。
+    """
+    if not is_dataclass(cls):
+        raise TypeError(f"{cls.__name__} はデータクラスではありません")
+    namespace = dict(cls.__dict__)
+    names = []
+    for f in fields(cls):
+        storage = _storage_slots(namespace.get(f.name))
+        if storage is not None:
+            # lazy_timestamp() などのデスクリプタは残し、その保存先をスロットにする
+            names.extend(storage)
+            continue
+        # 既定値は生成済みの __init__ が持っているため、クラス属性からは外す
+        namespace.pop(f.name, None)
+        names.append(f.name)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = tuple(names)
+    # frozen でも pickle できるように状態の出し入れを定義する
+    namespace["__getstate__"] = _slot_state
+    namespace["__setstate__"] = _set_slot_state
+    new_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    new_cls.__qualname__ = cls.__qualname__
+    return new_cls
+
+
+def frozen_variant(cls: Type[T]) -> Type[T]:
+    """
+    データクラスと同じフィールドとメソッドを持つ frozen かつ slotted なクラスを返す
+
+    モジュールの属性として代入しておくと pickle できる（例:
+    ``FrozenMessage = frozen_variant(Message)``）。
+    """
+    if cls in _FROZEN:
+        return _FROZEN[cls]
+    name = f"Frozen{cls.__name__}"
+    specs = [
+        (
+            (f.name, f.type)
+            # デスクリプタのフィールドは namespace のデスクリプタをそのまま使う
+            if _storage_slots(cls.__dict__.get(f.name)) is not None
+            else (
+                f.name,
+                f.type,
+                field(
+                    default=f.default,
+                    default_factory=f.default_factory,
+                    init=f.init,
+                    repr=f.repr,
+                    compare=f.compare,
+                ),
+            )
+        )
+        for f in fields(cls)
+    ]
+    namespace = {
+        key: value
+        for key, value in cls.__dict__.items()
+        if not key.startswith("__")
+        and key not in getattr(cls, "__slots__", ())
+        and (key not in cls.__dataclass_fields__ or _storage_slots(value) is not None)
+    }
+    namespace["__module__"] = cls.__module__
+    namespace["__doc__"] = cls.__doc__
+    new_cls = make_dataclass(name, specs, namespace=namespace, frozen=True)
+    new_cls.__qualname__ = name
+    frozen_cls = slotted(new_cls)
+    _FROZEN[cls] = _FROZEN[frozen_cls] = frozen_cls
+    return frozen_cls
+
+
+def freeze(instance: T) -> T:
+    """モデルのインスタンスを frozen_variant() のインスタンスに変換する"""
+    frozen_cls = frozen_variant(type(instance))
+    if type(instance) is frozen_cls:
+        return instance
+    return frozen_cls(
+        **{f.name: getattr(instance, f.name) for f in fields(instance) if f.init}
+    )
@@ -0,0 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import AsyncIterator, Awaitable, Callable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+def _is_last_page(page: List[T], page_size: Optional[int], largest: int) -> bool:
+    """ページが終端かどうか（空、またはページサイズ未満）を判定する"""
+    if not page:
+        return True
+    return len(page) < (page_size or largest)
+
+
+def paginate(
+    fetch_page: Callable[[int], List[T]],
+    *,
+    start: int = 0,
+    page_size: Optional[int] = None,
+    prefetch: bool = False,
+) -> Iterator[T]:
+    """
+    skip 方式のエンドポイントを順にたどり、要素を1件ずつ返す
+
+    ページサイズ未満のページ（page_size を省略した場合はそれまでで最大のページより
+    短いページ）か空のページで終了する。prefetch を有効にすると、呼び出し側が
+    ページNを処理している間にページN+1をワーカースレッドで取得する。
+
+    Args:
+        fetch_page (Callable[[int], List[T]]): skip を受け取りページを返す関数
+        start (int, optional): 最初の skip
+        page_size (Optional[int], optional): 1ページの件数
+        prefetch (bool, optional): 次のページを先読みするかどうか
+
+    Yields:
+        T: ページ内の要素
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        skip = start
+        largest = 0
+        page = fetch_page(skip)
+        while True:
+            largest = max(largest, len(page))
+            last = _is_last_page(page, page_size, largest)
+            skip += len(page)
+            upcoming = None
+            if executor and not last:
+                # 実行中のスパンなどのコンテキスト変数を先読みのスレッドに引き継ぐ
+                upcoming = executor.submit(copy_context().run, fetch_page, skip)
+            yield from page
+            if last:
+                return
+            page = upcoming.result() if upcoming else fetch_page(skip)
+    finally:
+        if executor:
+            executor.shutdown(wait=False)
+
+
+async def apaginate(
+    fetch_page: Callable[[int], Awaitable[List[T]]],
+    *,
+    start: int = 0,
+    page_size: Optional[int] = None,
+    prefetch: bool = False,
+) -> AsyncIterator[T]:
+    """
+    paginate() の非同期版。prefetch を有効にすると次のページをタスクとして先読みする
+    """
+    # 同期クライアントの import で asyncio を読み込まないよう、ここで読み込む
+    import asyncio
+
+    upcoming: Optional["asyncio.Task[List[T]]"] = None
+    try:
+        skip = start
+        largest = 0
+        page = await fetch_page(skip)
+        while True:
+            largest = max(largest, len(page))
+            last = _is_last_page(page, page_size, largest)
+            skip += len(page)
+            if prefetch and not last:
+                upcoming = asyncio.ensure_future(fetch_page(skip))
+            for item in page:
+                yield item
+            if last:
+                return
+            if upcoming:
+                page, upcoming = await upcoming, None
+            else:
+                page = await fetch_page(skip)
+    finally:
+        if upcoming:
+            upcoming.cancel()
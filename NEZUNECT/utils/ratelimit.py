@@ -0,0 +1,178 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional, Tuple
+
+from ..config import Config
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """トークンバケットの設定（rate: 1秒あたりの補充数、burst: バケット容量）"""
+
+    rate: float
+    burst: float = 1.0
+
+
+# Subnect は制限値を公開していないため、控えめな既定値にしている
+DEFAULT_LIMITS: Mapping[str, RateLimit] = {
+    "posts_write": RateLimit(rate=1.0, burst=5),
+    "bookmarks_write": RateLimit(rate=1.0, burst=5),
+    "search": RateLimit(rate=0.5, burst=3),
+    "messages": RateLimit(rate=1.0, burst=5),
+    "notifications": RateLimit(rate=0.5, burst=3),
+    "default": RateLimit(rate=5.0, burst=10),
+}
+
+
+def endpoint_family(method: str, template: str) -> str:
+    """
+    エンドポイントテンプレートをレート制限のファミリーに分類する
+
+    Args:
+        method (str): HTTPメソッド
+        template (str): Config.Endpoints のテンプレート
+
+    Returns:
+        str: ファミリー名
+    """
+    if template == Config.Endpoints.SEARCH_POSTS:
+        return "search"
+    if template == Config.Endpoints.NOTIFICATIONS:
+        return "notifications"
+    if template == Config.Endpoints.MESSAGES:
+        return "messages"
+    if method.upper() != "GET":
+        if template.startswith(Config.Endpoints.POSTS):
+            return "posts_write"
+        if template.startswith(Config.Endpoints.BOOKMARKS):
+            return "bookmarks_write"
+    return "default"
+
+
+def _take(
+    tokens: float, updated: float, now: float, limit: RateLimit, count: float
+) -> Tuple[float, float]:
+    """バケットからトークンを予約し、(残りトークン, 待機秒数) を返す"""
+    tokens = min(limit.burst, tokens + (now - updated) * limit.rate) - count
+    return tokens, (-tokens / limit.rate if tokens < 0 else 0.0)
+
+
+class MemoryBackend:
+    """プロセス内で共有するトークンバケット"""
+
+    def __init__(self) -> None:
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, family: str, limit: RateLimit, count: float = 1.0) -> float:
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated = self._buckets.get(family, (limit.burst, now))
+            tokens, wait = _take(tokens, updated, now, limit, count)
+            self._buckets[family] = (tokens, now)
+            return wait
+
+
+class SQLiteBackend:
+    """
+    SQLiteファイルに状態を置き、同一ホストの複数プロセスで共有するトークンバケット
+
+    更新は BEGIN IMMEDIATE によるファイルロックの下で行う。
+    """
+
+    def __init__(self, path: str) -> None:
+        import sqlite3
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS buckets "
+            "(family TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+
+    def reserve(self, family: str, limit: RateLimit, count: float = 1.0) -> float:
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = connection.execute(
+                    "SELECT tokens, updated FROM buckets WHERE family = ?", (family,)
+                ).fetchone()
+                tokens, updated = row if row else (limit.burst, now)
+                tokens, wait = _take(tokens, updated, now, limit, count)
+                connection.execute(
+                    "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)",
+                    (family, tokens, now),
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            return wait
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class RateLimiter:
+    """
+    エンドポイントファミリーごとのトークンバケットによるクライアント側レート制限
+
+    トークンは先に予約され、足りない分だけ呼び出し側が待機する。
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, Optional[RateLimit]]] = None,
+        backend: Optional[object] = None,
+    ) -> None:
+        """
+        RateLimiterクラスの初期化
+
+        Args:
+            limits (Optional[Mapping[str, Optional[RateLimit]]]): ファミリーごとの制限。
+                指定しないファミリーは DEFAULT_LIMITS を使い、None で制限を外す。
+            backend (Optional[object]): MemoryBackend または SQLiteBackend。
+                デフォルトは MemoryBackend()。
+        """
+        self.limits: Dict[str, Optional[RateLimit]] = {
+            **DEFAULT_LIMITS,
+            **(limits or {}),
+        }
+        self.backend = backend or MemoryBackend()
+
+    def reserve(self, method: str, template: str) -> float:
+        """
+        トークンを予約し、送信までに待つべき秒数を返す
+
+        Args:
+            method (str): HTTPメソッド
+            template (str): Config.Endpoints のテンプレート
+
+        Returns:
+            float: 待機秒数
+        """
+        family = endpoint_family(method, template)
+        limit = self.limits.get(family)
+        if limit is None:
+            return 0.0
+        return self.backend.reserve(family, limit)
+
+    def acquire(self, method: str, template: str) -> None:
+        """トークンが使えるようになるまでブロックする"""
+        wait = self.reserve(method, template)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, method: str, template: str) -> None:
+        """トークンが使えるようになるまで待機する"""
+        import asyncio
+
+        wait = self.reserve(method, template)
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -0,0 +1,103 @@
+import random
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Retry-After ヘッダーを待機秒数に変換する
+
+    Args:
+        value (Optional[str]): 秒数またはHTTP日付形式のヘッダー値
+
+    Returns:
+        Optional[float]: 待機秒数。解釈できない場合はNone
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    リクエストの再試行ポリシー
+
+    待機時間は decorrelated jitter（前回の待機時間の3倍までの一様乱数）で決め、
+    Retry-After が指定されていればそれ以上待つ。total_timeout を超える再試行は行わない。
+
+    冪等なメソッドは接続エラーと retry_statuses で再試行する。冪等でない書き込み
+    （POSTなど）は、サーバーに届いていないことが確実な場合（接続確立前の失敗・429）
+    のみ再試行する。冪等キーを付けたリクエストは冪等として扱う。
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    total_timeout: Optional[float] = 60.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+    idempotent_methods: FrozenSet[str] = frozenset(
+        {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    )
+    respect_retry_after: bool = True
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """再試行を行わないポリシー"""
+        return cls(max_attempts=1)
+
+    def is_idempotent(self, method: str) -> bool:
+        return method.upper() in self.idempotent_methods
+
+    def next_delay(
+        self,
+        *,
+        attempt: int,
+        previous_delay: float,
+        elapsed: float,
+        idempotent: bool,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        sent: bool = True,
+    ) -> Optional[float]:
+        """
+        次の再試行までの待機時間を計算する
+
+        Args:
+            attempt (int): 失敗した試行の回数（1始まり）
+            previous_delay (float): 前回の待機時間
+            elapsed (float): 最初の試行からの経過時間
+            idempotent (bool): リクエストが冪等かどうか
+            status_code (Optional[int]): レスポンスのステータスコード
+            retry_after (Optional[float]): Retry-After の秒数
+            sent (bool): リクエストがサーバーに届いた可能性があるかどうか
+
+        Returns:
+            Optional[float]: 待機秒数。再試行しない場合はNone
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if status_code is not None and status_code not in self.retry_statuses:
+            return None
+        if not idempotent and sent and status_code != 429:
+            return None
+
+        upper = max(self.base_delay, previous_delay * 3)
+        delay = min(self.max_delay, random.uniform(self.base_delay, upper))
+        if self.respect_retry_after and retry_after is not None:
+            delay = max(delay, retry_after)
+
+        if self.total_timeout is not None and elapsed + delay > self.total_timeout:
+            return None
+        return delay
@@ -0,0 +1,127 @@
+import threading
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    import asyncio
+
+T = TypeVar("T")
+
+
+@dataclass
+class SingleFlightStats:
+    """リクエスト合流の統計情報"""
+
+    calls: int = 0
+    coalesced: int = 0
+
+    @property
+    def sent(self) -> int:
+        """実際に実行された呼び出しの数"""
+        return self.calls - self.coalesced
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    同じキーの呼び出しが同時に実行中なら、新たに実行せずその結果を共有する
+
+    先に到着した呼び出しだけが実際に実行し、後続は完了を待って同じ結果
+    （または同じ例外）を受け取る。完了したキーはすぐに忘れるため、
+    結果を保持するキャッシュではない。
+    スレッドからは do、イベントループ上のタスクからは do_async を使う。
+    do_async は1つのイベントループからのみ使うこと。
+    """
+
+    def __init__(self) -> None:
+        self.stats = SingleFlightStats()
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """実行中のキーの数"""
+        return len(self._calls) + len(self._tasks)
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """
+        key の呼び出しが実行中なら合流し、そうでなければ func を実行する
+
+        Args:
+            key (Hashable): 呼び出しを識別するキー
+            func (Callable[[], T]): 実際の処理
+
+        Returns:
+            T: func の戻り値
+        """
+        with self._lock:
+            self.stats.calls += 1
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.stats.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: Hashable, factory: Callable[[], Awaitable[T]]) -> T:
+        """
+        do の非同期版
+
+        実際の処理は独立したタスクで実行するため、最初の呼び出し元が
+        キャンセルされても合流した他の呼び出し元には影響しない。
+        """
+        # 同期クライアントの import で asyncio を読み込まないよう、ここで読み込む
+        import asyncio
+
+        with self._lock:
+            self.stats.calls += 1
+            task = self._tasks.get(key)
+            if task is None:
+                task = self._tasks[key] = asyncio.ensure_future(factory())
+                task.add_done_callback(lambda done: self._finish(key, done))
+            else:
+                self.stats.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finish(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        # 呼び出し元がすべてキャンセルされていても例外を未回収のまま残さない
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,100 @@
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Optional, Tuple, Union
+
+# Python 3.11 以降の fromisoformat は "Z" 終わりの文字列をそのまま解析できる
+_NATIVE_ISO = sys.version_info >= (3, 11)
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """
+    Subnect のISO 8601形式の日時文字列を解析する
+
+    "2024-05-01T12:00:00.000Z" のような Z 終わりの形式も Python 3.7 から扱える。
+    同じ文字列の解析結果は直近 _PARSE_CACHE_SIZE 件までキャッシュする。
+
+    Args:
+        value (Optional[str]): 日時文字列
+
+    Returns:
+        Optional[datetime]: 解析結果。空文字列やNoneの場合はNone
+
+    Raises:
+        ValueError: 日時として解析できない場合
+    """
+    if not value:
+        return None
+    return _parse(value)
+
+
+# 同じ投稿者の createdAt などページ間で繰り返し現れる文字列の解析を省く
+_PARSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse(value: str) -> datetime:
+    if not _NATIVE_ISO and value[-1] in "Zz":
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+class LazyTimestamp:
+    """
+    日時のフィールドを受け取った文字列のまま保持し、初回アクセス時に解析するデスクリプタ
+
+    データクラスのフィールドの既定値として使う（lazy_timestamp() を参照）。
+    値は _<名前>_raw に、解析結果は _<名前> に保持する。
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.raw = f"_{name}_raw"
+        self.cache = f"_{name}"
+
+    @property
+    def slot_names(self) -> Tuple[str, str]:
+        """slotted() がフィールドの代わりに作るスロット名"""
+        return self.raw, self.cache
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            # データクラスがこのフィールドを既定値なしとして扱うようにする
+            raise AttributeError(self.name)
+        value = getattr(instance, self.cache)
+        if value is None:
+            value = parse_timestamp(getattr(instance, self.raw))
+            if value is not None:
+                # frozen なモデルでも保持できるように object.__setattr__ を使う
+                object.__setattr__(instance, self.cache, value)
+        return value
+
+    def __set__(self, instance: Any, value: Union[str, datetime, None]) -> None:
+        object.__setattr__(instance, self.raw, value)
+        object.__setattr__(
+            instance, self.cache, value if isinstance(value, datetime) else None
+        )
+
+
+def lazy_timestamp() -> Any:
+    """
+    文字列と datetime のどちらでも受け取り、初回アクセス時に解析する日時フィールド
+
+    ``created_at: Optional[datetime] = lazy_timestamp()`` のように既定値の位置に書く。
+    既定値は持たないため、通常のフィールドと同じくコンストラクタの引数になる。
+
+    Returns:
+        LazyTimestamp: モデルクラスに設定するデスクリプタ
+    """
+    return LazyTimestamp()
+
+
+def raw_timestamp(
+    instance: Any, name: str = "created_at"
+) -> Union[str, datetime, None]:
+    """
+    lazy_timestamp() のフィールドに渡された解析前の値を返す
+
+    from_dict で作ったモデルではAPIの文字列、datetime で作った場合はその datetime。
+    """
+    return getattr(instance, f"_{name}_raw")
@@ -0,0 +1,305 @@
+import functools
+import inspect
+import logging
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, copy_context
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+logger = logging.getLogger(__name__)
+
+# 実行中のスパン（スレッドと asyncio のタスクごとに独立する）
+_current_span: ContextVar[Optional["Span"]] = ContextVar(
+    "nezunect_current_span", default=None
+)
+
+
+@dataclass
+class Span:
+    """
+    1つの処理の区間
+
+    時刻は time.time_ns() のナノ秒。status は "unset" / "ok" / "error"。
+    属性名は OpenTelemetry のセマンティック規約に合わせる
+    （http.request.method, http.route, http.response.status_code など）。
+    """
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: Optional[str]
+    start_time: int
+    end_time: Optional[int] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    status: str = "unset"
+    error: Optional[str] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """所要時間（秒）。終了していなければNone"""
+        if self.end_time is None:
+            return None
+        return (self.end_time - self.start_time) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+
+class SpanExporter:
+    """
+    終了したスパンの出力先のインターフェース
+
+    export() を実装したクラスを Tracer に渡す（OpenTelemetry Collector への送信、
+    ログへの書き出しなど）。export() はAPI呼び出しと同じスレッドで呼ばれるため、
+    時間のかかる出力先ではキューに積んで別スレッドで送ること。
+    """
+
+    def export(self, spans: Sequence[Span]) -> None:
+        raise NotImplementedError
+
+    def shutdown(self) -> None:
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """終了したスパンをメモリに保持する出力先（テストや調査用）"""
+
+    def __init__(self) -> None:
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+
+    def get_finished_spans(self) -> List[Span]:
+        """終了した順のスパンのリスト"""
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class Tracer:
+    """
+    APIの公開メソッドごとの親スパンと、HTTPリクエストの送信ごとの子スパンを記録する
+
+    親スパンの名前は "クラス名.メソッド名"（例: "ProfileAPI.update_profile"）、
+    子スパンは "メソッド テンプレート"（例: "GET /profile/{username}"）。
+    子スパンは再試行を含めて送信1回につき1つで、http.request.resend_count に
+    再送回数を持つ。キャッシュから返した呼び出しには子スパンがない。
+    """
+
+    def __init__(self, exporter: Optional[SpanExporter] = None) -> None:
+        """
+        Tracerクラスの初期化
+
+        Args:
+            exporter (Optional[SpanExporter]): 終了したスパンの出力先。
+                デフォルトは InMemorySpanExporter()。
+        """
+        self.exporter: SpanExporter = exporter or InMemorySpanExporter()
+
+    def start_span(
+        self, name: str, attributes: Optional[Mapping[str, Any]] = None
+    ) -> Span:
+        """
+        実行中のスパンを親としてスパンを開始する（実行中のスパンは切り替えない）
+
+        Args:
+            name (str): スパン名
+            attributes (Optional[Mapping[str, Any]]): 初期の属性
+
+        Returns:
+            Span: 開始したスパン。end_span() で終了する
+        """
+        parent = _current_span.get()
+        return Span(
+            name=name,
+            trace_id=parent.trace_id if parent else f"{random.getrandbits(128):032x}",
+            span_id=f"{random.getrandbits(64):016x}",
+            parent_id=parent.span_id if parent else None,
+            start_time=time.time_ns(),
+            attributes=dict(attributes or {}),
+        )
+
+    def end_span(self, span: Span, error: Optional[BaseException] = None) -> None:
+        """
+        スパンを終了して exporter に渡す
+
+        Args:
+            span (Span): start_span() で開始したスパン
+            error (Optional[BaseException]): 処理中に発生した例外
+        """
+        span.end_time = time.time_ns()
+        if error is None:
+            span.status = "ok"
+        else:
+            span.status = "error"
+            span.error = f"{type(error).__name__}: {error}"
+            span.attributes.setdefault("error.type", type(error).__name__)
+        try:
+            self.exporter.export((span,))
+        except Exception:
+            logger.exception("スパンの出力に失敗しました: %s", span.name)
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:
+        """
+        with ブロックの間、スパンを実行中のスパンにする
+
+        ブロック内で開始したスパン（HTTPリクエストなど）はこのスパンの子になる。
+
+        Args:
+            name (str): スパン名
+            **attributes: 初期の属性
+
+        Yields:
+            Span: 開始したスパン
+        """
+        span = self.start_span(name, attributes)
+        token = _current_span.set(span)
+        error: Optional[BaseException] = None
+        try:
+            yield span
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            _current_span.reset(token)
+            self.end_span(span, error)
+
+    def wrap(self, func: Callable[..., Any], name: str) -> Callable[..., Any]:
+        """
+        func の呼び出しごとに name のスパンを記録する関数を返す（コルーチン関数にも対応）
+
+        func が（非同期）イテレータを返した場合（get_profiles など）は、最後まで取得するか
+        閉じるまでスパンを終了せず、その間に送るリクエストもこのスパンの子にする。
+        """
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def traced_async(*args: Any, **kwargs: Any) -> Any:
+                with self.span(name):
+                    return await func(*args, **kwargs)
+
+            return traced_async
+
+        @functools.wraps(func)
+        def traced(*args: Any, **kwargs: Any) -> Any:
+            span = self.start_span(name)
+            token = _current_span.set(span)
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as exc:
+                self.end_span(span, exc)
+                raise
+            finally:
+                _current_span.reset(token)
+            if isinstance(result, Iterator):
+                return self._trace_iterator(span, result)
+            if isinstance(result, AsyncIterator):
+                return self._trace_async_iterator(span, result)
+            self.end_span(span)
+            return result
+
+        return traced
+
+    def _trace_iterator(self, span: Span, iterator: Iterator[Any]) -> Iterator[Any]:
+        # 呼び出し元のコンテキストを汚さないよう、span を実行中にしたコピーの中で進める
+        context = copy_context()
+        context.run(_current_span.set, span)
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                try:
+                    item = context.run(next, iterator)
+                except StopIteration:
+                    return
+                yield item
+        except GeneratorExit:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                context.run(close)
+            raise
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            self.end_span(span, error)
+
+    async def _trace_async_iterator(
+        self, span: Span, iterator: AsyncIterator[Any]
+    ) -> AsyncIterator[Any]:
+        # 同じタスクの中で待つ間だけ span を実行中にする（作られたタスクが引き継ぐ）
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                token = _current_span.set(span)
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    _current_span.reset(token)
+                yield item
+        except GeneratorExit:
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                token = _current_span.set(span)
+                try:
+                    await aclose()
+                finally:
+                    _current_span.reset(token)
+            raise
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            self.end_span(span, error)
+
+    def shutdown(self) -> None:
+        self.exporter.shutdown()
+
+
+def current_span() -> Optional[Span]:
+    """実行中のスパン（なければNone）"""
+    return _current_span.get()
+
+
+def trace_api_methods(api: Any, tracer: Tracer) -> None:
+    """
+    APIインスタンスの公開メソッドを、呼び出しごとに親スパンを記録する関数に置き換える
+
+    iter_* はページを取得するたびに get_* を呼ぶため、ページごとのスパンになる
+    （イテレータ全体のスパンは作らない）。
+
+    Args:
+        api (Any): BaseAPI / AsyncBaseAPI のインスタンス
+        tracer (Tracer): スパンを記録するトレーサー
+    """
+    cls = type(api)
+    for name in dir(cls):
+        if name.startswith(("_", "iter_")):
+            continue
+        func = inspect.getattr_static(cls, name)
+        if not inspect.isfunction(func) or inspect.isgeneratorfunction(func):
+            continue
+        if inspect.isasyncgenfunction(func):
+            continue
+        setattr(api, name, tracer.wrap(getattr(api, name), f"{cls.__name__}.{name}"))
@@ -0,0 +1,142 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional, Tuple
+
+if TYPE_CHECKING:
+    import httpx
+    from requests import Session
+    from requests.adapters import HTTPAdapter
+
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """
+    共有セッションのコネクションプールとタイムアウトの設定
+
+    Args:
+        pool_connections (int): プールするホスト数（requests のみ）
+        pool_maxsize (int): ホストごとに保持するキープアライブ接続数
+        pool_block (bool): プールが埋まったときに空きを待つかどうか。
+            Falseの場合は一時的な接続を追加で開く
+        connect_timeout (float): 接続タイムアウト（秒）
+        read_timeout (float): 読み取りタイムアウト（秒）
+        keepalive_expiry (float): アイドル接続を保持する秒数（httpx のみ）
+        warmup_connections (int): initialize() で事前に開く接続数
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    keepalive_expiry: float = 5.0
+    warmup_connections: int = 0
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """requests に渡す (接続, 読み取り) タイムアウト"""
+        return (self.connect_timeout, self.read_timeout)
+
+    def async_timeout(self) -> "httpx.Timeout":
+        """httpx に渡すタイムアウト（timeout と同じ接続・読み取りの秒数）"""
+        import httpx
+
+        return httpx.Timeout(self.read_timeout, connect=self.connect_timeout)
+
+    def create_adapter(self) -> "HTTPAdapter":
+        """設定を反映したコネクションプール（requests の HTTPAdapter）を生成する"""
+        from requests.adapters import HTTPAdapter
+
+        return HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+
+    def create_session(self, adapter: Optional["HTTPAdapter"] = None) -> "Session":
+        """
+        設定を反映した requests.Session を生成する
+
+        Args:
+            adapter (Optional[HTTPAdapter]): 使用するコネクションプール。同じものを
+                複数のセッションに渡すと、クッキーは別々のまま接続を共有できる
+
+        Returns:
+            Session: セッション
+        """
+        from requests import Session
+
+        session = Session()
+        adapter = adapter or self.create_adapter()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def create_async_client(self) -> "httpx.AsyncClient":
+        """設定を反映した httpx.AsyncClient を生成する"""
+        import httpx
+
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.pool_maxsize if self.pool_block else None,
+                max_keepalive_connections=self.pool_maxsize,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            timeout=self.async_timeout(),
+        )
+
+    def warm_up(self, session: "Session", url: str) -> int:
+        """
+        キープアライブ接続を事前に開いてプールに戻す
+
+        すべてのレスポンスを開いたまま並行に送ることで、接続が使い回されずに
+        warmup_connections 本の接続が確立される。失敗は無視する。
+
+        Args:
+            session (Session): 対象のセッション
+            url (str): 接続先のURL
+
+        Returns:
+            int: 確立できた接続数
+        """
+        count = min(self.warmup_connections, self.pool_maxsize)
+        if count <= 0:
+            return 0
+
+        def open_connection(_: int):
+            try:
+                return session.head(url, stream=True, timeout=self.timeout)
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            responses = [r for r in executor.map(open_connection, range(count)) if r]
+        for response in responses:
+            # 本文を読み切ってから閉じると接続は切断されずにプールへ戻る
+            response.content
+            response.close()
+        return len(responses)
+
+    async def warm_up_async(self, client: "httpx.AsyncClient", url: str) -> int:
+        """warm_up() の httpx.AsyncClient 版"""
+        import asyncio
+
+        count = min(self.warmup_connections, self.pool_maxsize)
+        if count <= 0:
+            return 0
+
+        async def open_connection():
+            try:
+                return await client.send(client.build_request("HEAD", url), stream=True)
+            except Exception:
+                return None
+
+        responses = [
+            r
+            for r in await asyncio.gather(*(open_connection() for _ in range(count)))
+            if r
+        ]
+        for response in responses:
+            await response.aread()
+            await response.aclose()
+        return len(responses)
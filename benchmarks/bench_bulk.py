@@ -0,0 +1,75 @@
+"""
+一括書き込み（like_posts）のベンチマーク
+
+1リクエストごとに遅延を入れたスタブサーバーに対し、like_post を1件ずつ
+呼ぶループと、like_posts の同時実行数を変えた場合のスループットを比較する。
+rate_limiter は設定しない（サーバー側の遅延だけを比較する）。
+
+    python benchmarks/bench_bulk.py [--posts 200] [--delay 0.02]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from stub_server import StubServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from NEZUNECT import NEZUNECT  # noqa: E402
+from NEZUNECT.config import Config  # noqa: E402
+from NEZUNECT.utils.exceptions import APIError  # noqa: E402
+from NEZUNECT.utils.transport import TransportConfig  # noqa: E402
+
+
+def serial(bot: NEZUNECT, post_ids: list) -> int:
+    succeeded = 0
+    for post_id in post_ids:
+        try:
+            bot.like_post(post_id)
+            succeeded += 1
+        except APIError:
+            pass
+    return succeeded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=200)
+    parser.add_argument("--delay", type=float, default=0.02)
+    args = parser.parse_args()
+    # 5% は404を返して失敗させる
+    post_ids = [f"fail_{i}" if i % 20 == 0 else f"post_{i}" for i in range(args.posts)]
+
+    with tempfile.TemporaryDirectory() as tmp, StubServer(delay=args.delay) as server:
+        cookie = os.path.join(tmp, "cookie.json")
+        with open(cookie, "w") as file:
+            json.dump({"session": "bench"}, file)
+        Config.BASE_URL = server.base_url
+        bot = NEZUNECT(cookie=cookie, transport=TransportConfig(pool_maxsize=16))
+
+        print(f"{'mode':<14}{'elapsed':>10}{'posts/s':>10}{'ok':>6}{'failed':>8}")
+        started = time.perf_counter()
+        succeeded = serial(bot, post_ids)
+        elapsed = time.perf_counter() - started
+        print(
+            f"{'serial loop':<14}{elapsed:>10.2f}{args.posts / elapsed:>10.1f}"
+            f"{succeeded:>6}{args.posts - succeeded:>8}"
+        )
+        for concurrency in (4, 8, 16):
+            started = time.perf_counter()
+            report = bot.like_posts(post_ids, max_concurrency=concurrency)
+            elapsed = time.perf_counter() - started
+            label = f"bulk x{concurrency}"
+            print(
+                f"{label:<14}{elapsed:>10.2f}{args.posts / elapsed:>10.1f}"
+                f"{len(report.succeeded):>6}{len(report.failed):>8}"
+            )
+        bot.close()
+
+
+if __name__ == "__main__":
+    main()
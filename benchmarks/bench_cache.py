@@ -0,0 +1,87 @@
+"""
+永続キャッシュ（SQLiteCacheBackend）のウォームリスタートのベンチマーク
+
+新しいプロセスで「プロフィール取得 + ブックマーク取得 + メッセージ履歴の取得」を
+行い、所要時間を計測する。スタブサーバーには1リクエストあたりの遅延を入れる。
+
+none:  キャッシュなし
+cold:  空のSQLiteファイルから開始（再起動直後でキャッシュが空の状態）
+warm:  直前のプロセスが書き込んだSQLiteファイルを使って再起動
+
+    python benchmarks/bench_cache.py [--runs 5] [--profiles 50] [--delay 0.005]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from stub_server import StubServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r"""
+import sys, time, json
+sys.path.insert(0, {root!r})
+from NEZUNECT import NEZUNECT
+from NEZUNECT.config import Config
+from NEZUNECT.utils import ResponseCache, SQLiteCacheBackend
+Config.BASE_URL = {base_url!r}
+cache = ResponseCache(persistent=SQLiteCacheBackend({db!r})) if {db!r} else None
+bot = NEZUNECT(cookie={cookie!r}, cache=cache)
+started = time.perf_counter()
+for i in range({profiles}):
+    bot.get_profile(f"user_{{i}}")
+bot.get_bookmarks()
+for receiver in range(5):
+    for skip in range(0, 100, 20):
+        bot.get_messages(f"profile_{{receiver}}", skip)
+elapsed = time.perf_counter() - started
+stats = cache.stats.__dict__ if cache else {{}}
+print(json.dumps([elapsed, stats]))
+"""
+
+
+def run(base_url: str, cookie: str, db: str, profiles: int) -> tuple:
+    code = CHILD.format(
+        root=ROOT, base_url=base_url, cookie=cookie, db=db, profiles=profiles
+    )
+    return json.loads(subprocess.check_output([sys.executable, "-c", code]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--profiles", type=int, default=50)
+    parser.add_argument("--delay", type=float, default=0.005)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, StubServer(delay=args.delay) as server:
+        cookie = os.path.join(tmp, "cookie.json")
+        with open(cookie, "w") as file:
+            json.dump({"session": "bench"}, file)
+        db = os.path.join(tmp, "cache.sqlite3")
+
+        results = {"none": [], "cold": [], "warm": []}
+        stats = {}
+        for _ in range(args.runs):
+            results["none"].append(run(server.base_url, cookie, "", args.profiles)[0])
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(db + suffix):
+                    os.remove(db + suffix)
+            for label in ("cold", "warm"):
+                elapsed, stats[label] = run(server.base_url, cookie, db, args.profiles)
+                results[label].append(elapsed)
+
+        print(f"{'mode':<8}{'elapsed':>10}  (ms, median of {args.runs})  stats")
+        for label, samples in results.items():
+            print(
+                f"{label:<8}{statistics.median(samples) * 1000:>10.2f}  {stats.get(label, '')}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+JSONコーデックのマイクロベンチマーク
+
+スタブサーバーから記録したレスポンス本文（通知1ページ、検索1ページ、
+投稿1000件の大きなページ）のデコードと、書き込み用のリクエスト本文の
+エンコードを、利用できるコーデックごとに計測する。
+requests.json は従来の response.json()（本文を文字列に変換してから
+標準の json で解析）に相当する。
+
+    python benchmarks/bench_codec.py [--number 200]
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import timeit
+
+import requests
+from stub_server import StubServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from NEZUNECT.utils.codec import PREFERRED_CODECS, get_codec  # noqa: E402
+
+
+def record(server: StubServer) -> dict:
+    """スタブサーバーから実際のレスポンス本文を取得する"""
+    session = requests.Session()
+    session.trust_env = False
+    urls = {
+        "notifications": "/notifications?skip=0",
+        "search": "/posts/search?skip=0",
+    }
+    payloads = {
+        name: session.get(server.base_url + path).content for name, path in urls.items()
+    }
+    # 50ページ分の投稿を1つの配列にまとめた大きな本文（サーバーと同じ json.dumps で生成）
+    posts = [
+        post
+        for skip in range(0, 1000, 20)
+        for post in session.get(f"{server.base_url}/posts/top?skip={skip}").json()[
+            "posts"
+        ]
+    ]
+    payloads["large"] = json.dumps({"posts": posts}).encode()
+    return payloads
+
+
+def response_json(content: bytes) -> object:
+    response = requests.Response()
+    response._content = content
+    response.encoding = "utf-8"
+    return response.json()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    with StubServer(total_items=1000) as server:
+        payloads = record(server)
+
+    codecs = [
+        get_codec(name)
+        for name in PREFERRED_CODECS
+        if name == "json" or importlib.util.find_spec(name)
+    ]
+    body = {"text": "こんにちは" * 20, "assets": ["asset"] * 4, "scope": "public"}
+
+    print(
+        f"{'payload':<24}{'requests.json':>14}"
+        + "".join(f"{codec.name:>12}" for codec in codecs)
+    )
+    for name, content in payloads.items():
+        base = timeit.timeit(lambda: response_json(content), number=args.number)
+        cells = [
+            timeit.timeit(lambda: codec.loads(content), number=args.number)
+            for codec in codecs
+        ]
+        label = f"{name} ({len(content) // 1024}KiB)"
+        print(
+            f"{label:<24}{base / args.number * 1e6:>14.1f}"
+            + "".join(f"{cell / args.number * 1e6:>12.1f}" for cell in cells)
+        )
+    number = args.number * 50
+    cells = [
+        timeit.timeit(lambda: codec.dumps(body), number=number) for codec in codecs
+    ]
+    base = timeit.timeit(lambda: json.dumps(body).encode(), number=number)
+    print(
+        f"{'encode (create_post)':<24}{base / number * 1e6:>14.2f}"
+        + "".join(f"{cell / number * 1e6:>12.2f}" for cell in cells)
+    )
+    print("(µs / call)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+リクエストフック（Hooks）の呼び出しコストのベンチマーク
+
+ネットワークの揺らぎを除くため、bench_metrics の CannedAdapter で固定のレスポンスを
+返し（canned）、さらに ResponseCache から返す場合（cached）も計測する。
+cached は送信もデコードもしないため、パイプライン自体のコストがそのまま見える。
+
+none:    フックなし（既定）
+global:  GLOBAL_HOOKS に何もしない before_request を1つ登録
+client:  クライアントに何もしない before_request / after_response / on_error を登録
+guard:   フックなしのときに _make_request が追加で行う判定だけの時間
+
+    python benchmarks/bench_hooks.py [--calls 20000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from bench_metrics import CannedAdapter, measure
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from NEZUNECT import NEZUNECT  # noqa: E402
+from NEZUNECT.utils import GLOBAL_HOOKS, Hooks, ResponseCache  # noqa: E402
+
+
+def noop(context) -> None:
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cookie = os.path.join(tmp, "cookie.json")
+        with open(cookie, "w") as file:
+            json.dump({"session": "bench"}, file)
+
+        client_hooks = Hooks()
+        client_hooks.before_request(noop)
+        client_hooks.after_response(noop)
+        client_hooks.on_error(noop)
+
+        def make(cached: bool, hooks=None) -> NEZUNECT:
+            bot = NEZUNECT(
+                cookie=cookie, cache=ResponseCache() if cached else None, hooks=hooks
+            )
+            bot.session.mount("https://", CannedAdapter())
+            return bot
+
+        call = lambda bot: bot.get_profile("user_1")  # noqa: E731
+        print(f"{'mode':<10}{'none us':>10}{'global us':>11}{'client us':>11}")
+        for mode, cached in (("canned", False), ("cached", True)):
+            none = measure(make(cached), call, args.calls)
+            GLOBAL_HOOKS.before_request(noop)
+            try:
+                global_ = measure(make(cached), call, args.calls)
+            finally:
+                GLOBAL_HOOKS.clear()
+            client = measure(make(cached, client_hooks), call, args.calls)
+            print(f"{mode:<10}{none:>10.2f}{global_:>11.2f}{client:>11.2f}")
+
+        # フックなしのときの判定（クライアントとグローバルの empty を見るだけ）
+        api = make(True).profile_api
+        loops = args.calls * 50
+        started = time.perf_counter()
+        for _ in range(loops):
+            if api.hooks.empty and GLOBAL_HOOKS.empty:
+                pass
+        guard = (time.perf_counter() - started) / loops * 1e9
+        print(f"{'guard':<10}{guard:>9.1f}ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+LazyModelList（lazy=True）のベンチマーク
+
+メッセージ100件のページをモデルに変換する時間を比較する。プロフィールは
+get_messages と同じくページ単位の ProfileIdentityMap で共有する。
+
+eager:        従来どおり全件を Message に変換する
+lazy:         LazyModelList を作って len と raw だけを使う（JSONの受け渡し）
+lazy+first:   先頭の1件だけを読む
+lazy+all:     全件をイテレーションする
+
+    python benchmarks/bench_lazy.py [--pages 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from functools import partial
+
+from stub_server import make_message
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from NEZUNECT.api.messages import Message  # noqa: E402
+from NEZUNECT.utils import ProfileIdentityMap  # noqa: E402
+from NEZUNECT.utils.lazy import decode_list  # noqa: E402
+
+PAGE_SIZE = 100
+
+
+def decode(items: list, lazy: bool) -> list:
+    factory = partial(Message.from_dict, profiles=ProfileIdentityMap())
+    return decode_list(items, factory, lazy)
+
+
+def eager(items: list) -> None:
+    decode(items, False)
+
+
+def lazy(items: list) -> None:
+    page = decode(items, True)
+    len(page), page.raw
+
+
+def lazy_first(items: list) -> None:
+    decode(items, True)[0].text
+
+
+def lazy_all(items: list) -> None:
+    for message in decode(items, True):
+        message.text
+
+
+def run(func, pages: list) -> float:
+    start = time.perf_counter()
+    for items in pages:
+        func(items)
+    return (time.perf_counter() - start) / len(pages) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=2000)
+    args = parser.parse_args()
+
+    pages = [
+        [make_message(page * PAGE_SIZE + index) for index in range(PAGE_SIZE)]
+        for page in range(args.pages)
+    ]
+    print(f"{'mode':<14}{'us / page':>12}")
+    for name, func in (
+        ("eager", eager),
+        ("lazy", lazy),
+        ("lazy+first", lazy_first),
+        ("lazy+all", lazy_all),
+    ):
+        print(f"{name:<14}{run(func, pages):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+メトリクス計測（MetricsRegistry）のオーバーヘッドのベンチマーク
+
+ネットワークの揺らぎを除くため、固定のレスポンスをその場で返す HTTPAdapter を
+セッションにマウントし、get_profile / get_notifications の1回あたりの所要時間を
+計測する。
+
+off:  metrics=None（既定）
+on:   MetricsRegistry を設定
+registry only: 1リクエスト分の記録処理だけの時間
+
+    python benchmarks/bench_metrics.py [--calls 20000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from requests import Response
+from requests.adapters import HTTPAdapter
+from stub_server import make_notification, make_profile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from NEZUNECT import NEZUNECT  # noqa: E402
+from NEZUNECT.utils import MetricsRegistry  # noqa: E402
+
+PAYLOADS = {
+    "/notifications": json.dumps(
+        {"notifications": [make_notification(i) for i in range(20)]}
+    ).encode(),
+    "/users/profiles/user_1": json.dumps(make_profile(1)).encode(),
+}
+
+
+class CannedAdapter(HTTPAdapter):
+    """URLのパスに応じて固定の本文を返すアダプター（送信しない）"""
+
+    def send(self, request, **kwargs):  # type: ignore[override]
+        path = request.path_url.split("?", 1)[0][len("/api") :]
+        response = Response()
+        response.status_code = 200
+        response._content = PAYLOADS[path]
+        response.headers["Content-Type"] = "application/json"
+        response.request = request
+        response.url = request.url
+        return response
+
+
+def measure(bot: NEZUNECT, call, calls: int) -> float:
+    for _ in range(100):
+        call(bot)
+    started = time.perf_counter()
+    for _ in range(calls):
+        call(bot)
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cookie = os.path.join(tmp, "cookie.json")
+        with open(cookie, "w") as file:
+            json.dump({"session": "bench"}, file)
+        bots = {
+            "off": NEZUNECT(cookie=cookie),
+            "on": NEZUNECT(cookie=cookie, metrics=MetricsRegistry()),
+        }
+        for bot in bots.values():
+            bot.session.mount("https://", CannedAdapter())
+
+        print(f"{'call':<20}{'off us':>10}{'on us':>10}{'overhead':>10}")
+        for name, call in (
+            ("get_profile", lambda bot: bot.get_profile("user_1")),
+            ("get_notifications", lambda bot: bot.get_notifications()),
+        ):
+            off = measure(bots["off"], call, args.calls)
+            on = measure(bots["on"], call, args.calls)
+            print(f"{name:<20}{off:>10.1f}{on:>10.1f}{on - off:>10.1f}")
+
+        # 1リクエストあたりの記録処理（送信1回 + decode + build）だけの時間
+        registry = MetricsRegistry()
+        started = time.perf_counter()
+        for _ in range(args.calls):
+            registry.record_attempt("GET", "/notifications", 200, 0.01, 0, 1000)
+            registry.observe("decode", "/notifications", 0.0001)
+            registry.observe("build", "/notifications", 0.0001)
+        record = (time.perf_counter() - started) / args.calls * 1e6
+        print(f"{'registry only':<20}{'':>10}{record:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+モデルクラスのメモリ使用量のベンチマーク
+
+Message と Notification を count 件（既定100万件）生成し、tracemalloc で
+1オブジェクトあたりのバイト数を計測する。フィールドの値は全件で共有し、
+オブジェクト本体（と __dict__）の大きさだけを比較する。
+
+dict:    従来の @dataclass（インスタンスごとに __dict__ を持つ）
+slots:   現在のモデル（@slotted）
+frozen:  frozen_variant() による変更できない版
+
+    python benchmarks/bench_models.py [--count 1000000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+from dataclasses import fields, make_dataclass
+
+from stub_server import make_message, make_notification
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from NEZUNECT.api.messages import FrozenMessage, Message  # noqa: E402
+from NEZUNECT.api.notify import FrozenNotification, Notification  # noqa: E402
+
+
+def plain(cls: type) -> type:
+    """__slots__ を持たない従来どおりのデータクラス"""
+    return make_dataclass(
+        cls.__name__, [(f.name, f.type) for f in fields(cls) if f.init]
+    )
+
+
+def measure(cls: type, values: dict, count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [None] * count
+    after_list, _ = tracemalloc.get_traced_memory()
+    for index in range(count):
+        objects[index] = cls(**values)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return (after - after_list) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    models = {
+        "Message": (Message, FrozenMessage, make_message(1)),
+        "Notification": (Notification, FrozenNotification, make_notification(1)),
+    }
+    print(f"{'model':<14}{'dict':>10}{'slots':>10}{'frozen':>10}  (bytes / object)")
+    for name, (cls, frozen_cls, data) in models.items():
+        sample = cls.from_dict(data)
+        values = {f.name: getattr(sample, f.name) for f in fields(cls) if f.init}
+        results = [
+            measure(variant, values, args.count)
+            for variant in (plain(cls), cls, frozen_cls)
+        ]
+        print(f"{name:<14}" + "".join(f"{result:>10.1f}" for result in results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+複数アカウントのプール（NEZUNECTPool）のベンチマーク
+
+各アカウントに「1秒あたり rate 回」のレート制限を掛けた状態で、プロフィール取得を
+threads 本のスレッドから requests 回行い（サーバーは delay 秒の遅延を入れる）、アカウント数ごとのスループットと
+スタブサーバーが受け付けた接続数を比較する。
+
+separate: アカウントごとに NEZUNECT を作る（接続もアカウントごと）
+pool:     NEZUNECTPool（接続を共有する）
+
+    python benchmarks/bench_pool.py [--requests 200] [--rate 20] [--delay 0.02] [--threads 16]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle
+
+from stub_server import StubServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from NEZUNECT import NEZUNECT, NEZUNECTPool  # noqa: E402
+from NEZUNECT.config import Config  # noqa: E402
+from NEZUNECT.utils import RateLimit, RateLimiter, TransportConfig  # noqa: E402
+
+
+def run(get_profile, count: int, threads: int) -> float:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(get_profile, (f"user_{i}" for i in range(count))))
+    return count / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--rate", type=float, default=20.0)
+    parser.add_argument("--delay", type=float, default=0.02)
+    parser.add_argument("--threads", type=int, default=16)
+    args = parser.parse_args()
+    limits = {"default": RateLimit(rate=args.rate, burst=1)}
+    transport = TransportConfig(pool_maxsize=args.threads)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cookies = []
+        for index in range(8):
+            cookie = os.path.join(tmp, f"cookie_{index}.json")
+            with open(cookie, "w") as file:
+                json.dump({"session": f"bench_{index}"}, file)
+            cookies.append(cookie)
+
+        print(f"{'mode':<10}{'accounts':>10}{'req/s':>10}{'connections':>13}")
+        for accounts in (1, 2, 4, 8):
+            with StubServer(delay=args.delay) as server:
+                Config.BASE_URL = server.base_url
+                clients = [
+                    NEZUNECT(
+                        cookie=cookie,
+                        transport=transport,
+                        rate_limiter=RateLimiter(limits),
+                    )
+                    for cookie in cookies[:accounts]
+                ]
+                rotation = cycle(clients)
+                throughput = run(
+                    lambda name: next(rotation).get_profile(name),
+                    args.requests,
+                    args.threads,
+                )
+                print(
+                    f"{'separate':<10}{accounts:>10}{throughput:>10.1f}"
+                    f"{server.connections:>13}"
+                )
+                for client in clients:
+                    client.close()
+
+            with StubServer(delay=args.delay) as server:
+                Config.BASE_URL = server.base_url
+                with NEZUNECTPool(
+                    cookies[:accounts],
+                    policy="least_loaded",
+                    transport=transport,
+                    rate_limits=limits,
+                ) as pool:
+                    throughput = run(pool.get_profile, args.requests, args.threads)
+                print(
+                    f"{'pool':<10}{accounts:>10}{throughput:>10.1f}"
+                    f"{server.connections:>13}"
+                )
+
+
+if __name__ == "__main__":
+    main()
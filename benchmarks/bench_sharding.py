@@ -0,0 +1,100 @@
+"""
+プロセスプールによる分割実行（ShardedRunner）のベンチマーク
+
+受信者ごとにメッセージ履歴を pages ページ取得して Message に変換し、
+本文の集計（後処理）を行う処理を、プロセス数を変えて実行したときの
+スループットを比較する。スタブサーバーは別プロセスで動かし、
+計測対象のプロセスとGILを取り合わないようにする。
+
+serial:     ワーカーを使わずに1プロセスで実行する
+processes:  ShardedRunner のワーカープロセス数（1, 2, 4, ... CPUコア数）
+
+    python benchmarks/bench_sharding.py [--receivers 64] [--pages 5] [--work 20]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from functools import partial
+
+from stub_server import StubServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from NEZUNECT import NEZUNECT, ShardedRunner  # noqa: E402
+from NEZUNECT.config import Config  # noqa: E402
+
+
+def serve(queue: "multiprocessing.Queue[str]", total_items: int) -> None:
+    with StubServer(total_items=total_items) as server:
+        queue.put(server.base_url)
+        threading.Event().wait()
+
+
+def summarize(client: NEZUNECT, receiver_id: str, pages: int, work: int) -> dict:
+    """1受信者分の履歴を取得して集計する（ワーカーで実行する）"""
+    words: Counter = Counter()
+    senders: Counter = Counter()
+    for page in range(pages):
+        for message in client.get_messages(receiver_id, page * 20)["data"]:
+            senders[message.profile.profile_id] += 1
+            for _ in range(work):
+                words.update(message.text.lower().split())
+    return {"receiver": receiver_id, "senders": len(senders), "words": len(words)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--receivers", type=int, default=64)
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--work", type=int, default=20)
+    args = parser.parse_args()
+    receivers = [f"profile_{i}" for i in range(args.receivers)]
+    func = partial(summarize, pages=args.pages, work=args.work)
+
+    queue: "multiprocessing.Queue[str]" = multiprocessing.Queue()
+    server = multiprocessing.Process(
+        target=serve, args=(queue, args.pages * 20), daemon=True
+    )
+    server.start()
+    Config.BASE_URL = queue.get()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cookie = os.path.join(tmp, "cookie.json")
+        with open(cookie, "w") as file:
+            json.dump({"session": "bench"}, file)
+
+        print(f"{'mode':<12}{'elapsed':>10}{'receivers/s':>14}{'speedup':>10}")
+        client = NEZUNECT(cookie=cookie)
+        started = time.perf_counter()
+        for receiver in receivers:
+            func(client, receiver)
+        baseline = time.perf_counter() - started
+        client.close()
+        print(f"{'serial':<12}{baseline:>10.2f}{len(receivers) / baseline:>14.1f}")
+
+        cores = os.cpu_count() or 1
+        counts = sorted({1, *(2**i for i in range(1, 8) if 2**i <= cores), cores})
+        for processes in counts:
+            with ShardedRunner(func, cookie=cookie, processes=processes) as runner:
+                # ワーカーの起動とクライアントの生成は計測から除く
+                runner.run(receivers[:processes])
+                started = time.perf_counter()
+                results = runner.run(receivers)
+                elapsed = time.perf_counter() - started
+            assert all(result.ok for result in results)
+            print(
+                f"{f'x{processes}':<12}{elapsed:>10.2f}"
+                f"{len(receivers) / elapsed:>14.1f}{baseline / elapsed:>10.2f}"
+            )
+    server.terminate()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+起動時間のベンチマーク
+
+新しいプロセスで「import + NEZUNECT 生成 + 最初の get_notifications」を計測する。
+lazy はサブAPIを必要な分だけ生成する現在の動作、eager は8つのサブAPIを
+すべて生成した場合（従来の動作に相当）。
+
+    python benchmarks/bench_startup.py [--runs 20]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from stub_server import StubServer
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r"""
+import sys, time, json
+t0 = time.perf_counter()
+sys.path.insert(0, {root!r})
+from NEZUNECT import NEZUNECT
+from NEZUNECT.config import Config
+t1 = time.perf_counter()
+Config.BASE_URL = {base_url!r}
+bot = NEZUNECT(cookie={cookie!r})
+if {eager!r}:
+    for name in NEZUNECT._APIS:
+        getattr(bot, name)
+t2 = time.perf_counter()
+bot.get_notifications()
+t3 = time.perf_counter()
+print(json.dumps([t1 - t0, t2 - t1, t3 - t2]))
+"""
+
+
+def run(base_url: str, cookie: str, eager: bool, runs: int) -> list:
+    code = CHILD.format(root=ROOT, base_url=base_url, cookie=cookie, eager=eager)
+    samples = []
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", code])
+        samples.append(json.loads(output))
+    return [statistics.median(column) * 1000 for column in zip(*samples)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, StubServer() as server:
+        cookie = os.path.join(tmp, "cookie.json")
+        with open(cookie, "w") as file:
+            json.dump({"session": "bench"}, file)
+
+        print(
+            f"{'mode':<8}{'import':>10}{'construct':>12}{'first call':>12}{'total':>10}  (ms, median of {args.runs})"
+        )
+        for label, eager in (("eager", True), ("lazy", False)):
+            imp, construct, call = run(server.base_url, cookie, eager, args.runs)
+            print(
+                f"{label:<8}{imp:>10.2f}{construct:>12.2f}{call:>12.2f}{imp + construct + call:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+created_at の解析コストのベンチマーク
+
+通知100件のページ（日時はすべて異なる）を from_dict でデコードする時間を比較する。
+
+eager:        従来どおり from_dict の中で datetime.fromisoformat を呼ぶ
+lazy:         現在のモデル（created_at に触れない場合）
+lazy+access:  現在のモデルで全件の created_at を読む場合
+
+    python benchmarks/bench_timestamps.py [--pages 2000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+from stub_server import make_notification
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from NEZUNECT.api.notify import Notification  # noqa: E402
+
+PAGE_SIZE = 100
+
+
+def make_page(page: int) -> list:
+    base = datetime(2024, 5, 1, 12, 0, 0)
+    items = []
+    for index in range(PAGE_SIZE):
+        item = make_notification(page * PAGE_SIZE + index)
+        moment = base + timedelta(seconds=page * PAGE_SIZE + index)
+        item["createdAt"] = moment.strftime("%Y-%m-%dT%H:%M:%S.000Z")
+        items.append(item)
+    return items
+
+
+def eager(items: list) -> list:
+    result = []
+    for item in items:
+        notification = Notification.from_dict(item)
+        raw = item.get("createdAt", "")
+        datetime.fromisoformat(raw[:-1] + "+00:00" if raw.endswith("Z") else raw)
+        result.append(notification)
+    return result
+
+
+def lazy(items: list) -> list:
+    return [Notification.from_dict(item) for item in items]
+
+
+def lazy_access(items: list) -> list:
+    result = [Notification.from_dict(item) for item in items]
+    for notification in result:
+        notification.created_at
+    return result
+
+
+def run(decode, pages: list) -> float:
+    start = time.perf_counter()
+    for items in pages:
+        decode(items)
+    return (time.perf_counter() - start) / len(pages) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pages", type=int, default=2000)
+    args = parser.parse_args()
+
+    pages = [make_page(page) for page in range(args.pages)]
+    print(f"{'mode':<14}{'us / page':>12}")
+    for name, decode in (
+        ("eager", eager),
+        ("lazy", lazy),
+        ("lazy+access", lazy_access),
+    ):
+        print(f"{name:<14}{run(decode, pages):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+スパンの記録（Tracer）のオーバーヘッドのベンチマーク
+
+ネットワークの揺らぎを除くため、bench_metrics の CannedAdapter で固定のレスポンスを
+返し、get_profile / get_notifications の1回あたりの所要時間を計測する。
+on では1呼び出しにつき親スパン1つと子スパン1つを InMemorySpanExporter に記録する。
+
+off:  tracer=None（既定）
+on:   Tracer(InMemorySpanExporter())
+spans only: 親子2つのスパンの開始と終了だけの時間
+
+    python benchmarks/bench_tracing.py [--calls 20000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+from bench_metrics import CannedAdapter, measure
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from NEZUNECT import NEZUNECT  # noqa: E402
+from NEZUNECT.utils import InMemorySpanExporter, Tracer  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cookie = os.path.join(tmp, "cookie.json")
+        with open(cookie, "w") as file:
+            json.dump({"session": "bench"}, file)
+        exporter = InMemorySpanExporter()
+        bots = {
+            "off": NEZUNECT(cookie=cookie),
+            "on": NEZUNECT(cookie=cookie, tracer=Tracer(exporter)),
+        }
+        for bot in bots.values():
+            bot.session.mount("https://", CannedAdapter())
+
+        print(f"{'call':<20}{'off us':>10}{'on us':>10}{'overhead':>10}")
+        for name, call in (
+            ("get_profile", lambda bot: bot.get_profile("user_1")),
+            ("get_notifications", lambda bot: bot.get_notifications()),
+        ):
+            off = measure(bots["off"], call, args.calls)
+            on = measure(bots["on"], call, args.calls)
+            exporter.clear()
+            print(f"{name:<20}{off:>10.1f}{on:>10.1f}{on - off:>10.1f}")
+
+        # 1呼び出しあたりのスパンの処理（親 + 子）だけの時間
+        tracer = Tracer(exporter)
+        started = time.perf_counter()
+        for _ in range(args.calls):
+            with tracer.span("ProfileAPI.get_profile"):
+                span = tracer.start_span("GET /users/profiles/{username}")
+                tracer.end_span(span)
+        spans = (time.perf_counter() - started) / args.calls * 1e6
+        exporter.clear()
+        print(f"{'spans only':<20}{'':>10}{spans:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
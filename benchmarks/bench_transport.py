@@ -0,0 +1,103 @@
+"""
+コネクションプール設定のベンチマーク
+
+ローカルのTLSスタブサーバーに対し、複数スレッドから get_notifications を
+並行に呼び出し、所要時間と負荷中にサーバー側で発生したTLSハンドシェイク数
+（ウォームアップ分は除く）を比較する。
+
+default: TransportConfig() の既定値（プール10本、ウォームアップなし）
+tuned:   スレッド数に合わせたプールと initialize() によるウォームアップ
+
+    python benchmarks/bench_transport.py [--threads 32] [--calls 20]
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from stub_server import StubServer, make_tls_context
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from NEZUNECT import NEZUNECT  # noqa: E402
+from NEZUNECT.config import Config  # noqa: E402
+from NEZUNECT.utils.transport import TransportConfig  # noqa: E402
+
+
+def run(server, cookie, cert, transport, threads, calls):
+    bot = NEZUNECT(cookie=cookie, transport=transport)
+    # REQUESTS_CA_BUNDLE などの環境変数に自己署名証明書の指定を上書きされないようにする
+    bot.session.trust_env = False
+    bot.session.verify = cert
+    bot.notify_api  # サブAPIの生成をウォームアップ前に済ませる
+    warmed = bot.initialize()
+    before = server.connections
+
+    def worker(_):
+        latencies = []
+        for _ in range(calls):
+            started = time.perf_counter()
+            bot.get_notifications()
+            latencies.append(time.perf_counter() - started)
+        return latencies
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        latencies = [x for chunk in executor.map(worker, range(threads)) for x in chunk]
+    elapsed = time.perf_counter() - started
+    bot.close()
+    return {
+        "elapsed": elapsed,
+        "handshakes": server.connections - before,
+        "warmed": warmed,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": sorted(latencies)[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args()
+    logging.getLogger("urllib3").setLevel(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cookie = os.path.join(tmp, "cookie.json")
+        with open(cookie, "w") as file:
+            json.dump({"session": "bench"}, file)
+        context, cert = make_tls_context(tmp)
+
+        with StubServer(ssl_context=context) as server:
+            Config.BASE_URL = server.base_url
+            scenarios = {
+                "default": TransportConfig(),
+                "tuned": TransportConfig(
+                    pool_maxsize=args.threads,
+                    pool_block=True,
+                    warmup_connections=args.threads,
+                ),
+            }
+            total = args.threads * args.calls
+            print(f"{args.threads} threads x {args.calls} calls over TLS")
+            print(
+                f"{'mode':<9}{'elapsed s':>10}{'req/s':>9}"
+                f"{'handshakes':>12}{'warmed':>8}{'p50 ms':>9}{'p99 ms':>9}"
+            )
+            for label, transport in scenarios.items():
+                r = run(server, cookie, cert, transport, args.threads, args.calls)
+                print(
+                    f"{label:<9}{r['elapsed']:>10.2f}{total / r['elapsed']:>9.0f}"
+                    f"{r['handshakes']:>12}{r['warmed']:>8}"
+                    f"{r['p50']:>9.2f}{r['p99']:>9.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
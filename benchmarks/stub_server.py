@@ -0,0 +1,219 @@
+"""ベンチマーク用のローカル Subnect スタブサーバー"""
+
+import json
+import os
+import socket
+import ssl
+import subprocess
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+PAGE_SIZE = 20
+
+
+def make_profile(index: int) -> Dict[str, Any]:
+    return {
+        "profileId": f"profile_{index}",
+        "username": f"user_{index}",
+        "nickname": f"ユーザー{index}",
+        "bio": "stub",
+        "icon": {"assetUrl": f"https://example.com/icon/{index}.png"},
+        "official": False,
+        "planName": "free",
+        "createdAt": "2024-05-01T12:00:00.000Z",
+        "isFollowing": False,
+        "isFollower": False,
+        "isBlocking": False,
+    }
+
+
+def make_notification(index: int) -> Dict[str, Any]:
+    return {
+        "notificationId": f"notification_{index}",
+        "type": "like",
+        "text": f"notification {index}",
+        "createdAt": "2024-05-01T12:00:00.000Z",
+        "read": False,
+        "profile": make_profile(index % 7),
+    }
+
+
+def make_message(index: int) -> Dict[str, Any]:
+    return {
+        "messageId": f"message_{index}",
+        "text": f"message {index}",
+        "createdAt": "2024-05-01T12:00:00.000Z",
+        "readAt": None,
+        "assets": [],
+        "reactions": [],
+        "profile": make_profile(0),
+        "receiver": make_profile(1),
+    }
+
+
+def make_post(index: int) -> Dict[str, Any]:
+    return {
+        "postId": f"post_{index}",
+        "text": f"post {index}",
+        "createdAt": "2024-05-01T12:00:00.000Z",
+        "scope": "public",
+        "repost": False,
+        "edited": False,
+        "repliesCount": 0,
+        "quoteCount": 0,
+        "repostCount": 0,
+        "reactionCount": 0,
+        "likeCount": index % 10,
+        "reactions": [],
+        "userReaction": None,
+        "isLiked": False,
+        "isReposted": False,
+        "profile": make_profile(index % 7),
+        "assets": [],
+    }
+
+
+def make_bookmark_folder(index: int) -> Dict[str, Any]:
+    return {
+        "folderId": f"folder_{index}",
+        "name": f"フォルダ{index}",
+        "postCount": index,
+        "createdAt": "2024-05-01T12:00:00.000+00:00",
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # ヘッダーと本文を別々に書くため、Nagle と遅延ACKで40ms待たされないようにする
+    disable_nagle_algorithm = True
+    server: "StubServer"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send(self, status: int, body: Any) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _page(self, query: Dict[str, Any], key: str, factory: Any) -> Dict[str, Any]:
+        skip = int(query.get("skip", ["0"])[0])
+        end = min(skip + PAGE_SIZE, self.server.total_items)
+        return {key: [factory(i) for i in range(skip, end)]}
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        path = url.path[len("/api") :]
+        query = parse_qs(url.query)
+        if self.server.delay:
+            threading.Event().wait(self.server.delay)
+        if path == "/notifications":
+            self._send(200, self._page(query, "notifications", make_notification))
+        elif path in ("/posts/search", "/posts/top"):
+            self._send(200, self._page(query, "posts", make_post))
+        elif path.startswith("/messages/"):
+            self._send(200, self._page(query, "messages", make_message))
+        elif path == "/bookmarks":
+            self._send(200, {"folders": [make_bookmark_folder(i) for i in range(10)]})
+        elif path.startswith("/users/profiles/"):
+            index = path.rsplit("_", 1)[-1]
+            self._send(200, make_profile(int(index) if index.isdigit() else 0))
+        else:
+            self._send(404, {"message": "not found"})
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.server.delay:
+            threading.Event().wait(self.server.delay)
+        if "fail" in self.path:
+            self._send(404, {"message": "not found"})
+        else:
+            self._send(200, {"success": True})
+
+    do_PUT = do_POST
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class StubServer(ThreadingHTTPServer):
+    """別スレッドで動作するスタブサーバー"""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        total_items: int = 200,
+        delay: float = 0.0,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ) -> None:
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.total_items = total_items
+        self.delay = delay
+        self.ssl_context = ssl_context
+        self.connections = 0
+        self._connections_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        scheme = "https" if self.ssl_context else "http"
+        return f"{scheme}://127.0.0.1:{self.server_port}/api"
+
+    def finish_request(self, request: socket.socket, client_address: Any) -> None:
+        # TLSハンドシェイクは受け付けスレッドではなく各リクエストスレッドで行う
+        with self._connections_lock:
+            self.connections += 1
+        if self.ssl_context:
+            try:
+                request = self.ssl_context.wrap_socket(request, server_side=True)
+            except (OSError, ssl.SSLError):
+                return
+        super().finish_request(request, client_address)
+
+    def __enter__(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def make_tls_context(directory: str) -> "tuple[ssl.SSLContext, str]":
+    """openssl で自己署名証明書を作り、(サーバー用コンテキスト, 証明書パス) を返す"""
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-keyout",
+            key,
+            "-out",
+            cert,
+            "-days",
+            "1",
+            "-subj",
+            "/CN=127.0.0.1",
+            "-addext",
+            "subjectAltName=IP:127.0.0.1",
+        ],
+        check=True,
+        capture_output=True,
+    )
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert, key)
+    return context, cert
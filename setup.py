@@ -33,6 +33,12 @@ setup(
         "typing-extensions>=4.0.0",
     ],
     extras_require={
+        "async": [
+            "httpx>=0.23.0",
+        ],
+        "fast": [
+            "orjson>=3.6.0",
+        ],
         "dev": [
             "pytest>=6.0.0",
             "pytest-cov>=2.0.0",
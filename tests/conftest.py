@@ -0,0 +1,136 @@
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+
+from NEZUNECT import NEZUNECT
+from NEZUNECT.config import Config
+
+PAGE_SIZE = 20
+
+Reply = Tuple[int, Any, Dict[str, str]]
+Handler = Callable[[PreparedRequest, Dict[str, List[str]]], Union[Reply, Any]]
+
+
+def make_profile(index: int) -> Dict[str, Any]:
+    return {
+        "profileId": f"profile_{index}",
+        "username": f"user_{index}",
+        "nickname": f"user {index}",
+        "bio": "",
+        "icon": {"assetUrl": f"https://example.com/icon/{index}.png"},
+        "official": False,
+        "planName": "free",
+        "createdAt": "2024-05-01T12:00:00.000Z",
+        "isFollowing": False,
+        "isFollower": False,
+        "isBlocking": False,
+    }
+
+
+def make_message(index: int) -> Dict[str, Any]:
+    return {
+        "messageId": f"message_{index}",
+        "text": f"message {index}",
+        "createdAt": f"2024-05-01T12:{index // 60:02d}:{index % 60:02d}.000Z",
+        "readAt": None,
+        "assets": [],
+        "reactions": [],
+        "profile": make_profile(0),
+        "receiver": make_profile(1),
+    }
+
+
+class FakeServer(HTTPAdapter):
+    """
+    (メソッド, パス) ごとに登録したハンドラーで応答する、送信しないアダプター
+
+    ハンドラーは (request, query) を受け取り、本文か (ステータス, 本文, ヘッダー)
+    を返す。ルートに list を登録すると、呼ばれるたびに先頭から1つずつ返す。
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.routes: Dict[Tuple[str, str], Any] = {}
+        self.requests: List[PreparedRequest] = []
+
+    def route(self, method: str, path: str, handler: Any) -> None:
+        self.routes[(method, path)] = handler
+
+    def calls(self, method: Optional[str] = None, path: Optional[str] = None) -> int:
+        return sum(
+            1
+            for request in self.requests
+            if (method is None or request.method == method)
+            and (path is None or _path(request) == path)
+        )
+
+    def send(self, request, **kwargs):  # type: ignore[override]
+        self.requests.append(request)
+        key = (request.method, _path(request))
+        handler = self.routes.get(key)
+        if handler is None:
+            reply: Any = (404, {"message": "not found"}, {})
+        elif isinstance(handler, list):
+            reply = handler.pop(0)
+        else:
+            reply = handler(request, parse_qs(urlparse(request.url).query))
+        if isinstance(reply, Exception):
+            raise reply
+        if not (isinstance(reply, tuple) and len(reply) == 3):
+            reply = (200, reply, {})
+        status, body, headers = reply
+        response = Response()
+        response.status_code = status
+        response._content = b"" if body is None else json.dumps(body).encode()
+        response.headers.update({"Content-Type": "application/json", **headers})
+        response.request = request
+        response.url = request.url
+        response.reason = "Fake"
+        return response
+
+
+def _path(request: PreparedRequest) -> str:
+    return urlparse(request.url).path[len(urlparse(Config.BASE_URL).path) :]
+
+
+def message_pages(total: int) -> Handler:
+    """新しい順に total 件のメッセージを PAGE_SIZE 件ずつ返すハンドラー"""
+
+    def handler(request: PreparedRequest, query: Dict[str, List[str]]) -> Any:
+        skip = int(query.get("skip", ["0"])[0])
+        indexes = range(total - 1 - skip, max(total - 1 - skip - PAGE_SIZE, -1), -1)
+        return {"messages": [make_message(index) for index in indexes]}
+
+    return handler
+
+
+@pytest.fixture
+def cookie(tmp_path) -> str:
+    path = tmp_path / "cookie.json"
+    path.write_text(json.dumps({"session": "test"}))
+    return str(path)
+
+
+@pytest.fixture
+def server() -> FakeServer:
+    return FakeServer()
+
+
+@pytest.fixture
+def make_client(cookie: str, server: FakeServer) -> Callable[..., NEZUNECT]:
+    """FakeServer に接続した NEZUNECT を作る"""
+    clients: List[NEZUNECT] = []
+
+    def factory(**options: Any) -> NEZUNECT:
+        client = NEZUNECT(cookie=options.pop("cookie", cookie), **options)
+        client.session.mount(Config.BASE_URL, server)
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        client.close()
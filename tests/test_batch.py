@@ -0,0 +1,51 @@
+from NEZUNECT.utils import APIError
+from NEZUNECT.utils.batch import BatchResult, BulkReport, run_bulk
+
+
+def like(item):
+    if item.startswith("bad"):
+        raise APIError("failed", 500)
+    return item
+
+
+def test_pending_lists_each_item_once():
+    report = run_bulk(like, ["bad_1", "ok_1", "bad_1", "bad_2", "ok_1"])
+
+    assert sorted(report.succeeded) == ["ok_1"]
+    assert sorted(report.pending()) == ["bad_1", "bad_2"]
+
+
+def test_pending_deduplicates_merged_reports():
+    error = APIError("failed", 500)
+    report = BulkReport(
+        succeeded=["a"],
+        failed=[BatchResult("b", error=error), BatchResult("b", error=error)],
+        skipped=["b", "a", "c", "c"],
+    )
+
+    assert report.pending() == ["b", "c"]
+
+
+def test_resume_sends_only_pending_items():
+    sent = []
+
+    def record(item):
+        sent.append(item)
+        return like(item)
+
+    first = run_bulk(record, ["ok_1", "bad_1", "ok_2"])
+    sent.clear()
+    second = run_bulk(record, first.pending() + ["ok_1"], resume=first)
+
+    assert sent == ["bad_1"]
+    assert sorted(second.succeeded) == ["ok_1", "ok_2"]
+    assert second.pending() == ["bad_1"]
+
+
+def test_report_round_trips_through_dict():
+    report = run_bulk(like, ["ok_1", "bad_1"])
+    restored = BulkReport.from_dict(report.to_dict())
+
+    assert restored.succeeded == report.succeeded
+    assert restored.pending() == ["bad_1"]
+    assert restored.failed[0].error.status_code == 500
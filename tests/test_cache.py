@@ -0,0 +1,135 @@
+from NEZUNECT.utils.cache import ResponseCache, SQLiteCacheBackend
+
+from .conftest import make_profile, message_pages
+
+PROFILE = "/users/profiles/user_1"
+
+
+def profile_route(server, etag=None):
+    headers = {"ETag": etag} if etag else {}
+
+    def handler(request, query):
+        if etag and request.headers.get("If-None-Match") == etag:
+            return 304, None, headers
+        return 200, make_profile(1), headers
+
+    server.route("GET", PROFILE, handler)
+
+
+def test_make_key_ignores_param_order():
+    make_key = ResponseCache.make_key
+    assert make_key("/x", {"a": 1, "b": 2}, "me") == make_key(
+        "/x", {"b": 2, "a": 1}, "me"
+    )
+    assert make_key("/x", None, "me") == make_key("/x", {}, "me")
+    assert make_key("/x", {"skip": 0}, "me") != make_key("/x", {"skip": 20}, "me")
+    assert make_key("/x", None, "me") != make_key("/x", None, "other")
+
+
+def test_fresh_entry_is_served_without_request(make_client, server):
+    profile_route(server)
+    client = make_client(cache=ResponseCache())
+
+    first = client.get_profile("user_1")["data"]
+    second = client.get_profile("user_1")["data"]
+
+    assert server.calls("GET", PROFILE) == 1
+    assert second.username == first.username == "user_1"
+    assert client.cache.stats.hits == 1
+    assert client.cache.stats.misses == 1
+
+
+def test_templates_without_ttl_are_not_cached(make_client, server):
+    profile_route(server)
+    client = make_client(cache=ResponseCache(ttls={}))
+
+    client.get_profile("user_1")
+    client.get_profile("user_1")
+
+    assert server.calls("GET", PROFILE) == 2
+    assert len(client.cache) == 0
+
+
+def test_expired_entry_is_revalidated_with_etag(make_client, server):
+    profile_route(server, etag='"v1"')
+    client = make_client(cache=ResponseCache(ttls={"/users/profiles/{username}": 0}))
+
+    client.get_profile("user_1")
+    data = client.get_profile("user_1")["data"]
+
+    assert server.calls("GET", PROFILE) == 2
+    assert server.requests[-1].headers["If-None-Match"] == '"v1"'
+    assert data.username == "user_1"
+    assert client.cache.stats.revalidations == 1
+
+
+def test_lru_eviction_by_entries_and_bytes():
+    cache = ResponseCache(ttls={"/t": 60}, max_entries=2)
+    for name in ("a", "b"):
+        cache.store(name, "/t", name, {}, 1)
+    cache.lookup("a")  # a を最近使ったものにする
+    cache.store("c", "/t", "c", {}, 1)
+
+    assert cache.lookup("b") is None
+    assert cache.lookup("a").data == "a"
+    assert cache.stats.evictions == 1
+
+    cache = ResponseCache(ttls={"/t": 60}, max_bytes=10)
+    cache.store("a", "/t", "a", {}, 6)
+    cache.store("b", "/t", "b", {}, 6)
+    assert cache.lookup("a") is None
+    assert cache.lookup("b").data == "b"
+
+
+def test_write_invalidates_related_templates(make_client, server):
+    profile_route(server)
+    server.route("PUT", "/users/profiles", lambda request, query: {"success": True})
+    client = make_client(cache=ResponseCache())
+
+    client.get_profile("user_1")
+    client.profile_api.update_profile(nickname="new")
+    client.get_profile("user_1")
+
+    assert server.calls("GET", PROFILE) == 2
+    assert client.cache.stats.invalidations >= 1
+
+
+def test_persistent_tier_is_shared_between_caches(tmp_path):
+    path = str(tmp_path / "cache.db")
+    first = ResponseCache(ttls={"/t": 60}, persistent=SQLiteCacheBackend(path))
+    key = ResponseCache.make_key("/t", None, "me")
+    first.store(key, "/t", {"value": 1}, {"ETag": '"e"'}, 10)
+
+    second = ResponseCache(ttls={"/t": 60}, persistent=SQLiteCacheBackend(path))
+    entry = second.lookup(key)
+
+    assert entry is not None and entry.data == {"value": 1}
+    assert entry.etag == '"e"'
+    assert second.stats.persistent_hits == 1
+
+
+def test_accounts_sharing_a_cache_do_not_see_each_other(make_client, server, tmp_path):
+    profile_route(server)
+    other = tmp_path / "other.json"
+    other.write_text('{"session": "other"}')
+    cache = ResponseCache(persistent=SQLiteCacheBackend(str(tmp_path / "cache.db")))
+    first = make_client(cache=cache)
+    second = make_client(cache=cache, cookie=str(other))
+
+    first.get_profile("user_1")
+    second.get_profile("user_1")
+    first.get_profile("user_1")
+
+    assert server.calls("GET", PROFILE) == 2
+    assert cache.stats.hits == 1
+    assert cache.stats.persistent_hits == 0
+
+
+def test_messages_are_not_cached_by_default(make_client, server):
+    server.route("GET", "/messages/r1", message_pages(3))
+    client = make_client(cache=ResponseCache())
+
+    client.get_messages("r1")
+    client.get_messages("r1")
+
+    assert server.calls("GET", "/messages/r1") == 2
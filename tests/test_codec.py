@@ -0,0 +1,68 @@
+import sys
+
+import pytest
+
+from NEZUNECT.utils.codec import JSONCodec, get_codec
+
+PAYLOAD = {"text": "こんにちは", "count": 3, "items": [1.5, None, True]}
+
+
+@pytest.fixture(autouse=True)
+def fresh_codecs():
+    get_codec.cache_clear()
+    yield
+    get_codec.cache_clear()
+
+
+def available(name):
+    try:
+        return get_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} がインストールされていない")
+
+
+def test_falls_back_to_the_next_installed_codec(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "ujson", None)
+
+    assert get_codec().name == "json"
+
+
+def test_explicit_name_is_not_replaced_by_a_fallback(monkeypatch):
+    monkeypatch.setitem(sys.modules, "orjson", None)
+
+    with pytest.raises(ImportError):
+        get_codec("orjson")
+    with pytest.raises(ValueError, match="msgpack"):
+        get_codec("msgpack")
+
+
+def test_default_codec_is_cached():
+    assert get_codec() is get_codec()
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "ujson"])
+def test_codecs_round_trip_bytes_without_escaping(name):
+    codec = available(name)
+
+    body = codec.dumps(PAYLOAD)
+
+    assert isinstance(body, bytes)
+    assert "こんにちは".encode("utf-8") in body
+    assert codec.loads(body) == PAYLOAD
+    assert codec.loads(body.decode("utf-8")) == PAYLOAD
+
+
+def test_client_passes_the_raw_body_to_the_codec(make_client, server):
+    server.route("GET", "/notifications", lambda request, query: {"notifications": []})
+    bodies = []
+    stdlib = get_codec("json")
+
+    def loads(body):
+        bodies.append(body)
+        return stdlib.loads(body)
+
+    client = make_client(codec=JSONCodec("spy", stdlib.dumps, loads))
+    client.get_notifications()
+
+    assert [type(body) for body in bodies] == [bytes]
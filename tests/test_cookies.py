@@ -0,0 +1,64 @@
+import json
+import os
+
+import requests
+
+from NEZUNECT.utils import CookieStore
+
+
+def rewrite(path, text):
+    """内容を書き換え、更新日時を確実に進める"""
+    stat = os.stat(path)
+    path.write_text(text)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_rotation_is_picked_up(tmp_path):
+    path = tmp_path / "cookie.json"
+    path.write_text(json.dumps({"session": "old"}))
+    store = CookieStore(str(path), check_interval=0)
+
+    rewrite(path, json.dumps({"session": "new"}))
+
+    assert store.cookies == {"session": "new"}
+    assert store.version == 2
+
+
+def test_truncated_file_keeps_the_last_good_cookies(tmp_path):
+    path = tmp_path / "cookie.json"
+    path.write_text(json.dumps({"session": "old"}))
+    store = CookieStore(str(path), check_interval=0)
+
+    rewrite(path, '{"session": "ne')
+    assert store.refresh() is False
+    assert store.cookies == {"session": "old"}
+    assert store.version == 1
+
+    # 書き込みが終わった後の確認で読み直す
+    rewrite(path, json.dumps({"session": "new"}))
+    assert store.refresh() is True
+    assert store.cookies == {"session": "new"}
+
+
+def test_removed_file_keeps_the_last_good_cookies(tmp_path):
+    path = tmp_path / "cookie.json"
+    path.write_text(json.dumps({"session": "old"}))
+    store = CookieStore(str(path), check_interval=0)
+
+    path.unlink()
+
+    assert store.refresh() is False
+    assert store.cookies == {"session": "old"}
+
+
+def test_apply_drops_cookies_removed_by_rotation(tmp_path):
+    path = tmp_path / "cookie.json"
+    path.write_text(json.dumps({"session": "old", "csrf": "token"}))
+    store = CookieStore(str(path), check_interval=0)
+    session = requests.Session()
+    store.apply(session)
+
+    rewrite(path, json.dumps({"session": "new"}))
+    store.apply(session)
+
+    assert session.cookies.get_dict() == {"session": "new"}
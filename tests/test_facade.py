@@ -0,0 +1,72 @@
+import asyncio
+import inspect
+import json
+
+import httpx
+
+from NEZUNECT import NEZUNECT
+from NEZUNECT.aio import AsyncNEZUNECT
+from NEZUNECT.config import Config
+from NEZUNECT.utils import TransportConfig
+
+# 対応するサブAPIがまだ無い、または同期版にしか無い機能
+SYNC_ONLY = {
+    "message_sync",
+    "post_quote",
+    "post_reaction",
+    "post_reply",
+    "watch_notifications",
+}
+
+
+def public_methods(cls):
+    return {
+        name
+        for name, member in vars(cls).items()
+        if not name.startswith("_") and inspect.isfunction(member)
+    }
+
+
+def test_async_facade_mirrors_the_sync_facade():
+    assert public_methods(AsyncNEZUNECT) == public_methods(NEZUNECT) - SYNC_ONLY
+
+
+def test_profile_shortcuts_delegate_to_update_profile(make_client, server):
+    bodies = []
+    server.route(
+        "PUT",
+        Config.Endpoints.PROFILE,
+        lambda request, query: bodies.append(json.loads(request.body)) or {},
+    )
+    client = make_client()
+
+    client.change_profile_name("new name")
+    client.change_profile_name_bio("name", "bio")
+
+    assert bodies == [{"nickname": "new name"}, {"nickname": "name", "bio": "bio"}]
+
+
+def test_async_client_accepts_a_session_and_applies_transport_timeouts(cookie):
+    seen = []
+
+    def handler(request):
+        seen.append((request.url.path, request.extensions["timeout"]))
+        return httpx.Response(200, json={})
+
+    async def main():
+        session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with AsyncNEZUNECT(
+            cookie=cookie,
+            session=session,
+            transport=TransportConfig(connect_timeout=1.5, read_timeout=7.0),
+        ) as client:
+            assert client.profile_api.session is session
+            await client.post_profile_pin("post_1")
+
+    asyncio.run(main())
+
+    path = Config.Endpoints.POST_PIN.format(post_id="post_1")
+    ((sent_path, timeout),) = seen
+    assert sent_path.endswith(path)
+    assert timeout["connect"] == 1.5
+    assert timeout["read"] == 7.0
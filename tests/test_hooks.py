@@ -0,0 +1,125 @@
+import asyncio
+
+import httpx
+import pytest
+
+from NEZUNECT.aio.notify import AsyncNotifyAPI
+from NEZUNECT.utils import APIError, CookieStore, Hooks, RetryPolicy
+from NEZUNECT.utils.hooks import GLOBAL_HOOKS
+
+NOTIFICATIONS = "/notifications"
+
+
+@pytest.fixture(autouse=True)
+def clean_global_hooks():
+    yield
+    GLOBAL_HOOKS.clear()
+
+
+def recorder(calls, name, value=None):
+    def hook(context):
+        calls.append(name)
+        return value
+
+    return hook
+
+
+def test_hooks_run_in_priority_order_around_the_request(make_client, server):
+    server.route("GET", NOTIFICATIONS, lambda request, query: {"notifications": []})
+    calls = []
+    hooks = Hooks()
+    hooks.before_request(recorder(calls, "before:client"))
+    hooks.before_request(recorder(calls, "before:outer"), priority=-1)
+    hooks.after_response(recorder(calls, "after:client"))
+    hooks.after_response(recorder(calls, "after:outer"), priority=-1)
+    GLOBAL_HOOKS.before_request(recorder(calls, "before:global"))
+    GLOBAL_HOOKS.after_response(recorder(calls, "after:global"))
+
+    make_client(hooks=hooks).get_notifications()
+
+    assert calls == [
+        "before:outer",
+        "before:global",
+        "before:client",
+        "after:client",
+        "after:global",
+        "after:outer",
+    ]
+
+
+def test_before_request_can_rewrite_the_request(make_client, server):
+    server.route("GET", NOTIFICATIONS, lambda request, query: {"notifications": []})
+    hooks = Hooks()
+
+    @hooks.before_request
+    def tag(context):
+        context.headers["X-Trace"] = "abc"
+        context.params = {**(context.params or {}), "skip": 40}
+
+    make_client(hooks=hooks).get_notifications()
+
+    (request,) = server.requests
+    assert request.headers["X-Trace"] == "abc"
+    assert "skip=40" in request.url
+
+
+def test_before_request_short_circuits_the_request(make_client, server):
+    calls = []
+    hooks = Hooks()
+    hooks.before_request(recorder(calls, "first", {"notifications": []}))
+    hooks.before_request(recorder(calls, "second"), priority=1)
+
+    @hooks.after_response
+    def check(context):
+        calls.append(("after", context.short_circuited))
+
+    result = make_client(hooks=hooks).get_notifications()
+
+    assert result["data"] == []
+    assert calls == ["first", ("after", True)]
+    assert server.requests == []
+
+
+def test_on_error_can_recover_or_let_the_error_through(make_client, server):
+    server.route("GET", NOTIFICATIONS, lambda request, query: (500, {}, {}))
+    calls = []
+    hooks = Hooks()
+
+    @hooks.on_error
+    def record(context):
+        calls.append(context.error.status_code)
+
+    client = make_client(hooks=hooks, retry_policy=RetryPolicy(max_attempts=1))
+    with pytest.raises(APIError):
+        client.get_notifications()
+    assert calls == [500]
+
+    # on_error は priority の大きい順に呼ばれ、回復した時点で残りは呼ばれない
+    hooks.on_error(lambda context: {"notifications": []}, priority=1)
+    assert client.get_notifications()["data"] == []
+    assert calls == [500]
+
+
+def test_async_clients_await_coroutine_hooks(cookie):
+    calls = []
+    hooks = Hooks()
+
+    @hooks.before_request
+    async def stub(context):
+        await asyncio.sleep(0)
+        calls.append(context.template)
+        return {"notifications": []}
+
+    def handler(request):
+        raise AssertionError("short-circuited requests must not be sent")
+
+    async def main():
+        session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        api = AsyncNotifyAPI(session, CookieStore.get(cookie), hooks=hooks)
+        try:
+            return await api.get_notifications()
+        finally:
+            await session.aclose()
+
+    assert asyncio.run(main())["data"] == []
+    assert calls == [NOTIFICATIONS]
@@ -0,0 +1,45 @@
+from dataclasses import asdict
+
+from NEZUNECT.api.posts import PostProfile
+from NEZUNECT.utils import ProfileIdentityMap
+from NEZUNECT.utils.timestamps import raw_timestamp
+
+from .conftest import make_profile
+
+
+def test_same_profile_is_shared():
+    profiles = ProfileIdentityMap()
+
+    first = profiles.intern(PostProfile, make_profile(1))
+    second = profiles.intern(PostProfile, make_profile(1))
+
+    assert first is second
+    assert profiles.stats.hits == 1
+
+
+def test_refresh_updates_the_shared_instance_in_place():
+    profiles = ProfileIdentityMap()
+    shared = profiles.intern(PostProfile, make_profile(1))
+    shared.created_at  # 解析済みの値が更新後に残らないことも確かめる
+
+    changed = dict(make_profile(1), nickname="renamed")
+    changed["createdAt"] = "2024-06-01T00:00:00.000Z"
+    refreshed = profiles.intern(PostProfile, changed)
+
+    assert refreshed is shared
+    assert shared.nickname == "renamed"
+    assert profiles.stats.refreshes == 1
+    # 解析前の文字列のまま写し、アクセスされるまで解析しない
+    assert raw_timestamp(shared) == "2024-06-01T00:00:00.000Z"
+    assert shared._created_at is None
+    assert shared.created_at.month == 6
+    assert asdict(shared) == asdict(PostProfile.from_dict(changed))
+
+
+def test_dict_profiles_are_refreshed_in_place():
+    profiles = ProfileIdentityMap()
+    shared = profiles.intern(dict, make_profile(1))
+
+    profiles.intern(dict, dict(make_profile(1), bio="new"))
+
+    assert shared["bio"] == "new"
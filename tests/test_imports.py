@@ -0,0 +1,28 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+SCRIPT = """
+import json, sys
+from NEZUNECT import NEZUNECT
+from NEZUNECT.utils import ResponseCache, SingleFlight
+from NEZUNECT.utils import batch, pagination  # noqa: F401
+
+client = NEZUNECT(cookie=sys.argv[1], cache=ResponseCache(), single_flight=SingleFlight())
+for name in ("profile_api", "posts_api", "notify_api", "messages_api"):
+    getattr(client, name)
+print(json.dumps({name: name in sys.modules for name in ("asyncio", "sqlite3")}))
+"""
+
+
+def test_sync_client_does_not_import_asyncio_or_sqlite3(cookie):
+    output = subprocess.run(
+        [sys.executable, "-c", SCRIPT, cookie],
+        check=True,
+        cwd=Path(__file__).resolve().parent.parent,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+    assert json.loads(output) == {"asyncio": False, "sqlite3": False}
@@ -0,0 +1,84 @@
+from NEZUNECT.api.messages import Message
+from NEZUNECT.utils.lazy import LazyModelList, decode_list
+
+from .conftest import make_message, message_pages
+
+
+class CountingFactory:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, item):
+        self.calls += 1
+        return Message.from_dict(item)
+
+
+def make_list(count):
+    factory = CountingFactory()
+    return (
+        LazyModelList([make_message(index) for index in range(count)], factory),
+        factory,
+    )
+
+
+def test_items_are_built_on_access_and_cached():
+    models, factory = make_list(5)
+    assert factory.calls == 0
+
+    first = models[1]
+    assert models[1] is first
+    assert models[-4] is first
+    assert factory.calls == 1
+    assert models.built == 1
+
+    assert [model.message_id for model in models] == [
+        f"message_{index}" for index in range(5)
+    ]
+    assert factory.calls == 5
+    assert list(models)[1] is first
+
+
+def test_slices_are_lazy_and_reuse_built_models():
+    models, factory = make_list(6)
+    second = models[2]
+
+    view = models[1:5:1]
+    assert isinstance(view, LazyModelList)
+    assert len(view) == 4
+    assert factory.calls == 1
+
+    assert view[1] is second
+    assert [model.message_id for model in models[::-2]] == [
+        "message_5",
+        "message_3",
+        "message_1",
+    ]
+    assert view.raw == models.raw[1:5]
+
+
+def test_raw_is_the_response_list():
+    raw = [make_message(index) for index in range(3)]
+    models = LazyModelList(raw, Message.from_dict)
+
+    assert models.raw is raw
+    assert models == [Message.from_dict(item) for item in raw]
+    assert repr(models) == "LazyModelList(len=3, built=3)"
+
+
+def test_decode_list_returns_a_list_unless_lazy():
+    raw = [make_message(0)]
+
+    assert type(decode_list(raw, Message.from_dict, lazy=False)) is list
+    assert isinstance(decode_list(raw, Message.from_dict, lazy=True), LazyModelList)
+
+
+def test_lazy_pages_from_the_client(make_client, server):
+    server.route("GET", "/messages/r1", message_pages(3))
+    client = make_client()
+
+    messages = client.get_messages("r1", lazy=True)["data"]
+
+    assert isinstance(messages, LazyModelList)
+    assert messages.built == 0
+    assert messages.raw[0]["messageId"] == "message_2"
+    assert messages[0].message_id == "message_2"
@@ -0,0 +1,89 @@
+from NEZUNECT.api.message_sync import MessageSync
+
+from .conftest import PAGE_SIZE, make_message, message_pages
+
+MESSAGES = "/messages/r1"
+
+
+def open_sync(client, tmp_path):
+    return MessageSync(client.messages_api, str(tmp_path / "messages.db"))
+
+
+def test_empty_conversation_finishes_backfill(make_client, server, tmp_path):
+    server.route("GET", MESSAGES, message_pages(0))
+    sync = open_sync(make_client(), tmp_path)
+
+    assert sync.backfill("r1") == 0
+    assert sync.state("r1").backfill_done
+
+    thread = sync.start_backfill(["r1"])
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    sync.close()
+
+
+def test_backfill_resumes_from_stored_count(make_client, server, tmp_path):
+    server.route("GET", MESSAGES, message_pages(50))
+    client = make_client()
+    sync = open_sync(client, tmp_path)
+
+    # sync() で最新の1ページを保存してから、さらに1ページ遡る
+    assert sync.backfill("r1", max_pages=1) == PAGE_SIZE
+    state = sync.state("r1")
+    assert state.stored == 2 * PAGE_SIZE
+    assert state.newest_id == "message_49"
+    assert not state.backfill_done
+    sync.close()
+
+    # 開き直しても保存済みの位置から続ける
+    sync = open_sync(client, tmp_path)
+    assert sync.backfill("r1") == 10
+    assert sync.state("r1").backfill_done
+    assert sync.backfill("r1") == 0
+
+    messages = sync.messages("r1")
+    assert len(messages) == 50
+    assert messages[0].message_id == "message_49"
+    assert messages[-1].message_id == "message_0"
+    sync.close()
+
+
+def test_sync_fetches_only_new_messages(make_client, server, tmp_path):
+    server.route("GET", MESSAGES, message_pages(30))
+    sync = open_sync(make_client(), tmp_path)
+    assert sync.sync("r1") == PAGE_SIZE
+
+    server.route("GET", MESSAGES, message_pages(35))
+    before = server.calls("GET", MESSAGES)
+    assert sync.sync("r1") == 5
+    assert server.calls("GET", MESSAGES) == before + 1
+    assert sync.state("r1").newest_id == "message_34"
+    sync.close()
+
+
+def test_sync_compares_timestamps_across_formats(make_client, server, tmp_path):
+    server.route("GET", MESSAGES, message_pages(30))
+    sync = open_sync(make_client(), tmp_path)
+    sync.sync("r1")
+
+    # 前回の最新メッセージが消え、createdAt が +09:00 の形式で返るようになった
+    def handler(request, query):
+        skip = int(query.get("skip", ["0"])[0])
+        messages = []
+        for index in range(59, -1, -1):
+            if index == 29:
+                continue
+            message = make_message(index)
+            message["createdAt"] = (
+                f"2024-05-01T21:{index // 60:02d}:{index % 60:02d}+09:00"
+            )
+            messages.append(message)
+        return {"messages": messages[skip : skip + PAGE_SIZE]}
+
+    server.route("GET", MESSAGES, handler)
+    before = server.calls("GET", MESSAGES)
+    sync.sync("r1")
+
+    assert server.calls("GET", MESSAGES) == before + 2
+    assert sync.state("r1").newest_id == "message_59"
+    sync.close()
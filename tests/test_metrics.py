@@ -0,0 +1,63 @@
+import re
+
+from NEZUNECT.utils.metrics import MetricsRegistry
+
+from .conftest import message_pages
+
+
+def test_render_counters_and_histogram():
+    registry = MetricsRegistry(buckets=(0.1, 1.0))
+    registry.record_attempt("GET", "/messages/{receiver_id}", 200, 0.05, 0, 120)
+    registry.record_attempt("GET", "/messages/{receiver_id}", None, 2.0, 0, 0)
+    registry.record_retry("GET", "/messages/{receiver_id}")
+    registry.observe("decode", "/messages/{receiver_id}", 0.5)
+
+    lines = registry.render().splitlines()
+
+    labels = 'method="GET",endpoint="/messages/{receiver_id}"'
+    assert f'nezunect_requests_total{{{labels},status="200"}} 1' in lines
+    assert f'nezunect_requests_total{{{labels},status="error"}} 1' in lines
+    assert f"nezunect_retries_total{{{labels}}} 1" in lines
+    assert f"nezunect_response_bytes_total{{{labels}}} 120" in lines
+    decode = 'endpoint="/messages/{receiver_id}",phase="decode"'
+    network = 'endpoint="/messages/{receiver_id}",phase="network"'
+    # バケットは累積で、phase ごとに +Inf・sum・count が続く
+    start = lines.index(f'nezunect_latency_seconds_bucket{{{decode},le="0.1"}} 0')
+    assert lines[start : start + 5] == [
+        f'nezunect_latency_seconds_bucket{{{decode},le="0.1"}} 0',
+        f'nezunect_latency_seconds_bucket{{{decode},le="1.0"}} 1',
+        f'nezunect_latency_seconds_bucket{{{decode},le="+Inf"}} 1',
+        f"nezunect_latency_seconds_sum{{{decode}}} 0.5",
+        f"nezunect_latency_seconds_count{{{decode}}} 1",
+    ]
+    assert f'nezunect_latency_seconds_bucket{{{network},le="0.1"}} 1' in lines
+    assert f'nezunect_latency_seconds_bucket{{{network},le="+Inf"}} 2' in lines
+    assert f"nezunect_latency_seconds_count{{{network}}} 2" in lines
+    assert "# TYPE nezunect_latency_seconds histogram" in lines
+
+
+def test_render_escapes_labels_and_uses_the_prefix():
+    registry = MetricsRegistry(prefix="app")
+    registry.observe('say "hi"\n', "/a\\b", 0.001)
+
+    text = registry.render()
+
+    assert (
+        'app_latency_seconds_count{endpoint="/a\\\\b",phase="say \\"hi\\"\\n"} 1'
+        in text
+    )
+    assert text.endswith("\n")
+
+
+def test_client_records_network_decode_and_build_phases(make_client, server):
+    server.route("GET", "/messages/r1", message_pages(3))
+    registry = MetricsRegistry()
+    client = make_client(metrics=registry)
+
+    client.get_messages("r1")
+
+    phases = set(re.findall(r'phase="(\w+)"', registry.render()))
+    assert phases == {"network", "decode", "build"}
+
+    registry.reset()
+    assert "phase=" not in registry.render()
@@ -0,0 +1,144 @@
+import json
+
+import pytest
+
+from NEZUNECT.config import Config
+from NEZUNECT.pool import ErrorBudget, NEZUNECTPool
+from NEZUNECT.utils import APIError, Hooks, RateLimiter, RetryPolicy
+
+from .conftest import make_profile, message_pages
+
+MESSAGES = "/messages/r1"
+
+
+@pytest.fixture
+def make_pool(tmp_path, server):
+    pools = []
+
+    def factory(accounts=2, **options):
+        cookies = []
+        for index in range(accounts):
+            path = tmp_path / f"account_{index}.json"
+            path.write_text(json.dumps({"session": f"account_{index}"}))
+            cookies.append(str(path))
+        pool = NEZUNECTPool(cookies, **options)
+        for account in pool.accounts:
+            account.client.session.mount(Config.BASE_URL, server)
+        pools.append(pool)
+        return pool
+
+    yield factory
+    for pool in pools:
+        pool.close()
+
+
+def test_iterators_hold_the_account_until_exhausted(make_pool, server):
+    server.route("GET", MESSAGES, message_pages(30))
+    pool = make_pool(accounts=1)
+    (account,) = pool.accounts
+
+    messages = pool.iter_messages("r1")
+    assert next(messages).message_id == "message_29"
+    assert account.in_flight == 1
+
+    assert len(list(messages)) == 29
+    assert account.in_flight == 0
+
+
+def test_closing_an_iterator_releases_the_account(make_pool, server):
+    server.route("GET", MESSAGES, message_pages(30))
+    pool = make_pool(accounts=1)
+
+    messages = pool.iter_messages("r1")
+    next(messages)
+    messages.close()
+
+    assert pool.accounts[0].in_flight == 0
+
+
+def test_errors_while_iterating_count_against_the_budget(make_pool, server):
+    server.route("GET", MESSAGES, lambda request, query: (503, {}, {}))
+    pool = make_pool(
+        accounts=1,
+        error_budget=ErrorBudget(max_errors=1),
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+    (account,) = pool.accounts
+
+    with pytest.raises(APIError):
+        list(pool.iter_messages("r1"))
+
+    assert account.in_flight == 0
+    assert account.stats.errors == 1
+    assert account.bench_reason == "error_budget"
+
+
+def test_pool_provided_options_are_rejected(make_pool):
+    with pytest.raises(ValueError, match="rate_limiter"):
+        make_pool(rate_limiter=RateLimiter())
+
+
+def test_long_lived_helpers_are_not_routed(make_pool):
+    pool = make_pool()
+
+    with pytest.raises(AttributeError, match="lease"):
+        pool.watch_notifications
+    with pytest.raises(AttributeError, match="lease"):
+        pool.for_key("r1").message_sync
+
+
+def test_unauthorized_batch_items_bench_the_account(make_pool, server):
+    server.route(
+        "GET", "/users/profiles/user_0", lambda request, query: make_profile(0)
+    )
+    server.route("GET", "/users/profiles/user_1", lambda request, query: (401, {}, {}))
+    pool = make_pool(accounts=1)
+    (account,) = pool.accounts
+
+    results = list(pool.get_profiles(["user_0", "user_1"]))
+
+    assert sorted(result.ok for result in results) == [False, True]
+    assert account.stats.unauthorized == 1
+    assert account.bench_reason == "unauthorized"
+    with pytest.raises(APIError):
+        pool.acquire()
+
+
+def test_errors_raised_by_the_call_are_counted_once(make_pool, server):
+    server.route("GET", MESSAGES, lambda request, query: (503, {}, {}))
+    pool = make_pool(accounts=1, retry_policy=RetryPolicy(max_attempts=1))
+    (account,) = pool.accounts
+
+    with pytest.raises(APIError):
+        pool.get_messages("r1")
+
+    assert account.stats.errors == 1
+    assert account.in_flight == 0
+
+
+def test_user_hooks_are_kept_per_account(make_pool, server):
+    server.route("GET", MESSAGES, lambda request, query: (503, {}, {}))
+    hooks = Hooks()
+    hooks.on_error(lambda context: {"messages": []})
+    pool = make_pool(accounts=2, hooks=hooks, retry_policy=RetryPolicy(max_attempts=1))
+
+    assert pool.get_messages("r1")["data"] == []
+    assert [account.stats.errors for account in pool.accounts] == [1, 0]
+
+
+def test_cookie_files_are_checked_outside_the_pool_lock(make_pool, monkeypatch):
+    pool = make_pool(accounts=2)
+    benched = pool.accounts[0]
+    pool.record_error(benched, APIError("unauthorized", 401))
+    store = benched.client.cookie_store
+    refresh = store.refresh
+    locked = []
+
+    def checked_refresh(*args, **kwargs):
+        locked.append(pool._lock.locked())
+        return refresh(*args, **kwargs)
+
+    monkeypatch.setattr(store, "refresh", checked_refresh)
+
+    assert pool.acquire() is pool.accounts[1]
+    assert locked == [False]
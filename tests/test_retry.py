@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+from NEZUNECT.api import base
+from NEZUNECT.utils import APIError, RetryPolicy
+from NEZUNECT.utils.retry import parse_retry_after
+
+from .conftest import make_profile
+
+PROFILE = "/users/profiles/user_1"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """再試行の待機を記録し、実際には待たない"""
+    delays = []
+    monkeypatch.setattr(base.time, "sleep", delays.append)
+    return delays
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    future = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25 < parse_retry_after(format_datetime(future, usegmt=True)) <= 30
+    past = datetime.now(timezone.utc) - timedelta(seconds=30)
+    assert parse_retry_after(format_datetime(past, usegmt=True)) == 0.0
+
+
+def test_next_delay_rules():
+    policy = RetryPolicy(max_attempts=3, base_delay=0.5, max_delay=10)
+    retry = dict(previous_delay=0.0, elapsed=0.0, idempotent=True)
+
+    assert 0.5 <= policy.next_delay(attempt=1, status_code=503, **retry) <= 10
+    assert policy.next_delay(attempt=3, status_code=503, **retry) is None
+    assert policy.next_delay(attempt=1, status_code=404, **retry) is None
+    assert policy.next_delay(attempt=1, status_code=429, retry_after=8, **retry) >= 8
+
+    write = dict(previous_delay=0.0, elapsed=0.0, idempotent=False)
+    assert policy.next_delay(attempt=1, status_code=503, **write) is None
+    assert policy.next_delay(attempt=1, status_code=429, **write) is not None
+    assert policy.next_delay(attempt=1, sent=False, **write) is not None
+
+    limited = RetryPolicy(base_delay=5, total_timeout=6)
+    assert (
+        limited.next_delay(attempt=1, previous_delay=0, elapsed=2, idempotent=True)
+        is None
+    )
+
+
+def test_retries_server_errors_then_succeeds(make_client, server, sleeps):
+    server.route(
+        "GET", PROFILE, [(503, {}, {}), (502, {}, {}), (200, make_profile(1), {})]
+    )
+    client = make_client(retry_policy=RetryPolicy(max_attempts=3, base_delay=0.01))
+
+    assert client.get_profile("user_1")["data"].username == "user_1"
+    assert server.calls("GET", PROFILE) == 3
+    assert len(sleeps) == 2
+
+
+def test_waits_for_retry_after(make_client, server, sleeps):
+    server.route(
+        "GET",
+        PROFILE,
+        [(429, {}, {"Retry-After": "7"}), (200, make_profile(1), {})],
+    )
+    client = make_client(retry_policy=RetryPolicy(base_delay=0.01))
+
+    client.get_profile("user_1")
+
+    assert sleeps and sleeps[0] >= 7
+
+
+def test_gives_up_after_max_attempts(make_client, server, sleeps):
+    server.route("GET", PROFILE, [(503, {}, {})] * 5)
+    client = make_client(retry_policy=RetryPolicy(max_attempts=2, base_delay=0.01))
+
+    with pytest.raises(APIError) as error:
+        client.get_profile("user_1")
+
+    assert error.value.status_code == 503
+    assert server.calls("GET", PROFILE) == 2
+
+
+def test_write_is_not_retried_after_server_error(make_client, server, sleeps):
+    server.route("POST", "/posts/p1/like", [(500, {}, {}), (200, {}, {})])
+    client = make_client(retry_policy=RetryPolicy(base_delay=0.01))
+
+    with pytest.raises(APIError):
+        client.like_post("p1")
+
+    assert server.calls("POST", "/posts/p1/like") == 1
+    assert sleeps == []
+
+
+def test_idempotency_key_makes_write_retryable(make_client, server, sleeps):
+    server.route("POST", "/posts/p1/like", [(500, {}, {}), (200, {}, {})])
+    client = make_client(retry_policy=RetryPolicy(base_delay=0.01))
+
+    client.profile_api._make_request(
+        "POST", "/posts/p1/like", idempotency_key="like-p1"
+    )
+
+    assert server.calls("POST", "/posts/p1/like") == 2
+    assert server.requests[-1].headers["Idempotency-Key"] == "like-p1"
+
+
+def test_connection_errors_are_retried(make_client, server, sleeps):
+    server.route(
+        "GET",
+        PROFILE,
+        [requests.exceptions.ConnectionError("reset"), (200, make_profile(1), {})],
+    )
+    client = make_client(retry_policy=RetryPolicy(base_delay=0.01))
+
+    assert client.get_profile("user_1")["data"].username == "user_1"
+    assert len(sleeps) == 1
@@ -0,0 +1,58 @@
+import pickle
+from datetime import datetime, timezone
+
+from NEZUNECT.api.notify import FrozenNotification, Notification
+from NEZUNECT.utils.models import freeze
+from NEZUNECT.utils.timestamps import _parse, parse_timestamp, raw_timestamp
+
+RAW = "2024-05-01T12:00:00.000Z"
+PARSED = datetime(2024, 5, 1, 12, tzinfo=timezone.utc)
+
+
+def make(created_at):
+    return Notification(
+        notification_id="n1",
+        type="like",
+        text="",
+        created_at=created_at,
+        read=False,
+        profile={},
+    )
+
+
+def test_parse_timestamp():
+    assert parse_timestamp(RAW) == PARSED
+    assert parse_timestamp("2024-05-01T21:00:00+09:00") == PARSED
+    assert parse_timestamp("") is None
+    assert parse_timestamp(None) is None
+
+    _parse.cache_clear()
+    parse_timestamp(RAW)
+    parse_timestamp(RAW)
+    assert _parse.cache_info().hits == 1
+
+
+def test_created_at_is_parsed_lazily():
+    notification = Notification.from_dict({"createdAt": RAW})
+
+    assert notification._created_at is None
+    assert notification.created_at == PARSED
+    assert notification._created_at == PARSED
+    assert raw_timestamp(notification) == RAW
+    assert Notification.from_dict({}).created_at is None
+
+
+def test_created_at_keyword_accepts_string_and_datetime():
+    assert make(RAW).created_at == PARSED
+    assert make(PARSED).created_at == PARSED
+    assert make(RAW) == make(PARSED)
+    assert "created_at=datetime.datetime(2024, 5, 1, 12, 0" in repr(make(RAW))
+
+
+def test_frozen_and_pickled_models_keep_created_at():
+    frozen = freeze(make(RAW))
+
+    assert isinstance(frozen, FrozenNotification)
+    assert frozen.created_at == PARSED
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert pickle.loads(pickle.dumps(make(RAW))).created_at == PARSED
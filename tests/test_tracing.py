@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from NEZUNECT.utils import CookieStore, InMemorySpanExporter, Tracer
+from NEZUNECT.utils.batch import run_batch
+from NEZUNECT.utils.tracing import current_span
+
+from .conftest import make_profile, message_pages
+
+
+def profile_routes(server, count):
+    for index in range(count):
+        server.route(
+            "GET",
+            f"/users/profiles/user_{index}",
+            lambda request, query, index=index: make_profile(index),
+        )
+
+
+def by_name(spans, name):
+    return [span for span in spans if span.name == name]
+
+
+def test_request_span_is_child_of_method_span(make_client, server):
+    profile_routes(server, 1)
+    exporter = InMemorySpanExporter()
+    client = make_client(tracer=Tracer(exporter))
+
+    client.get_profile("user_0")
+
+    request, method = exporter.get_finished_spans()
+    assert method.name == "ProfileAPI.get_profile"
+    assert request.parent_id == method.span_id
+    assert request.attributes["http.route"] == "/users/profiles/{username}"
+    assert request.attributes["http.response.status_code"] == 200
+
+
+def test_run_batch_workers_inherit_the_current_span():
+    tracer = Tracer(InMemorySpanExporter())
+
+    with tracer.span("batch") as parent:
+        results = list(run_batch(lambda item: current_span(), range(4)))
+
+    assert all(result.value is parent for result in results)
+
+
+def test_generator_results_keep_the_span_open(make_client, server):
+    profile_routes(server, 3)
+    exporter = InMemorySpanExporter()
+    client = make_client(tracer=Tracer(exporter))
+
+    results = client.get_profiles([f"user_{index}" for index in range(3)])
+    assert exporter.get_finished_spans() == []
+    assert current_span() is None
+    assert all(result.ok for result in results)
+
+    spans = exporter.get_finished_spans()
+    (parent,) = by_name(spans, "ProfileAPI.get_profiles")
+    children = by_name(spans, "ProfileAPI.get_profile")
+    assert len(children) == 3
+    assert {span.parent_id for span in children} == {parent.span_id}
+    assert {span.trace_id for span in spans} == {parent.trace_id}
+    assert parent.end_time >= max(span.end_time for span in children)
+
+
+def test_bulk_writes_are_traced_as_one_trace(make_client, server):
+    for post_id in ("p1", "p2"):
+        server.route("POST", f"/posts/{post_id}/like", lambda request, query: {})
+    exporter = InMemorySpanExporter()
+    client = make_client(tracer=Tracer(exporter))
+
+    client.like_posts(["p1", "p2"])
+
+    spans = exporter.get_finished_spans()
+    (parent,) = by_name(spans, "PostsAPI.like_posts")
+    assert len(spans) == 5
+    assert {span.trace_id for span in spans} == {parent.trace_id}
+    assert all(
+        span.parent_id == parent.span_id
+        for span in by_name(spans, "PostsAPI.like_post")
+    )
+
+
+def test_closing_a_generator_result_ends_the_span(make_client, server):
+    profile_routes(server, 3)
+    exporter = InMemorySpanExporter()
+    client = make_client(tracer=Tracer(exporter))
+
+    results = client.get_profiles(
+        [f"user_{index}" for index in range(3)], max_concurrency=1, ordered=True
+    )
+    next(results)
+    results.close()
+
+    (parent,) = by_name(exporter.get_finished_spans(), "ProfileAPI.get_profiles")
+    assert parent.status == "ok"
+
+
+def test_prefetched_pages_inherit_the_current_span(make_client, server):
+    server.route("GET", "/messages/r1", message_pages(50))
+    exporter = InMemorySpanExporter()
+    tracer = Tracer(exporter)
+    client = make_client(tracer=tracer)
+
+    with tracer.span("export") as parent:
+        assert len(list(client.iter_messages("r1", prefetch=True))) == 50
+
+    pages = by_name(exporter.get_finished_spans(), "MessagesAPI.get_messages")
+    assert len(pages) == 3
+    assert {span.parent_id for span in pages} == {parent.span_id}
+
+
+def test_async_generator_results_keep_the_span_open(cookie):
+    httpx = pytest.importorskip("httpx")
+    from NEZUNECT.aio.profile import AsyncProfileAPI
+
+    def handler(request):
+        username = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json=make_profile(int(username[5:])))
+
+    async def main(exporter):
+        session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        api = AsyncProfileAPI(session, CookieStore.get(cookie), tracer=Tracer(exporter))
+        try:
+            results = api.get_profiles([f"user_{index}" for index in range(3)])
+            assert exporter.get_finished_spans() == []
+            return [result async for result in results]
+        finally:
+            await session.aclose()
+
+    exporter = InMemorySpanExporter()
+    results = asyncio.run(main(exporter))
+
+    assert all(result.ok for result in results)
+    spans = exporter.get_finished_spans()
+    (parent,) = by_name(spans, "AsyncProfileAPI.get_profiles")
+    children = by_name(spans, "AsyncProfileAPI.get_profile")
+    assert len(children) == 3
+    assert {span.parent_id for span in children} == {parent.span_id}
+    assert all(span.parent_id is not None for span in spans if span is not parent)
@@ -0,0 +1,141 @@
+import logging
+from datetime import datetime, timezone
+
+from NEZUNECT.api.watcher import NotificationWatcher
+
+from .conftest import PAGE_SIZE, make_profile
+
+NOTIFICATIONS = "/notifications"
+
+
+def make_notification(index: int) -> dict:
+    return {
+        "notificationId": f"notification_{index}",
+        "type": "like",
+        "text": f"notification {index}",
+        "createdAt": f"2024-05-01T12:{index // 60:02d}:{index % 60:02d}.000Z",
+        "read": False,
+        "profile": make_profile(0),
+    }
+
+
+def notification_pages(total: int):
+    """新しい順に total 件の通知を PAGE_SIZE 件ずつ返すハンドラー"""
+
+    def handler(request, query):
+        skip = int(query.get("skip", ["0"])[0])
+        indexes = range(total - 1 - skip, max(total - 1 - skip - PAGE_SIZE, -1), -1)
+        return {"notifications": [make_notification(index) for index in indexes]}
+
+    return handler
+
+
+def test_poll_stops_at_watermark(make_client, server):
+    server.route("GET", NOTIFICATIONS, notification_pages(30))
+    client = make_client()
+    watermark = (datetime(2024, 5, 1, 12, 0, 24), "notification_24")
+    watcher = NotificationWatcher(client.notify_api, watermark=watermark)
+
+    new = watcher.poll()
+
+    assert [item.notification_id for item in new] == [
+        f"notification_{index}" for index in range(25, 30)
+    ]
+    assert server.calls("GET", NOTIFICATIONS) == 1
+    assert watcher.stats.truncated == 0
+
+
+def test_poll_warns_when_page_limit_is_reached(make_client, server, caplog):
+    server.route("GET", NOTIFICATIONS, notification_pages(100))
+    client = make_client()
+    watermark = (datetime(2024, 5, 1, 12, 0, 0), "notification_0")
+    watcher = NotificationWatcher(client.notify_api, watermark=watermark, max_pages=2)
+
+    with caplog.at_level(logging.WARNING, logger="NEZUNECT.api.watcher"):
+        new = watcher.poll()
+
+    assert len(new) == 2 * PAGE_SIZE
+    assert watcher.stats.truncated == 1
+    assert "2 ページ" in caplog.text
+
+
+def test_unexpected_errors_do_not_stop_polling(make_client, server):
+    handler = notification_pages(3)
+    replies = iter([ValueError("bad createdAt")])
+
+    def flaky(request, query):
+        error = next(replies, None)
+        if error is not None:
+            raise error
+        return handler(request, query)
+
+    server.route("GET", NOTIFICATIONS, flaky)
+    client = make_client()
+    watcher = NotificationWatcher(
+        client.notify_api, min_interval=0.01, max_interval=0.01, deliver_existing=True
+    )
+    delivered = []
+    watcher.on_notification(delivered.append)
+
+    with watcher:
+        for _ in range(200):
+            if len(delivered) == 3:
+                break
+            watcher._stop.wait(0.01)
+
+    assert watcher.stats.poll_errors == 1
+    assert len(delivered) == 3
+
+
+def test_naive_timestamps_compare_against_an_aware_watermark(make_client, server):
+    def handler(request, query):
+        items = [make_notification(index) for index in range(29, 19, -1)]
+        for item in items:
+            item["createdAt"] = item["createdAt"].rstrip("Z")
+        return {"notifications": items}
+
+    server.route("GET", NOTIFICATIONS, handler)
+    client = make_client()
+    watermark = (datetime(2024, 5, 1, 12, 0, 24, tzinfo=timezone.utc), "x")
+    watcher = NotificationWatcher(client.notify_api, watermark=watermark)
+
+    new = watcher.poll()
+
+    assert [item.notification_id for item in new] == [
+        f"notification_{index}" for index in range(24, 30)
+    ]
+    assert watcher.watermark[0].tzinfo is not None
+
+
+def test_seed_poll_does_not_back_off(make_client, server):
+    server.route("GET", NOTIFICATIONS, notification_pages(0))
+    client = make_client()
+    watcher = NotificationWatcher(client.notify_api, min_interval=1.0, backoff=2.0)
+    intervals = []
+
+    def wait(timeout):
+        intervals.append(timeout)
+        watcher._stop.set()
+        return True
+
+    watcher._stop.wait = wait
+    watcher._run()
+    watcher._stop.clear()
+    watcher._run()
+
+    assert intervals == [1.0, 2.0]
+
+
+def test_first_notification_after_an_empty_seed_is_delivered(make_client, server):
+    total = [0]
+    server.route(
+        "GET",
+        NOTIFICATIONS,
+        lambda request, query: notification_pages(total[0])(request, query),
+    )
+    client = make_client()
+    watcher = NotificationWatcher(client.notify_api)
+
+    assert watcher.poll() == []
+    total[0] = 1
+    assert [item.notification_id for item in watcher.poll()] == ["notification_0"]